@@ -1,14 +1,31 @@
 __all__ = [
+    "RPGFileError",
+    "estimate_noise",
+    "read_housekeeping",
+    "read_housekeeping_multi",
+    "read_rpg",
+    "read_rpg_multi",
     "rpg2nc",
+    "rpg2nc_daily",
     "rpg2nc_multi",
-    "spectra2nc",
+    "salvage_rpg",
     "spectra2moments",
-    "read_rpg",
-    "RPGFileError",
+    "spectra2nc",
+    "spectra2peak_moments",
+    "subset_rpg",
+    "validate_rpg",
 ]
 
-from rpgpy.data import read_rpg
+from rpgpy.data import (
+    read_housekeeping,
+    read_housekeeping_multi,
+    read_rpg,
+    read_rpg_multi,
+    salvage_rpg,
+    validate_rpg,
+)
 from rpgpy.utils import RPGFileError
 
-from .nc import rpg2nc, rpg2nc_multi, spectra2nc
-from .spcutil import spectra2moments
+from .nc import rpg2nc, rpg2nc_daily, rpg2nc_multi, spectra2nc
+from .spcutil import estimate_noise, spectra2moments, spectra2peak_moments
+from .subset import subset_rpg
@@ -0,0 +1,156 @@
+"""Module for reading and converting RPG binary files with asyncio."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from rpgpy import data as rpg_data
+from rpgpy import header as head
+from rpgpy import read_rpg
+from rpgpy.nc import _convert_files
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+    from os import PathLike
+
+
+async def read_rpg_async(
+    file_name: PathLike | str,
+    *,
+    rpg_names: bool = True,
+    **kwargs,
+) -> tuple[dict, dict]:
+    """Reads RPG Level 1 / Level 0 binary file in a worker thread.
+
+    The decoder releases the GIL while parsing the records, so the event loop
+    stays responsive while the file is decoded.
+
+    Args:
+    ----
+        file_name: File name.
+        rpg_names: If True, uses RPG naming scheme for the returned data dict.
+            Otherwise, uses custom names. Default is True.
+        **kwargs: Other arguments of `read_rpg`, e.g., `time_step`.
+
+    Returns:
+    -------
+        2-element tuple containing header (dict) and data (dict).
+
+    Examples:
+    --------
+        >>> from rpgpy.aio import read_rpg_async
+        >>> header, data = await read_rpg_async('rpg-data.LV0')
+
+    """
+    return await asyncio.to_thread(read_rpg, file_name, rpg_names, **kwargs)
+
+
+async def rpg2nc_async(
+    path_to_files: PathLike | str,
+    output_file: PathLike | str,
+    global_attr: dict | None = None,
+    *,
+    overview_levels: int = 0,
+    spectra_layout: str = "padded",
+    memory_budget: int | None = None,
+    merge: bool = False,
+) -> None:
+    """Converts RPG binary files into a netCDF4 file in a worker thread.
+
+    Each file is read and written in its own call to the worker thread. If the
+    task is cancelled, the file being processed is finished and the conversion
+    stops before the next file, leaving an incomplete output file.
+
+    Args:
+    ----
+        path_to_files: Directory containing RPG binary file(s) and optionally
+            a wildcard to distinguish between different types of files.
+            E.g. '/path/to/data/*.LV0'
+        output_file: Name of the output file.
+        global_attr: Additional global attributes.
+        overview_levels: Number of overview files, see `rpg2nc`. Default is 0.
+        spectra_layout: Layout of the Level 0 spectra, see `rpg2nc`. Default is
+            'padded'.
+        memory_budget: Maximum estimated peak memory in bytes, see `rpg2nc`.
+            Default is None, i.e., no limit.
+        merge: If True, the files are merged by time, see `rpg2nc`. Default is
+            False.
+
+    Examples:
+    --------
+        >>> from rpgpy.aio import rpg2nc_async
+        >>> await rpg2nc_async('/path/to/files/*.LV0', 'huge-file.nc')
+
+    """
+    steps = _convert_files(
+        path_to_files,
+        output_file,
+        global_attr,
+        progress=False,
+        overview_levels=overview_levels,
+        spectra_layout=spectra_layout,
+        memory_budget=memory_budget,
+        merge=merge,
+    )
+    try:
+        while await _run_uninterrupted(next, steps, None) is not None:
+            pass
+    finally:
+        steps.close()
+
+
+async def iter_rpg_async(
+    file_name: PathLike | str,
+    samples_per_chunk: int = 1024,
+) -> AsyncIterator[tuple[dict, dict]]:
+    """Reads RPG Level 1 / Level 0 binary file in chunks of samples.
+
+    Each chunk is decoded in a worker thread, and cancellation takes effect
+    between the chunks.
+
+    Args:
+    ----
+        file_name: File name.
+        samples_per_chunk: Maximum number of samples in a chunk. Default is 1024.
+
+    Yields:
+    ------
+        2-element tuple containing header (dict) and data (dict) of the chunk, using
+        the RPG naming scheme.
+
+    Raises:
+    ------
+        ValueError: Invalid `samples_per_chunk`.
+
+    Examples:
+    --------
+        >>> from rpgpy.aio import iter_rpg_async
+        >>> async for header, data in iter_rpg_async('rpg-data.LV0'):
+                print(data['Time'])
+
+    """
+    if samples_per_chunk < 1:
+        msg = "samples_per_chunk must be positive"
+        raise ValueError(msg)
+    header, _ = await asyncio.to_thread(head.read_rpg_header, file_name)
+    index = await asyncio.to_thread(head.read_record_index, file_name, header)
+    for ind in range(0, len(index.offset), samples_per_chunk):
+        offsets = index.offset[ind : ind + samples_per_chunk]
+        data = await _run_uninterrupted(
+            rpg_data.read_records,
+            file_name,
+            header,
+            offsets,
+        )
+        yield header, data
+
+
+async def _run_uninterrupted(func: Callable, *args):
+    """Runs function in a worker thread and waits for it even if cancelled."""
+    task = asyncio.ensure_future(asyncio.to_thread(func, *args))
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        await task
+        raise
@@ -0,0 +1,197 @@
+"""Module for reading compressed and archived RPG binary files."""
+
+from __future__ import annotations
+
+import fnmatch
+import glob
+import gzip
+import lzma
+import os
+import re
+import tarfile
+from contextlib import AbstractContextManager, ExitStack, contextmanager, nullcontext
+from typing import IO, TYPE_CHECKING, NamedTuple
+
+try:
+    from compression import zstd  # type: ignore[import-not-found]
+except ImportError:
+    zstd = None
+try:
+    import zstandard  # type: ignore[import-not-found]
+except ImportError:
+    zstandard = None
+
+if TYPE_CHECKING:
+    import io
+    from collections.abc import Iterator
+    from os import PathLike
+
+COMPRESSED_SUFFIXES = (".gz", ".xz", ".zst")
+
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.xz", ".txz", ".tar.bz2")
+
+_MEMBER_PATTERN = re.compile(
+    r"^(.*?(?:" + "|".join(re.escape(suffix) for suffix in TAR_SUFFIXES) + r"))/(.+)$",
+    re.IGNORECASE,
+)
+
+
+class ArchiveMember(NamedTuple):
+    """RPG binary file in a tar archive.
+
+    Attributes:
+        archive: Path of the tar archive.
+        name: Name of the member in the archive.
+    """
+
+    archive: str
+    name: str
+
+    def __str__(self) -> str:
+        return f"{self.archive}/{self.name}"
+
+
+def is_compressed(file_name: PathLike | str) -> bool:
+    """Checks if the file is compressed by its suffix."""
+    return os.fspath(file_name).lower().endswith(COMPRESSED_SUFFIXES)
+
+
+def is_streamed(file_name: object) -> bool:
+    """Checks if the file is decompressed or read from an archive while decoding."""
+    return isinstance(file_name, ArchiveMember) or (
+        isinstance(file_name, (str, os.PathLike)) and is_compressed(file_name)
+    )
+
+
+def is_tar(file_name: PathLike | str) -> bool:
+    """Checks if the file is a tar archive by its suffix."""
+    return os.fspath(file_name).lower().endswith(TAR_SUFFIXES)
+
+
+def get_extension(file_name: PathLike | str | ArchiveMember) -> str:
+    """Returns lowercase extension, e.g. '.lv0', ignoring a compression suffix."""
+    name = file_name.name if isinstance(file_name, ArchiveMember) else file_name
+    root, ext = os.path.splitext(os.fspath(name).lower())
+    if ext in COMPRESSED_SUFFIXES:
+        root, ext = os.path.splitext(root)
+    return ext
+
+
+def get_path(file_name: PathLike | str | ArchiveMember) -> str:
+    """Returns path of the file on disk, i.e., the archive of a member."""
+    if isinstance(file_name, ArchiveMember):
+        return file_name.archive
+    return os.fspath(file_name)
+
+
+def glob_files(pattern: PathLike | str) -> list[str | ArchiveMember]:
+    """Finds files matching the pattern, including members of tar archives.
+
+    Tar archives matching the pattern are replaced by their RPG binary files.
+    A pattern continuing after a tar archive, e.g. '/path/*.tar/*.LV1', matches
+    the members of the archives.
+
+    Args:
+    ----
+        pattern: Path with optional shell-style wildcards.
+
+    Returns:
+    -------
+        Sorted list of file names and archive members.
+
+    """
+    pattern = str(pattern)
+    files: list[str | ArchiveMember] = []
+    for path in sorted(glob.glob(pattern)):
+        files.extend(list_members(path) if is_tar(path) else [path])
+    match = _MEMBER_PATTERN.match(pattern)
+    if match is not None:
+        archive_pattern, member_pattern = match.groups()
+        for path in sorted(glob.glob(archive_pattern)):
+            files.extend(list_members(path, member_pattern))
+    return files
+
+
+def list_members(
+    archive: PathLike | str, pattern: str | None = None
+) -> list[ArchiveMember]:
+    """Lists RPG binary files in tar archive.
+
+    Args:
+    ----
+        archive: Path of the tar archive.
+        pattern: Shell-style pattern of the member names. Default is None, i.e.,
+            all files with RPG Level 0 or Level 1 extension.
+
+    Returns:
+    -------
+        Members sorted by name.
+
+    """
+    archive = os.fspath(archive)
+    with tarfile.open(archive) as tar:
+        names = [member.name for member in tar.getmembers() if member.isfile()]
+    if pattern is not None:
+        names = fnmatch.filter(names, pattern)
+    else:
+        names = [name for name in names if get_extension(name) in (".lv0", ".lv1")]
+    return [ArchiveMember(archive, name) for name in sorted(names)]
+
+
+@contextmanager
+def open_file(
+    file_name: PathLike | str | ArchiveMember,
+) -> Iterator[IO[bytes] | io.BufferedIOBase]:
+    """Opens compressed file or archive member for reading decompressed data.
+
+    Nothing is written to disk. The member of a tar archive is found by reading
+    the archive only up to the member.
+
+    Args:
+    ----
+        file_name: Compressed file, e.g. 'rpg-data.LV0.gz', or archive member,
+            which is decompressed if its name has a compression suffix.
+
+    Yields:
+    ------
+        Binary file-like object decompressing the data while it is read.
+
+    """
+    with ExitStack() as stack:
+        if isinstance(file_name, ArchiveMember):
+            tar = stack.enter_context(tarfile.open(file_name.archive))
+            member = next((m for m in tar if m.name == file_name.name), None)
+            file = tar.extractfile(member) if member is not None else None
+            if file is None:
+                msg = f"{file_name} is not a file"
+                raise FileNotFoundError(msg)
+            name = file_name.name
+        else:
+            file = stack.enter_context(open(file_name, "rb"))
+            name = os.fspath(file_name)
+        yield stack.enter_context(_decompress(file, name))
+
+
+def _decompress(
+    file: IO[bytes], name: str
+) -> IO[bytes] | io.BufferedIOBase | AbstractContextManager:
+    suffix = os.path.splitext(name)[1].lower()
+    if suffix == ".gz":
+        return gzip.GzipFile(fileobj=file)
+    if suffix == ".xz":
+        return lzma.LZMAFile(file)
+    if suffix == ".zst":
+        return _open_zstd(file)
+    return nullcontext(file)
+
+
+def _open_zstd(file: IO[bytes]) -> io.BufferedIOBase:
+    if zstd is not None:
+        return zstd.ZstdFile(file)
+    if zstandard is None:
+        msg = (
+            "Reading .zst files requires Python 3.14 or the zstandard package: "
+            "python3 -m pip install rpgpy[zstd]"
+        )
+        raise ModuleNotFoundError(msg)
+    return zstandard.ZstdDecompressor().stream_reader(file)
@@ -0,0 +1,157 @@
+"""Module for caching decoded RPG binary files on disk."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from rpgpy import data as rpg_data
+from rpgpy import instrumentation
+from rpgpy.version import __version__
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+_HEADER_FILE = "header.pkl"
+
+
+class Cache:
+    """On-disk cache of decoded RPG binary files.
+
+    Decoded arrays are stored as `.npy` files, one directory per input file. The
+    entries are keyed by the path, size and modification time of the input file
+    and the rpgpy version, so that modified files are decoded again. When the
+    cache grows larger than `max_size`, the least recently used entries are
+    removed.
+
+    Args:
+    ----
+        directory: Directory of the cache. Created if it does not exist.
+        max_size: Maximum total size of the cache in bytes. Default is 10 GiB.
+
+    Raises:
+    ------
+        ValueError: Invalid `max_size`.
+
+    Examples:
+    --------
+        >>> from rpgpy.cache import Cache
+        >>> cache = Cache('/tmp/rpgpy-cache', max_size=50 * 1024**3)
+        >>> header, data = cache.read_rpg('rpg-data.LV0')
+
+    """
+
+    def __init__(self, directory: PathLike | str, max_size: int = 10 * 1024**3):
+        if max_size < 0:
+            msg = "max_size must be non-negative"
+            raise ValueError(msg)
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def read_rpg(
+        self,
+        file_name: PathLike | str,
+        *,
+        rpg_names: bool = True,
+    ) -> tuple[dict, dict]:
+        """Reads RPG Level 1 / Level 0 binary file using the cache.
+
+        On a cache hit, the arrays are memory-mapped read-only from the cache
+        instead of decoding the file. On a miss, the file is decoded with
+        `read_rpg` and stored in the cache.
+
+        Args:
+        ----
+            file_name: File name.
+            rpg_names: If True, uses RPG naming scheme for the returned data dict.
+                Otherwise, uses custom names. Default is True.
+
+        Returns:
+        -------
+            2-element tuple containing header (dict) and data (dict). The arrays
+            of data are read-only.
+
+        """
+        entry = self.directory / _get_key(file_name)
+        with instrumentation.track_file(file_name):
+            try:
+                with instrumentation.track_phase("cache"):
+                    header, data = _load_entry(entry)
+                os.utime(entry)
+            except FileNotFoundError:
+                header, data = rpg_data.read_rpg(file_name)
+                with instrumentation.track_phase("cache"):
+                    self._store(entry, header, data)
+                    self.evict()
+        if not rpg_names:
+            header, data = rpg_data._change_names(header, data)  # noqa: SLF001
+        return header, data
+
+    @property
+    def size(self) -> int:
+        """Total size of the cache entries in bytes."""
+        return sum(size for _, _, size in self._list_entries())
+
+    def evict(self) -> None:
+        """Removes the least recently used entries until the cache fits `max_size`."""
+        entries = sorted(self._list_entries(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if total <= self.max_size:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Removes all entries of the cache."""
+        for path, _, _ in self._list_entries():
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _store(self, entry: Path, header: dict, data: dict) -> None:
+        tmp_dir = Path(tempfile.mkdtemp(dir=self.directory, prefix=".tmp-"))
+        try:
+            for key, array in data.items():
+                np.save(tmp_dir / f"{key}.npy", array)
+            with (tmp_dir / _HEADER_FILE).open("wb") as file:
+                pickle.dump((header, list(data)), file)
+            tmp_dir.rename(entry)
+        except OSError:
+            if not (entry / _HEADER_FILE).exists():
+                raise
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _list_entries(self) -> list[tuple[Path, float, int]]:
+        entries = []
+        for path in self.directory.iterdir():
+            if path.name.startswith(".") or not path.is_dir():
+                continue
+            try:
+                files = list(path.iterdir())
+                size = sum(file.stat().st_size for file in files)
+                entries.append((path, path.stat().st_mtime, size))
+            except FileNotFoundError:
+                continue
+        return entries
+
+
+def _get_key(file_name: PathLike | str) -> str:
+    path = Path(file_name).resolve()
+    stat = path.stat()
+    key = f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\0{__version__}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _load_entry(entry: Path) -> tuple[dict, dict]:
+    with (entry / _HEADER_FILE).open("rb") as file:
+        header, keys = pickle.load(file)  # noqa: S301
+    data = {key: np.load(entry / f"{key}.npy", mmap_mode="r") for key in keys}
+    return header, data
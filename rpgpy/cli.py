@@ -0,0 +1,302 @@
+"""Command-line interface of rpgpy."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+from functools import partial
+from typing import TYPE_CHECKING
+
+from rpgpy import version
+from rpgpy.archive import is_compressed
+from rpgpy.manifest import Manifest, run_conversions
+from rpgpy.nc import _get_rpg_files, rpg2nc, rpg2nc_daily, rpg2nc_multi, spectra2nc
+from rpgpy.utils import RPGFileError
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+MANIFEST_NAME = "rpgpy-manifest.jsonl"
+
+
+def main(args: Sequence[str] | None = None) -> int:
+    """Runs the `rpgpy` command.
+
+    Args:
+    ----
+        args: Command-line arguments. Default is `sys.argv[1:]`.
+
+    Returns:
+    -------
+        Exit status.
+
+    """
+    parser = _get_parser()
+    options = parser.parse_args(args)
+    logging.basicConfig(
+        format="%(levelname)s: %(message)s",
+        level=logging.INFO if options.verbose else logging.WARNING,
+    )
+    try:
+        options.func(options)
+    except (RuntimeError, ValueError, OSError, RPGFileError) as err:
+        parser.exit(1, f"{parser.prog}: error: {err}\n")
+    return 0
+
+
+def _convert(options: argparse.Namespace) -> None:
+    os.makedirs(options.output, exist_ok=True)
+    new_files = rpg2nc_multi(
+        options.input,
+        options.output,
+        _parse_attributes(options.attr),
+        options.base_name,
+        include_lv0=not options.lv1_only,
+        recursive=not options.no_recursive,
+        jobs=options.jobs,
+        manifest=_get_manifest_file(options, options.output),
+        memory_budget=options.memory_budget,
+    )
+    _print_files(new_files)
+
+
+def _moments(options: argparse.Namespace) -> None:
+    os.makedirs(options.output, exist_ok=True)
+    global_attr = _parse_attributes(options.attr)
+    convert = partial(spectra2nc, memory_budget=options.memory_budget)
+    tasks = []
+    for input_file in options.input:
+        name = os.path.basename(input_file)
+        if is_compressed(name):
+            name = os.path.splitext(name)[0]
+        name = os.path.splitext(name)[0]
+        output_file = os.path.join(options.output, f"{name}_moments.nc")
+        args = (input_file, output_file, options.n_points_min, global_attr)
+        tasks.append((convert, args, [input_file], output_file))
+    manifest_file = _get_manifest_file(options, options.output)
+    manifest = Manifest(manifest_file) if manifest_file is not None else None
+    _print_files(run_conversions(tasks, manifest, options.jobs))
+
+
+def _concat(options: argparse.Namespace) -> None:
+    input_files, _ = _get_rpg_files(options.input)
+    output_dir = os.path.dirname(os.path.abspath(options.output))
+    manifest_file = _get_manifest_file(options, output_dir)
+    manifest = Manifest(manifest_file) if manifest_file is not None else None
+    convert = partial(
+        rpg2nc,
+        progress=False,
+        overview_levels=options.overview_levels,
+        spectra_layout=options.spectra_layout,
+        memory_budget=options.memory_budget,
+        merge=options.merge,
+    )
+    args = (options.input, options.output, _parse_attributes(options.attr))
+    tasks = [(convert, args, input_files, options.output)]
+    _print_files(run_conversions(tasks, manifest))
+
+
+def _daily(options: argparse.Namespace) -> None:
+    os.makedirs(options.output, exist_ok=True)
+    new_files = rpg2nc_daily(
+        options.input,
+        options.output,
+        _parse_attributes(options.attr),
+        options.base_name,
+        jobs=options.jobs,
+        manifest=_get_manifest_file(options, options.output),
+        spectra_layout=options.spectra_layout,
+        memory_budget=options.memory_budget,
+        merge=options.merge,
+    )
+    _print_files(new_files)
+
+
+def _get_manifest_file(options: argparse.Namespace, output_dir: str) -> str | None:
+    if options.no_manifest:
+        return None
+    if options.manifest is not None:
+        return options.manifest
+    return os.path.join(output_dir, MANIFEST_NAME)
+
+
+def _parse_attributes(attributes: list[str]) -> dict | None:
+    if not attributes:
+        return None
+    global_attr = {}
+    for attribute in attributes:
+        key, sep, value = attribute.partition("=")
+        if not sep or not key:
+            msg = f"Invalid attribute '{attribute}', expected KEY=VALUE"
+            raise ValueError(msg)
+        global_attr[key] = value
+    return global_attr
+
+
+def _print_files(files: list[str]) -> None:
+    for file in files:
+        sys.stdout.write(f"{file}\n")
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        msg = f"{value} is not a positive integer"
+        raise argparse.ArgumentTypeError(msg)
+    return number
+
+
+def _memory_size(value: str) -> int:
+    units = {"K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+    scale = units.get(value[-1:].upper(), 1)
+    try:
+        size = int(float(value[:-1] if scale > 1 else value) * scale)
+    except ValueError:
+        size = 0
+    if size < 1:
+        msg = f"{value} is not a positive size, e.g. 4G"
+        raise argparse.ArgumentTypeError(msg)
+    return size
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="rpgpy", description="Convert RPG cloud radar binary files to netCDF4."
+    )
+    parser.add_argument("--version", action="version", version=version.__version__)
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "-v", "--verbose", action="store_true", help="Log the progress."
+    )
+    common.add_argument(
+        "--attr",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Additional global attribute. Can be given several times.",
+    )
+    common.add_argument(
+        "--manifest",
+        help="Manifest of converted files, used for skipping up-to-date outputs. "
+        f"Default is '{MANIFEST_NAME}' in the output directory.",
+    )
+    common.add_argument(
+        "--no-manifest",
+        action="store_true",
+        help="Convert all files and do not record them.",
+    )
+    common.add_argument(
+        "--memory-budget",
+        type=_memory_size,
+        metavar="SIZE",
+        help="Maximum estimated memory of converting a file, e.g. 4G. Larger files "
+        "are processed in chunks of samples. Default is no limit.",
+    )
+    jobs = argparse.ArgumentParser(add_help=False)
+    jobs.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        help="Number of files converted in parallel. Default is 1.",
+    )
+    subparsers = parser.add_subparsers(required=True, metavar="command")
+
+    convert = subparsers.add_parser(
+        "convert",
+        parents=[common, jobs],
+        help="Convert RPG binary files individually into netCDF4 files.",
+    )
+    convert.add_argument("input", help="Directory searched for RPG binary files.")
+    convert.add_argument(
+        "-o", "--output", default=".", help="Output directory. Default is '.'."
+    )
+    convert.add_argument("--base-name", help="Prefix of the output file names.")
+    convert.add_argument(
+        "--lv1-only", action="store_true", help="Convert only Level 1 files."
+    )
+    convert.add_argument(
+        "--no-recursive", action="store_true", help="Do not search subdirectories."
+    )
+    convert.set_defaults(func=_convert)
+
+    moments = subparsers.add_parser(
+        "moments",
+        parents=[common, jobs],
+        help="Calculate moments from Level 0 files into netCDF4 files.",
+    )
+    moments.add_argument("input", nargs="+", help="RPG Level 0 files.")
+    moments.add_argument(
+        "-o", "--output", default=".", help="Output directory. Default is '.'."
+    )
+    moments.add_argument(
+        "--n-points-min",
+        type=_positive_int,
+        default=4,
+        help="Number of points in a valid spectral line. Default is 4.",
+    )
+    moments.set_defaults(func=_moments)
+
+    concat = subparsers.add_parser(
+        "concat",
+        parents=[common],
+        help="Concatenate RPG binary files into one netCDF4 file.",
+    )
+    concat.add_argument(
+        "input", help="Directory of RPG binary files, optionally with a wildcard."
+    )
+    concat.add_argument("output", help="Output file.")
+    concat.add_argument(
+        "--overview-levels",
+        type=int,
+        default=0,
+        help="Number of overview files with coarser time resolution. Default is 0.",
+    )
+    concat.add_argument(
+        "--spectra-layout",
+        choices=("padded", "chirp"),
+        default="padded",
+        help="Layout of Level 0 spectra, 'chirp' writes one variable per chirp. "
+        "Default is 'padded'.",
+    )
+    concat.add_argument(
+        "--merge",
+        action="store_true",
+        help="Order the files by their start time and merge overlapping files, "
+        "writing duplicate samples only once.",
+    )
+    concat.set_defaults(func=_concat)
+
+    daily = subparsers.add_parser(
+        "daily",
+        parents=[common, jobs],
+        help="Convert RPG binary files of several days into one netCDF4 file per day.",
+    )
+    daily.add_argument(
+        "input",
+        nargs="+",
+        help="RPG binary files of the same level, optionally with wildcards.",
+    )
+    daily.add_argument(
+        "-o", "--output", default=".", help="Output directory. Default is '.'."
+    )
+    daily.add_argument("--base-name", help="Prefix of the output file names.")
+    daily.add_argument(
+        "--spectra-layout",
+        choices=("padded", "chirp"),
+        default="padded",
+        help="Layout of Level 0 spectra, see 'concat'. Default is 'padded'.",
+    )
+    daily.add_argument(
+        "--merge",
+        action="store_true",
+        help="Merge overlapping files, see 'concat'.",
+    )
+    daily.set_defaults(func=_daily)
+    return parser
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,44 +1,768 @@
 """RPG cloud radar binary reader in Cython."""
+from libc.errno cimport errno
 from libc.stdio cimport *
 from libc.stdlib cimport free, malloc
+from libc.string cimport memcpy
 
+import contextvars
 import logging
 import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import BinaryIO
 
 import numpy as np
 
+from rpgpy import archive
 from rpgpy import header as head
-from rpgpy import utils
+from rpgpy import instrumentation, utils
 from rpgpy.metadata import METADATA
 
 from rpgpy.utils import RPGFileError
 
+_HOUSEKEEPING_KEYS = ('RR', 'RelHum', 'EnvTemp', 'BaroP', 'WS', 'WD', 'DDVolt', 'DDTb',
+                      'LWP', 'PowIF', 'Elev', 'Azi', 'Status', 'TransPow', 'TransT',
+                      'RecT', 'PCT')
 
-def read_rpg(file_name: os.PathLike | str, rpg_names: bool = True) -> tuple[dict, dict]:
+_L0_SPECTRAL_KEYS = ('TotSpec', 'HSpec', 'ReVHSpec', 'ImVHSpec', 'RefRat', 'CorrCoeff',
+                     'DiffPh', 'SLDR', 'SCorrCoeff')
+
+_L1_KEYS = ('Ze', 'MeanVel', 'SpecWidth', 'Skewn', 'Kurt', 'RefRat', 'CorrCoeff',
+            'DiffPh', 'SLDR', 'SCorrCoeff', 'KDP', 'DiffAtt')
+
+# maximum size in bytes of the records decoded at a time when averaging; the
+# records of the largest time bin are always decoded at once
+_AVERAGING_BUDGET = 64 * 1024 ** 2
+
+# maximum number of records decoded at a time into padded spectra before
+# moving them into the per-chirp arrays
+_CHIRP_CHUNK = 256
+
+# size of the blocks read at a time from decompressing file-like objects
+_WINDOW_SIZE = 2 ** 20
+
+_SPECTRA_LAYOUTS = ('padded', 'chirp')
+
+_VALIDATION_MODES = ('strict', 'warn', 'off')
+
+# codes of invalid block indices found by the LV0 decoder
+cdef enum:
+    _NEGATIVE_INDEX = 1
+    _REVERSED_INDICES = 2
+    _INDEX_BEYOND_SPECTRUM = 3
+
+_BLOCK_ERRORS = {
+    _NEGATIVE_INDEX: 'negative min_ind or max_ind',
+    _REVERSED_INDICES: 'min_ind > max_ind',
+    _INDEX_BEYOND_SPECTRUM: 'block beyond the Doppler spectrum',
+}
+
+
+def read_rpg(file_name: os.PathLike | str | bytes | BinaryIO,
+             rpg_names: bool = True, *, time_step: float | None = None,
+             spectra_layout: str = 'padded',
+             validation: str = 'strict') -> tuple[dict, dict]:
     """ Reads RPG Level 1 / Level 0 binary file.
 
     Args:
-        file_name: File name.
+        file_name: File name, or the contents of the file as a bytes-like object
+            or binary file-like object, see `rpgpy.header.get_source`.
         rpg_names: If True, uses RPG naming scheme for the returned data dict.
             Otherwise, uses custom names. Default is True.
+        time_step: If given, the data are averaged in time bins of this length
+            (in seconds) while decoding, so that the full resolution data are never
+            held in memory. The bins are aligned to multiples of `time_step` and
+            only the bins having samples are returned. Time and MSec give the
+            start of each bin. Variables of range gates are averaged over the
+            samples having data in the gate. Default is None (no averaging).
+        spectra_layout: Layout of the Level 0 spectral variables. With 'padded',
+            each variable is one array of shape (time, range, max(SpecN)) where
+            the spectra of shorter chirps are centered and padded with zeros.
+            With 'chirp', each variable is a tuple of arrays, one per chirp, of
+            shape (time, range gates of the chirp, SpecN of the chirp).
+            Default is 'padded'.
+        validation: Handling of invalid records, i.e., timestamps outside the
+            StartTime / StopTime range of the header and invalid block indices.
+            The records are checked after decoding. With 'strict', an error
+            listing all problems is raised. With 'warn', the problems are logged
+            and the data returned; records with invalid block indices have no
+            spectra from the invalid range gate onwards. With 'off', nothing is
+            checked. See also `validate_rpg`. Default is 'strict'.
 
     Returns:
         2-element tuple containing header (dict) and data (dict).
 
+    Raises:
+        ValueError: Invalid `time_step`, `spectra_layout` or `validation`.
+        RPGValidationError: Invalid records with 'strict' validation.
+
+    """
+    if time_step is not None and not time_step > 0:
+        raise ValueError('time_step must be positive')
+    if spectra_layout not in _SPECTRA_LAYOUTS:
+        raise ValueError(f'spectra_layout must be one of {_SPECTRA_LAYOUTS}')
+    if validation not in _VALIDATION_MODES:
+        raise ValueError(f'validation must be one of {_VALIDATION_MODES}')
+    source = head.get_source(file_name)
+    logging.debug(f'Reading {head.get_name(file_name)}')
+    with instrumentation.track_file(head.get_name(file_name)):
+        with instrumentation.track_phase('header'):
+            header, _ = head.read_rpg_header(source)
+        level, version = utils.get_rpg_file_type(header)
+        with instrumentation.track_phase('decode'), _open_source(source) as stream:
+            if time_step is not None:
+                data = _read_averaged(source, stream, header, level, version,
+                                      time_step, validation)
+                if level == 0 and spectra_layout == 'chirp':
+                    data = _split_chirps(header, data)
+            elif level == 0 and spectra_layout == 'chirp':
+                data = _read_chirp_layout(source, stream, header, validation)
+            elif level == 0:
+                data = _read_rpg_l0(stream, header, validation=validation)
+            else:
+                data = _read_rpg_l1(stream, header, version, validation=validation)
+    if not rpg_names:
+        header, data = _change_names(header, data)
+    return header, data
+
+
+def validate_rpg(file_name: os.PathLike | str | bytes | BinaryIO,
+                 rpg_names: bool = True) -> tuple[dict, dict, utils.ValidationReport]:
+    """ Reads RPG Level 1 / Level 0 binary file and reports all invalid records.
+
+    Unlike `read_rpg`, does not stop at the first invalid record. The checks are
+    the same as with the 'warn' validation of `read_rpg`.
+
+    Args:
+        file_name: File name, or the contents of the file as a bytes-like object
+            or binary file-like object, see `rpgpy.header.get_source`.
+        rpg_names: If True, uses RPG naming scheme for the returned data dict.
+            Otherwise, uses custom names. Default is True.
+
+    Returns:
+        3-element tuple containing header (dict), data (dict) and a report of
+        the problems found.
+
+    Raises:
+        RPGFileError: The file structure is invalid.
+
+    """
+    source = head.get_source(file_name)
+    problems = []
+    with instrumentation.track_file(head.get_name(file_name)):
+        with instrumentation.track_phase('header'):
+            header, _ = head.read_rpg_header(source)
+        level, version = utils.get_rpg_file_type(header)
+        with instrumentation.track_phase('decode'), _open_source(source) as stream:
+            if level == 0:
+                data = _read_rpg_l0(stream, header, validation='off', report=problems)
+            else:
+                data = _read_rpg_l1(stream, header, version, validation='off',
+                                    report=problems)
+    report = utils.ValidationReport(len(data['Time']), problems)
+    if not rpg_names:
+        header, data = _change_names(header, data)
+    return header, data, report
+
+
+def read_records(file_name: os.PathLike | str | bytes | BinaryIO, header: dict,
+                 offsets: np.ndarray | None = None, out: dict | None = None, *,
+                 spectra_layout: str = 'padded') -> dict:
+    """ Decodes the records of RPG Level 1 / Level 0 binary file with known header.
+
+    Unlike `read_rpg`, does not read the header, so that parts of a file can be
+    decoded one after another, e.g. in chunks of samples.
+
+    Args:
+        file_name: File name, or the contents of the file, see
+            `rpgpy.header.get_source`.
+        header: Header of the file, see `rpgpy.header.read_rpg_header`.
+        offsets: Positions of the records to decode, e.g. a slice of the offsets
+            of `rpgpy.header.read_record_index`. Default is None, i.e., all records.
+        out: Preallocated arrays the records are decoded into, as returned by
+            the decoder. Default is None, i.e., new arrays are allocated.
+        spectra_layout: Layout of the Level 0 spectral variables, see `read_rpg`.
+            Default is 'padded'.
+
+    Returns:
+        Data (dict) of the decoded records, using the RPG naming scheme.
+
+    Raises:
+        ValueError: Invalid `spectra_layout`.
+        RPGValidationError: Invalid records.
+
     """
-    file_name_bytes = os.fsencode(file_name)
-    logging.debug(f'Reading {file_name}')
-    header, _ = head.read_rpg_header(file_name)
+    if spectra_layout not in _SPECTRA_LAYOUTS:
+        raise ValueError(f'spectra_layout must be one of {_SPECTRA_LAYOUTS}')
     level, version = utils.get_rpg_file_type(header)
+    with _open_source(head.get_source(file_name)) as stream:
+        if level != 0:
+            return _read_rpg_l1(stream, header, version, offsets, out)
+        data = _read_rpg_l0(stream, header, offsets, out)
+    if spectra_layout == 'chirp':
+        data = _split_chirps(header, data)
+    return data
+
+
+def _init_arrays(header: dict, n_samples: int) -> dict:
+    """Allocates output arrays of the decoder of the file type."""
+    level, _ = utils.get_rpg_file_type(header)
+    if level == 0:
+        return _init_l0_arrays(header, n_samples)
+    return _init_l1_arrays(header, n_samples)
+
+
+def _read_averaged(source: os.PathLike | str | memoryview,
+                   stream: bytes | memoryview | BinaryIO, header: dict, level: int,
+                   version: float, time_step: float,
+                   validation: str = 'strict') -> dict:
+    """Decodes records in chunks of whole time bins and averages each bin.
+
+    The records are indexed from `source` and decoded from `stream`, see
+    `_open_source`.
+    """
+    index = head.read_record_index(source, header)
+    bins = np.floor((index.time + index.msec / 1000) / time_step).astype(np.int64)
+    order = np.argsort(bins, kind='stable')
+    bins, offsets = bins[order], index.offset[order]
+    bin_values, bin_starts = np.unique(bins, return_index=True)
+    bin_stops = np.append(bin_starts[1:], len(bins))
+    n_bins = len(bin_values)
+    output = _init_arrays(header, n_bins)
+    record_size = sum(array.nbytes for array in _init_arrays(header, 1).values())
+    chunk_size = max(min(len(bins), _AVERAGING_BUDGET // record_size),
+                     int(np.max(bin_stops - bin_starts, initial=0)))
+    scratch = _init_arrays(header, chunk_size)
+    first = 0
+    while first < n_bins:
+        last = first + 1
+        while last < n_bins and bin_stops[last] - bin_starts[first] <= chunk_size:
+            last += 1
+        start, stop = bin_starts[first], bin_stops[last - 1]
+        for array in scratch.values():
+            array.fill(0)
+        out = {key: array[:stop - start] for key, array in scratch.items()}
+        if level == 0:
+            chunk = _read_rpg_l0(stream, header, offsets[start:stop], out, validation)
+        else:
+            chunk = _read_rpg_l1(stream, header, version, offsets[start:stop], out,
+                                 validation)
+        _average_bins(chunk, bin_starts[first:last] - start, output,
+                      slice(first, last), level)
+        first = last
+    seconds = bin_values * time_step
+    output['Time'][:] = np.floor(seconds)
+    output['MSec'][:] = np.round((seconds - np.floor(seconds)) * 1000)
+    keys = _get_valid_l0_keys(header) if level == 0 else _get_valid_l1_keys(header)
+    return {key: output[key] for key in keys}
+
+
+def _read_chirp_layout(source: os.PathLike | str | memoryview,
+                       stream: bytes | memoryview | BinaryIO, header: dict,
+                       validation: str = 'strict') -> dict:
+    """Decodes LV0 records in chunks and moves the spectra into per-chirp arrays.
+
+    Only the spectra of one chunk are held in the padded layout at a time. The
+    other variables are decoded directly into the output arrays. The records
+    are indexed and decoded as in `_read_averaged`.
+    """
+    offsets = head.read_record_index(source, header).offset
+    n_samples = len(offsets)
+    templates = _init_l0_arrays(header, min(n_samples, _CHIRP_CHUNK))
+    scratch = {key: array for key, array in templates.items()
+               if key in _L0_SPECTRAL_KEYS}
+    output = {key: _init_chirp_arrays(header, n_samples) if key in scratch
+              else np.zeros((n_samples,) + array.shape[1:], array.dtype)
+              for key, array in templates.items()}
+    for start in range(0, n_samples, _CHIRP_CHUNK):
+        stop = min(start + _CHIRP_CHUNK, n_samples)
+        out = {key: array[start:stop] for key, array in output.items()
+               if key not in scratch}
+        for key, array in scratch.items():
+            array.fill(0)
+            out[key] = array[:stop - start]
+        _read_rpg_l0(stream, header, offsets[start:stop], out, validation)
+        for key in scratch:
+            _copy_chirps(header, out[key], output[key], slice(start, stop))
+    return {key: output[key] for key in _get_valid_l0_keys(header)}
+
+
+def _split_chirps(header: dict, data: dict) -> dict:
+    """Converts padded LV0 spectra into per-chirp arrays."""
+    data = dict(data)
+    for key in _L0_SPECTRAL_KEYS:
+        if key in data:
+            chirps = _init_chirp_arrays(header, data[key].shape[0])
+            _copy_chirps(header, data[key], chirps, slice(None))
+            data[key] = chirps
+    return data
+
+
+def _init_chirp_arrays(header: dict, n_samples: int) -> tuple:
+    """Allocates one spectral array per chirp."""
+    ranges = np.append(header['RngOffs'], header['RAltN'])
+    return tuple(np.zeros((n_samples, ranges[ind + 1] - ranges[ind], n_bins), np.float32)
+                 for ind, n_bins in enumerate(header['SpecN']))
+
+
+def _copy_chirps(header: dict, padded: np.ndarray, chirps: tuple,
+                 time_slice: slice) -> None:
+    """Copies the bins of each chirp from centered padded spectra."""
+    ranges = np.append(header['RngOffs'], header['RAltN'])
+    n_spectra = padded.shape[2]
+    for ind, (array, n_bins) in enumerate(zip(chirps, header['SpecN'])):
+        first_bin = (n_spectra - n_bins) // 2
+        array[time_slice] = padded[:, ranges[ind]:ranges[ind + 1],
+                                   first_bin:first_bin + n_bins]
+
+
+def _average_bins(data: dict, starts: np.ndarray, output: dict, bin_slice: slice,
+                  level: int) -> None:
+    """Averages consecutive samples starting at `starts` into output[bin_slice]."""
+    if level == 0:
+        has_data = np.any(data['TotSpec'] != 0, axis=2)
+    else:
+        has_data = data['Ze'] != 0
+    n_with_data = np.add.reduceat(has_data, starts, axis=0)
+    n_samples = np.diff(np.append(starts, len(has_data)))
+    for key, array in data.items():
+        if key in ('Time', 'MSec'):
+            continue
+        target = output[key]
+        if key == 'QF':
+            target[bin_slice] = np.bitwise_or.reduceat(array, starts)
+        elif key == 'Status':
+            # status flags are digits which can not be averaged
+            target[bin_slice] = array[starts]
+        elif key == 'AliasMsk':
+            target[bin_slice] = np.maximum.reduceat(array, starts, axis=0)
+        else:
+            sums = np.add.reduceat(array, starts, axis=0, dtype=np.float64)
+            if array.ndim == 1 or key in ('SLv', 'SLh'):
+                counts = n_samples
+            else:
+                counts = n_with_data
+            counts = counts.reshape(counts.shape + (1,) * (sums.ndim - counts.ndim))
+            target[bin_slice] = np.divide(sums, counts, out=np.zeros_like(sums),
+                                          where=counts > 0)
+
+
+def salvage_rpg(file_name: os.PathLike | str | bytes | BinaryIO,
+                rpg_names: bool = True) -> tuple[dict, dict, utils.SalvageReport]:
+    """ Reads RPG Level 1 / Level 0 binary file skipping corrupted records.
+
+    Every record is validated against its SampBytes, the StartTime / StopTime
+    range of the header and the block indices before decoding. After an invalid
+    record, the reader resynchronizes on the next plausible sample header.
+    Compressed files and archive members are decompressed into memory, as the
+    scan needs random access to the records.
+
+    Args:
+        file_name: File name, or the contents of the file as a bytes-like object
+            or binary file-like object, see `rpgpy.header.get_source`.
+        rpg_names: If True, uses RPG naming scheme for the returned data dict.
+            Otherwise, uses custom names. Default is True.
+
+    Returns:
+        3-element tuple containing header (dict), data (dict) and a report
+        of the skipped byte ranges.
+
+    """
+    source = head.get_source(file_name)
+    if archive.is_streamed(source):
+        with archive.open_file(source) as file:
+            source = memoryview(file.read())
+    logging.debug(f'Salvaging {head.get_name(file_name)}')
+    with instrumentation.track_file(head.get_name(file_name)):
+        with instrumentation.track_phase('header'):
+            header, _ = head.read_rpg_header(source)
+        level, version = utils.get_rpg_file_type(header)
+        with instrumentation.track_phase('scan'):
+            offsets, dropped, n_samples = _scan_records(source, header, level, version)
+        for start, stop in dropped:
+            logging.warning(f'Skipping corrupted bytes {start}-{stop} in '
+                            f'{head.get_name(file_name)}')
+        with instrumentation.track_phase('decode'), _open_source(source) as stream:
+            if level == 0:
+                data = _read_rpg_l0(stream, header, offsets)
+            else:
+                data = _read_rpg_l1(stream, header, version, offsets)
+    if not rpg_names:
+        header, data = _change_names(header, data)
+    report = utils.SalvageReport(n_samples, len(offsets), dropped)
+    return header, data, report
+
+
+cdef struct RecordLayout:
+    int level
+    int version_1
+    int n_levels
+    int n_spectra
+    int compression
+    int polarization
+    int anti_alias
+    int check_time
+    unsigned int start_time
+    unsigned int stop_time
+    Py_ssize_t prefix_bytes
+    int *n_bins
+
+
+cdef inline int _get_i4(const unsigned char[:] buf, Py_ssize_t pos):
+    cdef int value
+    memcpy(&value, &buf[pos], 4)
+    return value
+
+
+cdef inline short _get_i2(const unsigned char[:] buf, Py_ssize_t pos):
+    cdef short value
+    memcpy(&value, &buf[pos], 2)
+    return value
+
+
+cdef Py_ssize_t _parse_record(const unsigned char[:] buf, Py_ssize_t pos,
+                              RecordLayout *layout):
+    """Returns size of the record starting at pos, or -1 if it is not valid."""
+    cdef:
+        Py_ssize_t size = buf.shape[0], record_end, alt_ind, m
+        int samp_bytes, n_bins, bins_to_shift, n_points, n_values
+        unsigned int timestamp
+        unsigned char n_blocks
+        short min_ind, max_ind
+        const unsigned char *is_data
+
+    if pos + 8 > size:
+        return -1
+    samp_bytes = _get_i4(buf, pos)
+    if samp_bytes <= 0 or pos + 4 + samp_bytes > size:
+        return -1
+    record_end = pos + 4 + samp_bytes
+    memcpy(&timestamp, &buf[pos + 4], 4)
+    if layout.check_time and not (layout.start_time <= timestamp <= layout.stop_time):
+        return -1
+
+    pos += 4 + layout.prefix_bytes
+    if pos + layout.n_levels > record_end:
+        return -1
+    is_data = &buf[pos]
+    pos += layout.n_levels
+
+    for alt_ind in range(layout.n_levels):
+        if is_data[alt_ind] == 0:
+            continue
+        if is_data[alt_ind] != 1:
+            return -1
+        n_bins = layout.n_bins[alt_ind]
+        if layout.level == 1:
+            if layout.version_1:
+                pos += 20 + 4 * n_bins
+            else:
+                pos += 20
+                if layout.polarization > 0:
+                    pos += 12
+                if layout.polarization == 2:
+                    pos += 20
+        elif layout.compression == 0:
+            pos += 4 + 4 * n_bins * (4 if layout.polarization > 0 else 1)
+        else:
+            pos += 4
+            if pos + 1 > record_end:
+                return -1
+            n_blocks = buf[pos]
+            pos += 1
+            if pos + 4 * n_blocks > record_end:
+                return -1
+            bins_to_shift = (layout.n_spectra - n_bins) // 2
+            n_points = 0
+            for m in range(n_blocks):
+                min_ind = _get_i2(buf, pos + 2 * m)
+                max_ind = _get_i2(buf, pos + 2 * (n_blocks + m))
+                if min_ind < 0 or min_ind > max_ind:
+                    return -1
+                if max_ind + bins_to_shift >= layout.n_spectra:
+                    return -1
+                n_points += max_ind - min_ind + 1
+            pos += 4 * n_blocks
+            n_values = 1
+            if layout.polarization > 0:
+                n_values += 3
+            if layout.compression == 2:
+                n_values += 3
+            if layout.compression == 2 and layout.polarization == 2:
+                n_values += 2
+                pos += 8
+            pos += 4 * n_points * n_values + 4
+            if layout.polarization > 0:
+                pos += 4
+            if layout.anti_alias == 1:
+                pos += 5
+        if pos > record_end:
+            return -1
+
+    if pos != record_end:
+        return -1
+    return 4 + samp_bytes
+
+
+def _scan_records(file_name: os.PathLike | str | memoryview, header: dict, level: int,
+                  version: float) -> tuple[np.ndarray, list, int]:
+    """Finds offsets of valid records and byte ranges of the invalid ones."""
+    cdef:
+        RecordLayout layout
+        const unsigned char[:] buf
+        Py_ssize_t pos, size, record_size, start
+        int n_levels = header['RAltN']
+        int n_dummy = 3 + header['TAltN'] + 2*header['HAltN'] + n_levels
+        int *n_bins = <int *> malloc(n_levels * sizeof(int))
+
+    if isinstance(file_name, memoryview):
+        buf = file_name
+    else:
+        buf = np.memmap(file_name, dtype=np.uint8, mode='r')
+    size = buf.shape[0]
+
+    layout.level = level
+    layout.version_1 = version == 1.0
+    layout.n_levels = n_levels
+    layout.n_spectra = max(header['SpecN'])
+    layout.compression = header.get('CompEna', 0)
+    layout.polarization = header['DualPol']
+    layout.anti_alias = header.get('AntiAlias', 0)
+    layout.check_time = 'StartTime' in header
+    layout.start_time = header.get('StartTime', 0)
+    layout.stop_time = header.get('StopTime', 0)
+    layout.n_bins = n_bins
+    for i, n in enumerate(_get_n_samples(header)):
+        n_bins[i] = n
+
+    if layout.polarization > 0:
+        n_dummy += n_levels
+    layout.prefix_bytes = 4 + 4 + 17 * 4
+    if level == 0 or version > 1.0:
+        layout.prefix_bytes += 1
+    if level == 0:
+        layout.prefix_bytes += 4 * (n_dummy + n_levels)
+        if layout.polarization > 0:
+            layout.prefix_bytes += 4 * n_levels
+    elif version == 1.0:
+        layout.prefix_bytes += 4 * (4 + header['SequN'])
+    else:
+        layout.prefix_bytes += 4 * n_dummy
+
+    pos = 8 + header['HeaderLen']
+    n_samples = _get_i4(buf, pos) if pos + 4 <= size else 0
+    pos += 4
+    offsets = []
+    dropped = []
+    while pos < size:
+        record_size = _parse_record(buf, pos, &layout)
+        if record_size > 0:
+            offsets.append(pos)
+            pos += record_size
+            continue
+        start = pos
+        pos += 1
+        while pos < size and _parse_record(buf, pos, &layout) < 0:
+            pos += 1
+        dropped.append((start, pos))
+
+    free(n_bins)
+    return np.array(offsets, dtype=np.int64), dropped, n_samples
+
+
+def read_rpg_multi(file_names: Iterable[os.PathLike | str | bytes | BinaryIO],
+                   rpg_names: bool = True, *, jobs: int = 1) -> tuple[dict, dict]:
+    """ Reads several RPG Level 1 / Level 0 binary files into concatenated arrays.
+
+    The number of samples of each file is read from the file headers first,
+    so that the output arrays can be allocated only once and every file is
+    decoded directly into its own slice of them.
+
+    Args:
+        file_names: File names, or contents of the files, in the order of
+            concatenation.
+        rpg_names: If True, uses RPG naming scheme for the returned data dict.
+            Otherwise, uses custom names. Default is True.
+        jobs: Number of files decoded in parallel threads. The decoders release
+            the GIL while parsing the records. Default is 1.
+
+    Returns:
+        2-element tuple containing header (dict) of the first file and
+        concatenated data (dict).
+
+    Raises:
+        RPGFileError: No files or files with inconsistent array dimensions.
+
+    """
+    file_names = list(file_names)
+    if not file_names:
+        raise RPGFileError('No files to read')
+    names = [head.get_name(file_name) for file_name in file_names]
+    sources = [head.get_source(file_name) for file_name in file_names]
+    headers, sample_counts = [], []
+    for source in sources:
+        file_header, _ = head.read_rpg_header(source)
+        headers.append(file_header)
+        sample_counts.append(head.read_n_samples(source, file_header))
+    header = dict(headers[0])
+    for name, file_header in zip(names[1:], headers[1:]):
+        _check_layout_consistency(header, file_header, name)
+    if 'StopTime' in header:
+        header['StopTime'] = headers[-1]['StopTime']
+    level, _ = utils.get_rpg_file_type(header)
+    n_total = sum(sample_counts)
     if level == 0:
-        data = _read_rpg_l0(file_name_bytes, header)
+        arrays = _init_l0_arrays(header, n_total)
+    else:
+        arrays = _init_l1_arrays(header, n_total)
+    tasks = []
+    ind0 = 0
+    for name, source, file_header, n_samples in zip(names, sources, headers,
+                                                   sample_counts):
+        out = {key: array[ind0:ind0 + n_samples] for key, array in arrays.items()}
+        tasks.append(partial(_decode_into, name, source, file_header, out))
+        ind0 += n_samples
+    if jobs > 1:
+        with ThreadPoolExecutor(jobs) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, task)
+                       for task in tasks]
+            for future in futures:
+                future.result()
     else:
-        data = _read_rpg_l1(file_name_bytes, header, version)
+        for task in tasks:
+            task()
+    data = {key: arrays[key] for key in arrays}
     if not rpg_names:
-        data = _change_keys(data)
-        header = _change_keys(header)
-        if header['Dual Polarisation'] == 2:
-            data['Differential Reflectivity Ratio'] = data.pop('Linear Depolarisation Ratio')
+        header, data = _change_names(header, data)
+    return header, data
+
+
+def _decode_into(name: str,
+                 source: os.PathLike | str | archive.ArchiveMember | memoryview,
+                 header: dict, out: dict) -> None:
+    """Decodes all records of a file into the preallocated arrays of out."""
+    level, version = utils.get_rpg_file_type(header)
+    logging.debug(f'Reading {name}')
+    with instrumentation.track_file(name):
+        with instrumentation.track_phase('decode'), _open_source(source) as stream:
+            if level == 0:
+                _read_rpg_l0(stream, header, out=out)
+            else:
+                _read_rpg_l1(stream, header, version, out=out)
+
+
+def _check_layout_consistency(header: dict, file_header: dict, file_name) -> None:
+    """Checks that data of two files fit into the same arrays."""
+    for key in ('FileCode', 'RAltN', 'CompEna', 'DualPol', 'AntiAlias'):
+        if np.any(header.get(key) != file_header.get(key)):
+            raise RPGFileError(f'Inconsistent {key} in {file_name}')
+    if 'CompEna' in header and max(header['SpecN']) != max(file_header['SpecN']):
+        raise RPGFileError(f'Inconsistent SpecN in {file_name}')
+
+
+def read_housekeeping(file_name: os.PathLike | str | bytes | BinaryIO,
+                      rpg_names: bool = True, *,
+                      sensitivity: bool = False) -> tuple[dict, dict]:
+    """ Reads the housekeeping data of RPG Level 1 / Level 0 binary file.
+
+    Only the beginning of each record, from Time to PCT, is read and the rest
+    of the record is skipped using its SampBytes, so that the range gates and
+    spectra are never read or decoded.
+
+    Args:
+        file_name: File name, or the contents of the file as a bytes-like object
+            or binary file-like object, see `rpgpy.header.get_source`.
+        rpg_names: If True, uses RPG naming scheme for the returned data dict.
+            Otherwise, uses custom names. Default is True.
+        sensitivity: If True, also reads the sensitivity limits SLv, and SLh of
+            dual polarisation files, which follow the housekeeping data in
+            Level 0 records. Default is False.
+
+    Returns:
+        2-element tuple containing header (dict) and data (dict) of the
+        variables having one value per sample, and optionally SLv and SLh.
+
+    Raises:
+        RPGFileError: A record extends beyond the end of the file.
+
+    Examples:
+        >>> from rpgpy import read_housekeeping
+        >>> header, data = read_housekeeping('rpg-data.LV0')
+        >>> data['TransPow']
+
+    """
+    source = head.get_source(file_name)
+    logging.debug(f'Reading housekeeping data of {head.get_name(file_name)}')
+    with instrumentation.track_file(head.get_name(file_name)):
+        with instrumentation.track_phase('header'):
+            header, _ = head.read_rpg_header(source)
+        with instrumentation.track_phase('decode'):
+            with _open_source(source) as stream:
+                data = _read_housekeeping(stream, header, sensitivity)
+    if not rpg_names:
+        header, data = _change_keys(header), _change_keys(data)
+    return header, data
+
+
+def read_housekeeping_multi(file_names: Iterable[os.PathLike | str | bytes],
+                            rpg_names: bool = True, *, sensitivity: bool = False,
+                            jobs: int = 1) -> dict:
+    """ Reads the housekeeping data of many RPG binary files into concatenated arrays.
+
+    Args:
+        file_names: File names, or contents of the files, in the order of
+            concatenation. Level 0 and Level 1 files can be mixed.
+        rpg_names: If True, uses RPG naming scheme for the returned data dict.
+            Otherwise, uses custom names. Default is True.
+        sensitivity: If True, also reads SLv and SLh of Level 0 files, see
+            `read_housekeeping`. Default is False.
+        jobs: Number of files read in parallel worker processes. Default is 1.
+
+    Returns:
+        Concatenated data (dict) of the variables found in all files.
+
+    Raises:
+        RPGFileError: No files or sensitivity limits with inconsistent numbers of
+            range gates.
+
+    Examples:
+        >>> import glob
+        >>> from rpgpy import read_housekeeping_multi
+        >>> data = read_housekeeping_multi(sorted(glob.glob('/data/*/*.LV0')), jobs=8)
+
+    """
+    file_names = list(file_names)
+    if not file_names:
+        raise RPGFileError('No files to read')
+    read = partial(read_housekeeping, rpg_names=rpg_names, sensitivity=sensitivity)
+    if jobs > 1:
+        chunk_size = max(1, len(file_names) // (4 * jobs))
+        collect = partial(instrumentation.run_collected, read)
+        results = []
+        with ProcessPoolExecutor(jobs) as executor:
+            for (_, data), records in executor.map(collect, file_names,
+                                                   chunksize=chunk_size):
+                instrumentation.add_records(records)
+                results.append(data)
+    else:
+        results = [read(file_name)[1] for file_name in file_names]
+    output = {}
+    for key in results[0]:
+        if not all(key in data for data in results):
+            continue
+        if len({data[key].shape[1:] for data in results}) > 1:
+            raise RPGFileError(f'Inconsistent number of range gates in {key}')
+        output[key] = np.concatenate([data[key] for data in results])
+    return output
+
+
+def _change_names(header: dict, data: dict) -> tuple[dict, dict]:
+    data = _change_keys(data)
+    header = _change_keys(header)
+    if header['Dual Polarisation'] == 2:
+        data['Differential Reflectivity Ratio'] = data.pop('Linear Depolarisation Ratio')
     return header, data
 
 
@@ -49,14 +773,292 @@ def _change_keys(a_dict: dict) -> dict:
     return dict_new
 
 
-def _read_rpg_l0(file_name: bytes, header: dict) -> dict:
-    """Reads RPG LV0 binary file."""
+cdef extern from *:
+    """
+    #if defined(_WIN32)
+    #define rpg_fseek _fseeki64
+    #define rpg_ftell _ftelli64
+    #else
+    #define rpg_fseek fseeko
+    #define rpg_ftell ftello
+    #endif
+    """
+    # 64-bit offsets also where long is 32-bit, e.g. on Windows
+    int rpg_fseek(FILE *stream, long long offset, int origin) nogil
+    long long rpg_ftell(FILE *stream) nogil
+
+
+cdef struct _Stream:
+    FILE *file
+    const unsigned char *buf
+    Py_ssize_t size
+    Py_ssize_t pos
+    void *window  # _Window of a decompressing file-like object
+    long long start  # position of buf[0] in the file-like object
+
+
+cdef class _Window:
+    """Block of a binary file-like object, which the decoders read without the GIL.
+
+    The block is moved forward as the records are read, so that only about
+    `_WINDOW_SIZE` bytes of a decompressing stream are held in memory. An error
+    of the file-like object is stored and raised after decoding, see `_check`.
+    """
+    cdef object file
+    cdef bytes data
+    cdef object error
+
+    def __cinit__(self, file):
+        self.file = file
+        self.data = b''
+        self.error = None
+
+    cdef void _set(self, _Stream *stream, bytes data, long long start) noexcept:
+        self.data = data
+        stream.buf = <const unsigned char *> <const char *> self.data
+        stream.size = len(data)
+        stream.pos = 0
+        stream.start = start
+
+    cdef int fill(self, _Stream *stream, Py_ssize_t n_bytes) noexcept:
+        """Reads until n_bytes follow the position, or to the end of the file."""
+        if self.error is not None:
+            return -1
+        try:
+            blocks = [self.data[stream.pos:]]
+            available = stream.size - stream.pos
+            while available < n_bytes:
+                block = self.file.read(max(n_bytes - available, _WINDOW_SIZE))
+                if not block:
+                    break
+                blocks.append(block)
+                available += len(block)
+            self._set(stream, b''.join(blocks), stream.start + stream.pos)
+        except Exception as error:
+            self.error = error
+            return -1
+        return 0
+
+    cdef int move(self, _Stream *stream, long long target, int origin) noexcept:
+        """Moves outside the block, returns -1 if the target is beyond the end."""
+        if self.error is not None:
+            return -1
+        try:
+            if origin == SEEK_END:
+                # the size of a decompressing stream is known only at its end
+                position = stream.start + stream.size
+                block = self.file.read(_WINDOW_SIZE)
+                while block:
+                    position += len(block)
+                    block = self.file.read(_WINDOW_SIZE)
+                target += position
+            else:
+                position = self.file.seek(target)
+            self._set(stream, b'', min(position, target))
+        except Exception as error:
+            self.error = error
+            return -1
+        return 0 if position >= target else -1
+
+
+@contextmanager
+def _open_source(source: os.PathLike | str | archive.ArchiveMember | memoryview):
+    """Yields source from `rpgpy.header.get_source` for the decoders.
+
+    Compressed files and archive members are decompressed while they are
+    decoded. File names are encoded for fopen.
+    """
+    if isinstance(source, memoryview):
+        yield source
+    elif archive.is_streamed(source):
+        with archive.open_file(source) as file:
+            yield file
+    else:
+        yield os.fsencode(source)
+
+
+cdef object _open(object source, _Stream *stream):
+    """Opens source from `_open_source`, returns object to keep alive while reading."""
+    cdef const unsigned char[:] view
+    cdef _Window window
+    stream.file = NULL
+    stream.buf = NULL
+    stream.size = 0
+    stream.pos = 0
+    stream.window = NULL
+    stream.start = 0
+    if isinstance(source, bytes):
+        stream.file = fopen(source, "rb")
+        if stream.file == NULL:
+            raise OSError(errno, os.strerror(errno), os.fsdecode(source))
+        return None
+    if hasattr(source, 'read'):
+        window = _Window(source)
+        window._set(stream, b'', source.tell())
+        stream.window = <void *> window
+        return window
+    view = source
+    stream.size = view.shape[0]
+    if stream.size > 0:
+        stream.buf = &view[0]
+    return view
+
+
+cdef _check(object buffer):
+    """Raises the error of the file-like object read by the decoder, if any."""
+    if isinstance(buffer, _Window) and (<_Window> buffer).error is not None:
+        raise (<_Window> buffer).error
+
+
+cdef inline size_t _read(void *dst, size_t size, size_t n, _Stream *stream) noexcept nogil:
+    """Reads like fread from the file or the buffer of the stream."""
+    cdef Py_ssize_t available
+    if stream.file != NULL:
+        return fread(dst, size, n, stream.file)
+    if stream.window != NULL and stream.pos + <Py_ssize_t> (size * n) > stream.size:
+        with gil:
+            (<_Window> stream.window).fill(stream, size * n)
+    available = stream.size - stream.pos
+    if stream.pos < 0 or available <= 0:
+        return 0
+    if <size_t> available < size * n:
+        n = available // size
+    memcpy(dst, stream.buf + stream.pos, size * n)
+    stream.pos += size * n
+    return n
+
+
+cdef inline int _seek(_Stream *stream, long long offset, int origin) noexcept nogil:
+    """Seeks like fseek, returns -1 if a file-like object ends before the target."""
+    if stream.file != NULL:
+        return rpg_fseek(stream.file, offset, origin)
+    if stream.window != NULL:
+        if origin == SEEK_CUR:
+            offset += stream.start + stream.pos
+            origin = SEEK_SET
+        if origin == SEEK_SET and stream.start <= offset <= stream.start + stream.size:
+            stream.pos = offset - stream.start
+            return 0
+        with gil:
+            return (<_Window> stream.window).move(stream, offset, origin)
+    if origin == SEEK_SET:
+        stream.pos = offset
+    elif origin == SEEK_CUR:
+        stream.pos += offset
+    else:
+        stream.pos = stream.size + offset
+    return 0
+
+
+cdef inline long long _tell(_Stream *stream) noexcept nogil:
+    if stream.file != NULL:
+        return rpg_ftell(stream.file)
+    return stream.start + stream.pos
+
+
+cdef inline void _close(_Stream *stream) noexcept nogil:
+    if stream.file != NULL:
+        fclose(stream.file)
+        stream.file = NULL
+
+
+def _read_housekeeping(source: bytes | memoryview | BinaryIO, header: dict,
+                       sensitivity: bool) -> dict:
+    """Reads Time to PCT, and optionally SLv / SLh, of each record, skipping the rest."""
 
     cdef:
-        char* fname = file_name
-        FILE *ptr
+        _Stream stream
+        _Stream *ptr = &stream
+        int header_length=0, n_samples=0, sample=0, samp_bytes=0, invalid_sample=-1
+        long long record_start=0, file_size=0
+        int n_levels = header['RAltN']
+        int n_values = len(_HOUSEKEEPING_KEYS)
+        int n_dummy = 3 + header['TAltN'] + 2*header['HAltN'] + n_levels
+        bint has_qf, has_slv, has_slh
+
+    level, version = utils.get_rpg_file_type(header)
+    has_qf = level == 0 or version > 1.0
+    has_slv = sensitivity and level == 0
+    has_slh = has_slv and header['DualPol'] > 0
+    if header['DualPol'] > 0:
+        n_dummy += n_levels
+
+    buffer = _open(source, ptr)
+    if stream.window == NULL:
+        _seek(ptr, 0, SEEK_END)
+        file_size = _tell(ptr)
+    else:
+        # the end of a decompressing stream is found when seeking beyond it
+        file_size = -1
+    _seek(ptr, 4, SEEK_SET)
+    _read(&header_length, 4, 1, ptr)
+    _seek(ptr, header_length, SEEK_CUR)
+    _read(&n_samples, 4, 1, ptr)
+    record_start = _tell(ptr)
+
+    out = _init_housekeeping_arrays(n_samples)
+    values_array = np.empty((n_samples, n_values), np.float32)
+    if has_slv:
+        out['SLv'] = np.empty((n_samples, n_levels), np.float32)
+    if has_slh:
+        out['SLh'] = np.empty((n_samples, n_levels), np.float32)
+
+    cdef:
+        unsigned int [:] Time = out['Time']
+        int [:] MSec = out['MSec']
+        char [:] QF = out['QF']
+        float [:, :] values = values_array
+        float [:, :] SLv = out.get('SLv')
+        float [:, :] SLh = out.get('SLh')
+
+    with nogil:  # lets other threads, e.g. an asyncio event loop, run
+        for sample in range(n_samples):
+            if (_read(&samp_bytes, 4, 1, ptr) != 1 or samp_bytes <= 0
+                    or 0 <= file_size < record_start + 4 + samp_bytes):
+                invalid_sample = sample
+                break
+            _read(&Time[sample], 4, 1, ptr)
+            _read(&MSec[sample], 4, 1, ptr)
+            if has_qf:
+                _read(&QF[sample], 1, 1, ptr)
+            _read(&values[sample, 0], 4, n_values, ptr)
+            if has_slv:
+                _seek(ptr, n_dummy * 4, SEEK_CUR)  # this chunk contains data (temp profile etc.)
+                _read(&SLv[sample, 0], 4, n_levels, ptr)
+            if has_slh:
+                _read(&SLh[sample, 0], 4, n_levels, ptr)
+            if _seek(ptr, record_start + 4 + samp_bytes, SEEK_SET) != 0:
+                invalid_sample = sample
+                break
+            record_start += 4 + samp_bytes
+
+    _close(ptr)
+    _check(buffer)
+    if invalid_sample >= 0:
+        raise RPGFileError(f'Invalid record {invalid_sample} at position {record_start}')
+    instrumentation.add_counts(bytes_read=record_start, n_samples=n_samples)
+    for ind, key in enumerate(_HOUSEKEEPING_KEYS):
+        out[key] = np.ascontiguousarray(values_array[:, ind])
+    return out
+
+
+def _read_rpg_l0(source: bytes | memoryview | BinaryIO, header: dict, offsets: np.ndarray | None = None,
+                 out: dict | None = None, validation: str = 'strict',
+                 report: list | None = None) -> dict:
+    """Reads RPG LV0 binary file, optionally only the records starting at offsets.
+
+    If given, the data are decoded into the preallocated arrays of `out`. A record
+    with invalid block indices is skipped from the invalid range gate onwards, and
+    the problems are handled after decoding, see `_validate`.
+    """
+
+    cdef:
+        _Stream stream
+        _Stream *ptr = &stream
         int header_length=0, n_samples=0, sample=0, n=0, m=0
-        int alt_ind=0, n_points=0, bins_to_shift=0
+        int alt_ind=0, n_points=0, bins_to_shift=0, block_error=0
+        long long sample_start=0
+        long long n_gates_with_data=0
         unsigned char n_blocks
         int n_spectra = max(header['SpecN'])
         int n_levels = header['RAltN']
@@ -67,188 +1069,228 @@ def _read_rpg_l0(file_name: bytes, header: dict) -> dict:
         short int[256] max_ind
         short int[256] n_block_points
         short int[256] spec_ind
+        const long long [:] record_offsets = None
+        bint has_offsets = False
         char *is_data = <char *> malloc(n_levels * sizeof(char))
         int *n_samples_at_each_height = <int *> malloc(n_levels * sizeof(int))
+        int *bins_to_shift_at_each_height = <int *> malloc(n_levels * sizeof(int))
 
-    ptr = fopen(fname, "rb")
-    fseek(ptr, 4, SEEK_CUR)
-    fread(&header_length, 4, 1, ptr)
-    fseek(ptr, header_length, SEEK_CUR)
-    fread(&n_samples, 4, 1, ptr)
+    buffer = _open(source, ptr)
+    _seek(ptr, 4, SEEK_CUR)
+    _read(&header_length, 4, 1, ptr)
+    _seek(ptr, header_length, SEEK_CUR)
+    _read(&n_samples, 4, 1, ptr)
+    if offsets is not None:
+        n_samples = len(offsets)
+        record_offsets = np.asarray(offsets, dtype=np.int64)
+        has_offsets = True
+
+    if out is None:
+        out = _init_l0_arrays(header, n_samples)
 
     cdef:
         int [:] SampBytes = np.empty(n_samples, np.int32)
-        unsigned int [:] Time = np.empty(n_samples, np.uint32)
-        int [:] MSec = np.empty(n_samples, np.int32)
-        char [:] QF = np.empty(n_samples, np.int8)
+        char [:] BlockError = np.zeros(n_samples, np.int8)
+        int [:] BlockGate = np.zeros(n_samples, np.int32)
+        unsigned int [:] Time = out['Time']
+        int [:] MSec = out['MSec']
+        char [:] QF = out['QF']
         float [:] RR, RelHum, EnvTemp, BaroP, WS, WD, DDVolt, DDTb, LWP, PowIF,
         float [:] Elev, Azi, Status, TransPow, TransT, RecT, PCT
-        float [:, :, :] TotSpec = np.zeros((n_samples, n_levels, n_spectra), np.float32)
+        float [:, :, :] TotSpec = out['TotSpec']
         float [:, :, :] HSpec, ReVHSpec, ImVHSpec, RefRat, CorrCoeff, DiffPh, SLDR, SCorrCoeff
         float [:, :] KDP, DiffAtt, TotNoisePow, HNoisePow, MinVel, SLh, SLv
         char [:, :] AliasMsk
         int n_dummy = 3 + header['TAltN'] + 2*header['HAltN'] + n_levels
 
     (RR, RelHum, EnvTemp, BaroP, WS, WD, DDVolt, DDTb, LWP, PowIF, Elev, Azi, Status,
-     TransPow, TransT, RecT, PCT) = [np.empty(n_samples, np.float32) for _ in range(17)]
+     TransPow, TransT, RecT, PCT) = [out[key] for key in _HOUSEKEEPING_KEYS]
 
-    SLv = np.zeros((n_samples, n_levels), np.float32)
+    SLv = out['SLv']
+    HSpec, ReVHSpec, ImVHSpec, SLh = [out.get(key) for key in ('HSpec', 'ReVHSpec',
+                                                               'ImVHSpec', 'SLh')]
+    TotNoisePow, HNoisePow = out.get('TotNoisePow'), out.get('HNoisePow')
+    RefRat, CorrCoeff, DiffPh = [out.get(key) for key in ('RefRat', 'CorrCoeff', 'DiffPh')]
+    MinVel, AliasMsk = out.get('MinVel'), out.get('AliasMsk')
+    SLDR, SCorrCoeff, KDP, DiffAtt = [out.get(key) for key in ('SLDR', 'SCorrCoeff',
+                                                               'KDP', 'DiffAtt')]
 
     if polarization > 0:
         n_dummy += n_levels
-        HSpec, ReVHSpec, ImVHSpec = [np.zeros((n_samples, n_levels, n_spectra), np.float32)
-                                     for _ in range(3)]
-        SLh = np.zeros((n_samples, n_levels), np.float32)
-    else:
-        HSpec, ReVHSpec, ImVHSpec, SLh = [None]*4
-
-    if compression > 0:
-        TotNoisePow = np.zeros((n_samples, n_levels), np.float32)
-    else:
-        TotNoisePow = None
-
-    if compression == 2:
-        RefRat, CorrCoeff, DiffPh = [np.zeros((n_samples, n_levels, n_spectra), np.float32)
-                                     for _ in range(3)]
-    else:
-        RefRat, CorrCoeff, DiffPh = [None]*3
-
-    if anti_alias == 1:
-        MinVel = np.zeros((n_samples, n_levels), np.float32)
-        AliasMsk = np.zeros((n_samples, n_levels), np.int8)
-    else:
-        MinVel, AliasMsk = [None]*2
-
-    if compression > 0 and polarization > 0:
-        HNoisePow = np.zeros((n_samples, n_levels), np.float32)
-    else:
-        HNoisePow = None
-
-    if compression == 2 and polarization == 2:
-        SLDR, SCorrCoeff = [np.zeros((n_samples, n_levels, n_spectra), np.float32)
-                            for _ in range(2)]
-        KDP, DiffAtt = [np.zeros((n_samples, n_levels), np.float32) for _ in range(2)]
-    else:
-        SLDR, SCorrCoeff, KDP, DiffAtt = [None]*4
 
     if compression == 0:
         for i, n in enumerate(_get_n_samples(header)):
             n_samples_at_each_height[i] = n
 
-    chirp_of_level = np.digitize(range(n_levels), header['RngOffs'])
-
-    for sample in range(n_samples):
-        fread(&SampBytes[sample], 4, 1, ptr)
-        fread(&Time[sample], 4, 1, ptr)
-        _check_timestamp(Time[sample], header)
-        fread(&MSec[sample], 4, 1, ptr)
-        fread(&QF[sample], 1, 1, ptr)
-        fread(&RR[sample], 4, 1, ptr)
-        fread(&RelHum[sample], 4, 1, ptr)
-        fread(&EnvTemp[sample], 4, 1, ptr)
-        fread(&BaroP[sample], 4, 1, ptr)
-        fread(&WS[sample], 4, 1, ptr)
-        fread(&WD[sample], 4, 1, ptr)
-        fread(&DDVolt[sample], 4, 1, ptr)
-        fread(&DDTb[sample], 4, 1, ptr)
-        fread(&LWP[sample], 4, 1, ptr)
-        fread(&PowIF[sample], 4, 1, ptr)
-        fread(&Elev[sample], 4, 1, ptr)
-        fread(&Azi[sample], 4, 1, ptr)
-        fread(&Status[sample], 4, 1, ptr)
-        fread(&TransPow[sample], 4, 1, ptr)
-        fread(&TransT[sample], 4, 1, ptr)
-        fread(&RecT[sample], 4, 1, ptr)
-        fread(&PCT[sample], 4, 1, ptr)
-        fseek(ptr, n_dummy * 4, SEEK_CUR)  # this chunk contains data (temp profile etc.)
-        fread(&SLv[sample, 0], 4, n_levels, ptr)
-
-        if polarization > 0:
-            fread(&SLh[sample, 0], 4, n_levels, ptr)
-
-        fread(is_data, 1, n_levels, ptr)
-
-        for alt_ind in range(n_levels):
-
-            if is_data[alt_ind] == 1:
-
-                fseek(ptr, 4, SEEK_CUR)
-                n_bins = header['SpecN'][chirp_of_level[alt_ind] - 1]
-                bins_to_shift = (n_spectra - n_bins) // 2
-
-                if compression == 0:
-                    n_points = n_samples_at_each_height[alt_ind]
-                    fread(&TotSpec[sample, alt_ind, bins_to_shift], 4, n_points, ptr)
-
-                    if polarization > 0:
-                        fread(&HSpec[sample, alt_ind, bins_to_shift], 4, n_points, ptr)
-                        fread(&ReVHSpec[sample, alt_ind, bins_to_shift], 4, n_points, ptr)
-                        fread(&ImVHSpec[sample, alt_ind, bins_to_shift], 4, n_points, ptr)
-
-                else:
-
-                    fread(&n_blocks, 1, 1, ptr)
-                    fread(&min_ind[0], 2, n_blocks, ptr)
-                    fread(&max_ind[0], 2, n_blocks, ptr)
-
-                    for m in range(n_blocks):
-                        if min_ind[m] < 0 or max_ind[m] < 0:
-                            raise RPGFileError('Invalid data: negative min_ind or max_ind')
-                        if min_ind[m] > max_ind[m]:
-                            raise RPGFileError('Invalid data: min_ind[m] > max_ind[m]')
-                        n_block_points[m] = max_ind[m] - min_ind[m] + 1
-                        spec_ind[m] = min_ind[m] + bins_to_shift
-                        if spec_ind[m] >= n_spectra:
-                            raise RPGFileError('Invalid data: spec_ind[m] > n_spectra')
-                        fread(&TotSpec[sample, alt_ind, spec_ind[m]], 4, n_block_points[m], ptr)
-
-                    if polarization > 0:
-                        for m in range(n_blocks):
-                            fread(&HSpec[sample, alt_ind, spec_ind[m]], 4, n_block_points[m], ptr)
-                        for m in range(n_blocks):
-                            fread(&ReVHSpec[sample, alt_ind, spec_ind[m]], 4, n_block_points[m], ptr)
-                        for m in range(n_blocks):
-                            fread(&ImVHSpec[sample, alt_ind, spec_ind[m]], 4, n_block_points[m], ptr)
+    # spectra of shorter chirps are centered in the padded spectral dimension
+    for i, n in enumerate(_get_n_samples(header)):
+        bins_to_shift_at_each_height[i] = (n_spectra - n) // 2
+
+    with nogil:  # lets other threads, e.g. an asyncio event loop, run
+        for sample in range(n_samples):
+            if has_offsets:
+                _seek(ptr, record_offsets[sample], SEEK_SET)
+            sample_start = _tell(ptr)
+            _read(&SampBytes[sample], 4, 1, ptr)
+            _read(&Time[sample], 4, 1, ptr)
+            _read(&MSec[sample], 4, 1, ptr)
+            _read(&QF[sample], 1, 1, ptr)
+            _read(&RR[sample], 4, 1, ptr)
+            _read(&RelHum[sample], 4, 1, ptr)
+            _read(&EnvTemp[sample], 4, 1, ptr)
+            _read(&BaroP[sample], 4, 1, ptr)
+            _read(&WS[sample], 4, 1, ptr)
+            _read(&WD[sample], 4, 1, ptr)
+            _read(&DDVolt[sample], 4, 1, ptr)
+            _read(&DDTb[sample], 4, 1, ptr)
+            _read(&LWP[sample], 4, 1, ptr)
+            _read(&PowIF[sample], 4, 1, ptr)
+            _read(&Elev[sample], 4, 1, ptr)
+            _read(&Azi[sample], 4, 1, ptr)
+            _read(&Status[sample], 4, 1, ptr)
+            _read(&TransPow[sample], 4, 1, ptr)
+            _read(&TransT[sample], 4, 1, ptr)
+            _read(&RecT[sample], 4, 1, ptr)
+            _read(&PCT[sample], 4, 1, ptr)
+            _seek(ptr, n_dummy * 4, SEEK_CUR)  # this chunk contains data (temp profile etc.)
+            _read(&SLv[sample, 0], 4, n_levels, ptr)
+
+            if polarization > 0:
+                _read(&SLh[sample, 0], 4, n_levels, ptr)
+
+            _read(is_data, 1, n_levels, ptr)
+
+            for alt_ind in range(n_levels):
+
+                if is_data[alt_ind] == 1:
+                    n_gates_with_data += 1
+
+                    _seek(ptr, 4, SEEK_CUR)
+                    bins_to_shift = bins_to_shift_at_each_height[alt_ind]
+
+                    if compression == 0:
+                        n_points = n_samples_at_each_height[alt_ind]
+                        _read(&TotSpec[sample, alt_ind, bins_to_shift], 4, n_points, ptr)
+
+                        if polarization > 0:
+                            _read(&HSpec[sample, alt_ind, bins_to_shift], 4, n_points, ptr)
+                            _read(&ReVHSpec[sample, alt_ind, bins_to_shift], 4, n_points, ptr)
+                            _read(&ImVHSpec[sample, alt_ind, bins_to_shift], 4, n_points, ptr)
+
+                    else:
+
+                        _read(&n_blocks, 1, 1, ptr)
+                        _read(&min_ind[0], 2, n_blocks, ptr)
+                        _read(&max_ind[0], 2, n_blocks, ptr)
 
-                    if compression == 2:
-                        for m in range(n_blocks):
-                            fread(&RefRat[sample, alt_ind, spec_ind[m]], 4, n_block_points[m], ptr)
-                        for m in range(n_blocks):
-                            fread(&CorrCoeff[sample, alt_ind, spec_ind[m]], 4, n_block_points[m], ptr)
                         for m in range(n_blocks):
-                            fread(&DiffPh[sample, alt_ind, spec_ind[m]], 4, n_block_points[m], ptr)
+                            n_block_points[m] = max_ind[m] - min_ind[m] + 1
+                            spec_ind[m] = min_ind[m] + bins_to_shift
+                            if min_ind[m] < 0 or max_ind[m] < 0:
+                                block_error = _NEGATIVE_INDEX
+                            elif min_ind[m] > max_ind[m]:
+                                block_error = _REVERSED_INDICES
+                            elif spec_ind[m] + n_block_points[m] > n_spectra:
+                                block_error = _INDEX_BEYOND_SPECTRUM
+                            if block_error != 0:
+                                break
+                        if block_error != 0:
+                            BlockError[sample] = block_error
+                            BlockGate[sample] = alt_ind
+                            block_error = 0
+                            break
 
-                    if compression == 2  and polarization == 2:
                         for m in range(n_blocks):
-                            fread(&SLDR[sample, alt_ind, spec_ind[m]], 4, n_block_points[m], ptr)
-                        for m in range(n_blocks):
-                            fread(&SCorrCoeff[sample, alt_ind, spec_ind[m]], 4, n_block_points[m], ptr)
-                        fread(&KDP[sample, alt_ind], 4, 1, ptr)
-                        fread(&DiffAtt[sample, alt_ind], 4, 1, ptr)
-
-                    fread(&TotNoisePow[sample, alt_ind], 4, 1, ptr)
+                            _read(&TotSpec[sample, alt_ind, spec_ind[m]], 4, n_block_points[m], ptr)
+
+                        if polarization > 0:
+                            for m in range(n_blocks):
+                                _read(&HSpec[sample, alt_ind, spec_ind[m]], 4, n_block_points[m], ptr)
+                            for m in range(n_blocks):
+                                _read(&ReVHSpec[sample, alt_ind, spec_ind[m]], 4, n_block_points[m], ptr)
+                            for m in range(n_blocks):
+                                _read(&ImVHSpec[sample, alt_ind, spec_ind[m]], 4, n_block_points[m], ptr)
+
+                        if compression == 2:
+                            for m in range(n_blocks):
+                                _read(&RefRat[sample, alt_ind, spec_ind[m]], 4, n_block_points[m], ptr)
+                            for m in range(n_blocks):
+                                _read(&CorrCoeff[sample, alt_ind, spec_ind[m]], 4, n_block_points[m], ptr)
+                            for m in range(n_blocks):
+                                _read(&DiffPh[sample, alt_ind, spec_ind[m]], 4, n_block_points[m], ptr)
+
+                        if compression == 2  and polarization == 2:
+                            for m in range(n_blocks):
+                                _read(&SLDR[sample, alt_ind, spec_ind[m]], 4, n_block_points[m], ptr)
+                            for m in range(n_blocks):
+                                _read(&SCorrCoeff[sample, alt_ind, spec_ind[m]], 4, n_block_points[m], ptr)
+                            _read(&KDP[sample, alt_ind], 4, 1, ptr)
+                            _read(&DiffAtt[sample, alt_ind], 4, 1, ptr)
+
+                        _read(&TotNoisePow[sample, alt_ind], 4, 1, ptr)
+
+                        if polarization > 0:
+                            _read(&HNoisePow[sample, alt_ind], 4, 1, ptr)
+
+                        if anti_alias == 1:
+                            _read(&AliasMsk[sample, alt_ind], 1, 1, ptr)
+                            _read(&MinVel[sample, alt_ind], 4, 1, ptr)
+
+            if BlockError[sample] != 0:
+                # skips the rest of the record
+                _seek(ptr, sample_start + 4 + SampBytes[sample], SEEK_SET)
+
+    current_position = end_position = _tell(ptr)
+    if offsets is None:
+        _seek(ptr, 0, SEEK_END)
+        end_position = _tell(ptr)
+    _close(ptr)
+    free(is_data)
+    free(n_samples_at_each_height)
+    free(bins_to_shift_at_each_height)
+    _check(buffer)
+    if offsets is None:
+        bytes_read = end_position
+    else:
+        bytes_read = 4 * n_samples + int(np.sum(SampBytes, dtype=np.int64))
+    instrumentation.add_counts(bytes_read=bytes_read, n_samples=n_samples,
+                               n_gates_with_data=n_gates_with_data)
+    if current_position != end_position:
+        raise RPGFileError('File position is not at the end of the file.')
 
-                    if polarization > 0:
-                        fread(&HNoisePow[sample, alt_ind], 4, 1, ptr)
+    _validate(header, np.asarray(Time), np.asarray(BlockError), np.asarray(BlockGate),
+              validation, report)
 
-                    if anti_alias == 1:
-                        fread(&AliasMsk[sample, alt_ind], 1, 1, ptr)
-                        fread(&MinVel[sample, alt_ind], 4, 1, ptr)
+    return {key: np.asarray(out[key]) for key in _get_valid_l0_keys(header)}
 
-    current_position = ftell(ptr)
-    fseek(ptr, 0, SEEK_END)
-    end_position = ftell(ptr)
-    if current_position != end_position:
-        raise RPGFileError('File position is not at the end of the file.')
 
-    fclose(ptr)
-    free(is_data)
-    free(n_samples_at_each_height)
+def _init_l0_arrays(header: dict, n_samples: int) -> dict:
+    """Allocates output arrays of the LV0 decoder."""
+    n_levels = header['RAltN']
+    n_spectra = max(header['SpecN'])
+    arrays = _init_housekeeping_arrays(n_samples)
+    for key in _get_valid_l0_keys(header):
+        if key in arrays:
+            continue
+        if key in _L0_SPECTRAL_KEYS:
+            arrays[key] = np.zeros((n_samples, n_levels, n_spectra), np.float32)
+        elif key == 'AliasMsk':
+            arrays[key] = np.zeros((n_samples, n_levels), np.int8)
+        else:
+            arrays[key] = np.zeros((n_samples, n_levels), np.float32)
+    return arrays
 
-    var_names = locals()
-    keys = _get_valid_l0_keys(header)
 
-    return {key: np.asarray(var_names[key]) for key in keys}
+def _init_housekeeping_arrays(n_samples: int) -> dict:
+    """Allocates arrays of the variables having one value per sample."""
+    arrays = {
+        'Time': np.empty(n_samples, np.uint32),
+        'MSec': np.empty(n_samples, np.int32),
+        'QF': np.zeros(n_samples, np.int8),
+    }
+    for key in _HOUSEKEEPING_KEYS:
+        arrays[key] = np.empty(n_samples, np.float32)
+    return arrays
 
 
 def _get_n_samples(header: dict) -> np.ndarray:
@@ -289,40 +1331,58 @@ def _get_valid_l0_keys(header: dict) -> list:
     return keys
 
 
-def _read_rpg_l1(file_name: bytes, header: dict, version: float) -> dict:
-    """Reads RPG LV1 binary file."""
+def _read_rpg_l1(source: bytes | memoryview | BinaryIO, header: dict, version: float,
+                 offsets: np.ndarray | None = None, out: dict | None = None,
+                 validation: str = 'strict', report: list | None = None) -> dict:
+    """Reads RPG LV1 binary file, optionally only the records starting at offsets.
+
+    If given, the data are decoded into the preallocated arrays of `out`. The
+    problems found are handled after decoding, see `_validate`.
+    """
 
     cdef:
-        char* fname = file_name
-        FILE *ptr
+        _Stream stream
+        _Stream *ptr = &stream
         int header_length=0, n_samples=0, sample=0, alt_ind=0
+        long long n_gates_with_data=0
         int n_levels = header['RAltN']
         int polarization = header['DualPol']
+        int n_chirps = header['SequN']
+        double file_version = version
+        const long long [:] record_offsets = None
+        bint has_offsets = False
         char *is_data = <char *> malloc(n_levels * sizeof(char))
         int * n_samples_at_each_height = <int *> malloc(n_levels * sizeof(int))
 
-    ptr = fopen(fname, "rb")
-    fseek(ptr, 4, SEEK_CUR)
-    fread(&header_length, 4, 1, ptr)
-    fseek(ptr, header_length, SEEK_CUR)
-    fread(&n_samples, 4, 1, ptr)
+    buffer = _open(source, ptr)
+    _seek(ptr, 4, SEEK_CUR)
+    _read(&header_length, 4, 1, ptr)
+    _seek(ptr, header_length, SEEK_CUR)
+    _read(&n_samples, 4, 1, ptr)
+    if offsets is not None:
+        n_samples = len(offsets)
+        record_offsets = np.asarray(offsets, dtype=np.int64)
+        has_offsets = True
+    if out is None:
+        out = _init_l1_arrays(header, n_samples)
 
     cdef:
         int [:] SampBytes = np.empty(n_samples, np.int32)
-        unsigned int [:] Time = np.empty(n_samples, np.uint32)
-        int [:] MSec = np.empty(n_samples, np.int32)
-        char [:] QF = np.empty(n_samples, np.int8)
-        float [:] RR, RelHum, EnvTemp, BaroP, WS, WD, DDVolt, DDTb, LWP, PowIF, RadC
+        unsigned int [:] Time = out['Time']
+        int [:] MSec = out['MSec']
+        char [:] QF = out['QF']
+        float [:] RR, RelHum, EnvTemp, BaroP, WS, WD, DDVolt, DDTb, LWP, PowIF
         float [:] Elev, Azi, Status, TransPow, TransT, RecT, PCT
+        float [:] RadC = np.empty(n_samples, np.float32)
         float [:, :] Ze, MeanVel, SpecWidth, Skewn, Kurt, RefRat, CorrCoeff, DiffPh, SLDR
         float [:, :] SCorrCoeff, KDP, DiffAtt
         int n_dummy = 3 + header['TAltN'] + 2*header['HAltN'] + n_levels
 
     (RR, RelHum, EnvTemp, BaroP, WS, WD, DDVolt, DDTb, LWP, PowIF, Elev, Azi, Status,
-     TransPow, TransT, RecT, PCT, RadC) = [np.empty(n_samples, np.float32) for _ in range(18)]
+     TransPow, TransT, RecT, PCT) = [out[key] for key in _HOUSEKEEPING_KEYS]
 
     (Ze, MeanVel, SpecWidth, Skewn, Kurt, RefRat, CorrCoeff, DiffPh, SLDR, SCorrCoeff,
-     KDP, DiffAtt) = [np.zeros((n_samples, n_levels), np.float32) for _ in range(12)]
+     KDP, DiffAtt) = [out.get(key) for key in _L1_KEYS]
 
     if polarization > 0:
         n_dummy += n_levels
@@ -330,77 +1390,94 @@ def _read_rpg_l1(file_name: bytes, header: dict, version: float) -> dict:
     for i, n in enumerate(_get_n_samples(header)):
         n_samples_at_each_height[i] = n
 
-    for sample in range(n_samples):
-
-        fread(&SampBytes[sample], 4, 1, ptr)
-        fread(&Time[sample], 4, 1, ptr)
-        _check_timestamp(Time[sample], header)
-        fread(&MSec[sample], 4, 1, ptr)
-        if version > 1.0:
-            fread(&QF[sample], 1, 1, ptr)
-        fread(&RR[sample], 4, 1, ptr)
-        fread(&RelHum[sample], 4, 1, ptr)
-        fread(&EnvTemp[sample], 4, 1, ptr)
-        fread(&BaroP[sample], 4, 1, ptr)
-        fread(&WS[sample], 4, 1, ptr)
-        fread(&WD[sample], 4, 1, ptr)
-        fread(&DDVolt[sample], 4, 1, ptr)
-        fread(&DDTb[sample], 4, 1, ptr)
-        fread(&LWP[sample], 4, 1, ptr)
-        fread(&PowIF[sample], 4, 1, ptr)
-        fread(&Elev[sample], 4, 1, ptr)
-        fread(&Azi[sample], 4, 1, ptr)
-        fread(&Status[sample], 4, 1, ptr)
-        fread(&TransPow[sample], 4, 1, ptr)
-        fread(&TransT[sample], 4, 1, ptr)
-        fread(&RecT[sample], 4, 1, ptr)
-        fread(&PCT[sample], 4, 1, ptr)
-        if version == 1.0:
-            fseek(ptr, 3 * 4, SEEK_CUR)
-            fread(&RadC[sample], 4, 1, ptr)
-            fseek(ptr, header["SequN"] * 4, SEEK_CUR)
-        else:
-            fseek(ptr, n_dummy * 4, SEEK_CUR)  # this chunk contains data (temp profile etc.)
-
-        fread(is_data, 1, n_levels, ptr)
-
-        for alt_ind in range(n_levels):
-
-            if is_data[alt_ind] == 1:
-                fread(&Ze[sample, alt_ind], 4, 1, ptr)
-                fread(&MeanVel[sample, alt_ind], 4, 1, ptr)
-                fread(&SpecWidth[sample, alt_ind], 4, 1, ptr)
-                fread(&Skewn[sample, alt_ind], 4, 1, ptr)
-                fread(&Kurt[sample, alt_ind], 4, 1, ptr)
-                if version == 1.0:
-                    fseek(ptr, n_samples_at_each_height[alt_ind] * 4, SEEK_CUR)
-                else:
-                    if polarization > 0:
-                        fread(&RefRat[sample, alt_ind], 4, 1, ptr)
-                        fread(&CorrCoeff[sample, alt_ind], 4, 1, ptr)
-                        fread(&DiffPh[sample, alt_ind], 4, 1, ptr)
-
-                    if  polarization == 2:
-                        fseek(ptr, 4, SEEK_CUR)
-                        fread(&SLDR[sample, alt_ind], 4, 1, ptr)
-                        fread(&SCorrCoeff[sample, alt_ind], 4, 1, ptr)
-                        fread(&KDP[sample, alt_ind], 4, 1, ptr)
-                        fread(&DiffAtt[sample, alt_ind], 4, 1, ptr)
-
-
-    current_position = ftell(ptr)
-    fseek(ptr, 0, SEEK_END)
-    end_position = ftell(ptr)
+    with nogil:  # lets other threads, e.g. an asyncio event loop, run
+        for sample in range(n_samples):
+            if has_offsets:
+                _seek(ptr, record_offsets[sample], SEEK_SET)
+            _read(&SampBytes[sample], 4, 1, ptr)
+            _read(&Time[sample], 4, 1, ptr)
+            _read(&MSec[sample], 4, 1, ptr)
+            if file_version > 1.0:
+                _read(&QF[sample], 1, 1, ptr)
+            _read(&RR[sample], 4, 1, ptr)
+            _read(&RelHum[sample], 4, 1, ptr)
+            _read(&EnvTemp[sample], 4, 1, ptr)
+            _read(&BaroP[sample], 4, 1, ptr)
+            _read(&WS[sample], 4, 1, ptr)
+            _read(&WD[sample], 4, 1, ptr)
+            _read(&DDVolt[sample], 4, 1, ptr)
+            _read(&DDTb[sample], 4, 1, ptr)
+            _read(&LWP[sample], 4, 1, ptr)
+            _read(&PowIF[sample], 4, 1, ptr)
+            _read(&Elev[sample], 4, 1, ptr)
+            _read(&Azi[sample], 4, 1, ptr)
+            _read(&Status[sample], 4, 1, ptr)
+            _read(&TransPow[sample], 4, 1, ptr)
+            _read(&TransT[sample], 4, 1, ptr)
+            _read(&RecT[sample], 4, 1, ptr)
+            _read(&PCT[sample], 4, 1, ptr)
+            if file_version == 1.0:
+                _seek(ptr, 3 * 4, SEEK_CUR)
+                _read(&RadC[sample], 4, 1, ptr)
+                _seek(ptr, n_chirps * 4, SEEK_CUR)
+            else:
+                _seek(ptr, n_dummy * 4, SEEK_CUR)  # this chunk contains data (temp profile etc.)
+
+            _read(is_data, 1, n_levels, ptr)
+
+            for alt_ind in range(n_levels):
+
+                if is_data[alt_ind] == 1:
+                    n_gates_with_data += 1
+                    _read(&Ze[sample, alt_ind], 4, 1, ptr)
+                    _read(&MeanVel[sample, alt_ind], 4, 1, ptr)
+                    _read(&SpecWidth[sample, alt_ind], 4, 1, ptr)
+                    _read(&Skewn[sample, alt_ind], 4, 1, ptr)
+                    _read(&Kurt[sample, alt_ind], 4, 1, ptr)
+                    if file_version == 1.0:
+                        _seek(ptr, n_samples_at_each_height[alt_ind] * 4, SEEK_CUR)
+                    else:
+                        if polarization > 0:
+                            _read(&RefRat[sample, alt_ind], 4, 1, ptr)
+                            _read(&CorrCoeff[sample, alt_ind], 4, 1, ptr)
+                            _read(&DiffPh[sample, alt_ind], 4, 1, ptr)
+
+                        if  polarization == 2:
+                            _seek(ptr, 4, SEEK_CUR)
+                            _read(&SLDR[sample, alt_ind], 4, 1, ptr)
+                            _read(&SCorrCoeff[sample, alt_ind], 4, 1, ptr)
+                            _read(&KDP[sample, alt_ind], 4, 1, ptr)
+                            _read(&DiffAtt[sample, alt_ind], 4, 1, ptr)
+
+    current_position = end_position = _tell(ptr)
+    if offsets is None:
+        _seek(ptr, 0, SEEK_END)
+        end_position = _tell(ptr)
+    _close(ptr)
+    free(is_data)
+    free(n_samples_at_each_height)
+    _check(buffer)
+    if offsets is None:
+        bytes_read = end_position
+    else:
+        bytes_read = 4 * n_samples + int(np.sum(SampBytes, dtype=np.int64))
+    instrumentation.add_counts(bytes_read=bytes_read, n_samples=n_samples,
+                               n_gates_with_data=n_gates_with_data)
     if current_position != end_position:
         raise RPGFileError('File position is not at the end of the file.')
 
-    fclose(ptr)
-    free(is_data)
+    _validate(header, np.asarray(Time), None, None, validation, report)
+
+    return {key: np.asarray(out[key]) for key in _get_valid_l1_keys(header)}
 
-    var_names = locals()
-    keys = _get_valid_l1_keys(header)
 
-    return {key: np.asarray(var_names[key]) for key in keys}
+def _init_l1_arrays(header: dict, n_samples: int) -> dict:
+    """Allocates output arrays of the LV1 decoder."""
+    arrays = _init_housekeeping_arrays(n_samples)
+    for key in _get_valid_l1_keys(header):
+        if key not in arrays:
+            arrays[key] = np.zeros((n_samples, header['RAltN']), np.float32)
+    return arrays
 
 
 def _get_valid_l1_keys(header: dict) -> list:
@@ -421,11 +1498,42 @@ def _get_valid_l1_keys(header: dict) -> list:
     return keys
 
 
-def _check_timestamp(timestamp: int, header: dict):
-    """Checks if timestamp is within the expected range."""
-    try:
-        if not (header['StartTime'] <= timestamp <= header['StopTime']):
-            raise RPGFileError(f'Timestamp {timestamp} is outside the expected range '
-            f'[{header["StartTime"]}, {header["StopTime"]}].')
-    except KeyError:
+def _validate(header: dict, time: np.ndarray, block_error: np.ndarray | None,
+              block_gate: np.ndarray | None, validation: str,
+              report: list | None) -> None:
+    """Checks decoded records in one vectorized pass and handles the problems.
+
+    Problems are timestamps outside the StartTime / StopTime range of the header
+    and records with invalid block indices. With 'strict' validation, the first
+    problem raises RPGValidationError listing all of them; with 'warn', they are
+    logged. If given, the problems are also appended to `report`.
+    """
+    if validation == 'off' and report is None:
+        return
+    problems = []
+    if 'StartTime' in header and 'StopTime' in header:
+        start, stop = header['StartTime'], header['StopTime']
+        for sample in np.flatnonzero((time < start) | (time > stop)):
+            problems.append(utils.ValidationProblem(
+                int(sample), 'timestamp',
+                f'Timestamp {time[sample]} is outside the expected range '
+                f'[{start}, {stop}].'))
+    if block_error is not None:
+        for sample in np.flatnonzero(block_error):
+            problems.append(utils.ValidationProblem(
+                int(sample), 'block',
+                f'Invalid data at range gate {block_gate[sample]}: '
+                f'{_BLOCK_ERRORS[block_error[sample]]}.'))
+    problems.sort(key=lambda problem: problem.sample)
+    if report is not None:
+        report.extend(problems)
+    if not problems or validation == 'off':
         return
+    if validation == 'strict':
+        raise utils.RPGValidationError(problems)
+    kinds = {}
+    for problem in problems:
+        kinds.setdefault(problem.kind, []).append(problem)
+    for kind_problems in kinds.values():
+        logging.warning(f'{len(kind_problems)} invalid records, first: '
+                        f'sample {kind_problems[0].sample}: {kind_problems[0].message}')
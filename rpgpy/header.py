@@ -1,25 +1,30 @@
 """Module for reading RPG 94 GHz radar header."""
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, BinaryIO
+import os
+from contextlib import AbstractContextManager, nullcontext
+from typing import TYPE_CHECKING, BinaryIO, NamedTuple
 
 import numpy as np
 
 from rpgpy import utils
+from rpgpy.archive import ArchiveMember, is_streamed, open_file
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
     from os import PathLike
 
+    Source = PathLike | str | ArchiveMember | bytes | bytearray | memoryview | BinaryIO
 
-def read_rpg_header(file_name: PathLike) -> tuple[dict, int]:
+
+def read_rpg_header(file_name: Source) -> tuple[dict, int]:
     """Reads header from RPG binary file.
 
     Supports Level 0 (version 2.0, 3.5, 4.0) and Level 1 (version 1.0, 2.0, 3.5, 4.0)
 
     Args:
     ----
-        file_name: name of the file.
+        file_name: name of the file, or its contents, see `get_source`.
 
     Returns:
     -------
@@ -27,13 +32,161 @@ def read_rpg_header(file_name: PathLike) -> tuple[dict, int]:
 
     """
 
-    with open(file_name, "rb") as file:
+    with _open(file_name) as file:
         return _read_header(file)
 
 
-def _read_header(file: BinaryIO) -> tuple[dict, int]:
+def read_n_samples(file_name: Source, header: dict) -> int:
+    """Reads number of samples from RPG binary file without decoding them.
+
+    Args:
+    ----
+        file_name: name of the file, or its contents, see `get_source`.
+        header: header of the file.
+
+    Returns:
+    -------
+        Number of samples in the file.
+
+    """
+    with _open(file_name) as file:
+        file.seek(8 + int(header["HeaderLen"]))
+        return int(_read_array(file, "i4", 1)[0])
+
+
+class RecordIndex(NamedTuple):
+    """Location and timestamp of each sample record in RPG binary file."""
+
+    offset: np.ndarray
+    size: np.ndarray
+    time: np.ndarray
+    msec: np.ndarray
+
+
+def read_record_index(file_name: Source, header: dict) -> RecordIndex:
+    """Finds sample records of RPG binary file without decoding them.
+
+    Args:
+    ----
+        file_name: name of the file, or its contents, see `get_source`.
+        header: header of the file.
+
+    Returns:
+    -------
+        Offsets and sizes (including the SampBytes word) of the records,
+        and their timestamps.
+
+    Raises:
+    ------
+        RPGFileError: A record extends beyond the end of the file.
+
+    """
+    source = get_source(file_name)
+    n_samples = read_n_samples(source, header)
+    offsets = np.empty(n_samples, np.int64)
+    sizes = np.empty(n_samples, np.int64)
+    time = np.empty(n_samples, np.uint32)
+    msec = np.empty(n_samples, np.int32)
+    record_start = np.dtype([("SampBytes", "<i4"), ("Time", "<u4"), ("MSec", "<i4")])
+    with _open(source) as file:
+        position = 12 + int(header["HeaderLen"])
+        for ind in range(n_samples):
+            file.seek(position)
+            record = _read_array(file, record_start, 1)
+            size = 4 + int(record["SampBytes"][0]) if len(record) else 0
+            if size > 4:
+                # the size of a decompressing stream is not known in advance
+                file.seek(position + size - 1)
+            if size <= 4 or not file.read(1):
+                msg = f"Invalid record {ind} at position {position}"
+                raise utils.RPGFileError(msg)
+            offsets[ind], sizes[ind] = position, size
+            time[ind], msec[ind] = record["Time"][0], record["MSec"][0]
+            position += size
+    return RecordIndex(offsets, sizes, time, msec)
+
+
+def get_source(file_name: Source) -> PathLike | str | ArchiveMember | memoryview:
+    """Returns file name as is, or the contents of the file as bytes.
+
+    Args:
+    ----
+        file_name: Name of the file, its contents as a bytes-like object, i.e.,
+            any object supporting the buffer protocol, or a binary file-like
+            object which is read from its current position to the end.
+            Compressed files ('.gz', '.xz' or '.zst') and members of tar
+            archives (`rpgpy.archive.ArchiveMember`) are returned as is and
+            decompressed while they are decoded, see `rpgpy.archive.open_file`.
+
+    Returns:
+    -------
+        The name of a file or archive member, or a 1D memoryview of unsigned
+        bytes sharing the memory of the bytes-like object.
+
+    Raises:
+    ------
+        TypeError: Unsupported type of `file_name`.
+
+    """
+    if isinstance(file_name, (str, os.PathLike, ArchiveMember)):
+        return file_name
+    if hasattr(file_name, "read"):
+        file_name = file_name.read()
+    return memoryview(file_name).cast("B")
+
+
+def get_name(file_name: Source) -> str:
+    """Returns name of the file for logging, or '<buffer>' for its contents."""
+    if isinstance(file_name, (str, os.PathLike, ArchiveMember)):
+        return str(file_name)
+    return "<buffer>"
+
+
+class _BufferFile:
+    """Binary file-like object reading a memoryview without copying it."""
+
+    def __init__(self, buffer: memoryview):
+        self.buffer = buffer
+        self.position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        stop = len(self.buffer) if size < 0 else self.position + size
+        data = self.buffer[self.position : stop].tobytes()
+        self.position += len(data)
+        return data
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self.position
+        elif whence == os.SEEK_END:
+            offset += len(self.buffer)
+        self.position = offset
+        return self.position
+
+    def tell(self) -> int:
+        return self.position
+
+
+def _open(file_name: Source) -> AbstractContextManager:
+    """Opens file for reading, decompressing only what is read of compressed files."""
+    source = get_source(file_name)
+    if isinstance(source, memoryview):
+        return nullcontext(_BufferFile(source))
+    if isinstance(source, ArchiveMember) or is_streamed(source):
+        return open_file(source)
+    return open(source, "rb")
+
+
+def _read_array(file: BinaryIO | _BufferFile, dtype, count: int) -> np.ndarray:
+    """Reads like np.fromfile, also from objects that are not real files."""
+    dtype = np.dtype(dtype)
+    data = file.read(dtype.itemsize * count)
+    return np.frombuffer(data, dtype, len(data) // dtype.itemsize)
+
+
+def _read_header(file: BinaryIO | _BufferFile) -> tuple[dict, int]:
     def read(*fields):
-        block = np.fromfile(file, np.dtype(list(fields)), 1)
+        block = _read_array(file, np.dtype(list(fields)), 1)
         assert block.dtype.names is not None
         for name in block.dtype.names:
             array = block[name][0]
@@ -140,11 +293,11 @@ def _read_header(file: BinaryIO) -> tuple[dict, int]:
             if level == 1 and version > 3.5:
                 read(("InstCalPar", "i4"))
             elif level == 0:
-                _ = np.fromfile(file, "i4")
+                _ = _read_array(file, "i4", 1)
 
             if level == 0 or (level == 1 and version > 3.5):
-                _ = np.fromfile(file, "i4", 24)
-                _ = np.fromfile(file, "uint32", 10000)
+                _ = _read_array(file, "i4", 24)
+                _ = _read_array(file, "uint32", 10000)
 
         if level == 0:
             header["velocity_vectors"] = utils.create_velocity_vectors(header)
@@ -164,13 +317,13 @@ def _read_header(file: BinaryIO) -> tuple[dict, int]:
             ("MaxVel", _dim(n_chirp)),
         )
         read(("CalInt", "i4"), ("AntSep", "f"), ("HPBW", "f"), ("SampDur", "f"))
-        header["TAltN"] = np.array([0])
-        header["HAltN"] = np.array([0])
+        header["TAltN"] = np.int32(0)
+        header["HAltN"] = np.int32(0)
 
         if header["ModelNo"] == 1:
-            header["DualPol"] = np.array([1])
+            header["DualPol"] = np.int8(1)
         else:
-            header["DualPol"] = np.array([0])
+            header["DualPol"] = np.int8(0)
 
     file_position = file.tell()
     return header, file_position
@@ -180,7 +333,7 @@ def _read_string(file_id) -> str:
     """Read characters from binary data until whitespace."""
     str_out = ""
     while True:
-        value = np.fromfile(file_id, np.int8, 1)
+        value = _read_array(file_id, np.int8, 1)
         if value:
             try:
                 str_out += chr(value[0])
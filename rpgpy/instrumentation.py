@@ -0,0 +1,148 @@
+"""Module for collecting per-file timings and counters of rpgpy functions."""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from os import PathLike
+
+    from typing_extensions import Self
+
+    from rpgpy.archive import ArchiveMember
+
+T = TypeVar("T")
+
+
+@dataclass
+class FileRecord:
+    """Statistics of one processed RPG file.
+
+    Attributes:
+        file_name: Name of the RPG binary file.
+        timings: Seconds spent in each phase, e.g. 'header', 'decode', 'moments'
+            and 'write'. Time of netCDF compression is included in 'write'.
+        bytes_read: Size of the decoded data.
+        n_samples: Number of decoded samples.
+        n_gates_with_data: Number of decoded (time, range) points having data.
+    """
+
+    file_name: str
+    timings: dict[str, float] = field(default_factory=dict)
+    bytes_read: int = 0
+    n_samples: int = 0
+    n_gates_with_data: int = 0
+
+
+class Collector:
+    """Collects statistics of the files processed within its context.
+
+    Args:
+    ----
+        callback: Function called with each finished FileRecord, e.g., for
+            reporting progress.
+
+    Examples:
+    --------
+        >>> from rpgpy import rpg2nc
+        >>> from rpgpy.instrumentation import Collector
+        >>> with Collector() as collector:
+                rpg2nc('/path/to/files/*.LV0', 'rpg-file.nc')
+        >>> collector.to_dicts()
+
+    """
+
+    def __init__(self, callback: Callable[[FileRecord], None] | None = None):
+        self.records: list[FileRecord] = []
+        self.callback = callback
+        self._tokens: list = []
+
+    def __enter__(self) -> Self:
+        self._tokens.append(_collector.set(self))
+        return self
+
+    def __exit__(self, *args) -> None:
+        _collector.reset(self._tokens.pop())
+
+    def to_dicts(self) -> list[dict]:
+        """Returns the collected records as dictionaries."""
+        return [asdict(record) for record in self.records]
+
+    def _add(self, record: FileRecord) -> None:
+        self.records.append(record)
+        if self.callback is not None:
+            self.callback(record)
+
+
+_collector: ContextVar[Collector | None] = ContextVar("collector", default=None)
+_record: ContextVar[FileRecord | None] = ContextVar("record", default=None)
+
+
+@contextmanager
+def track_file(
+    file_name: PathLike | str | ArchiveMember,
+) -> Iterator[FileRecord | None]:
+    """Starts a new record, unless the same file is already being tracked."""
+    collector = _collector.get()
+    current = _record.get()
+    is_tracked = current is not None and current.file_name == str(file_name)
+    if collector is None or is_tracked:
+        yield current
+        return
+    record = FileRecord(str(file_name))
+    token = _record.set(record)
+    try:
+        yield record
+    finally:
+        _record.reset(token)
+        collector._add(record)  # noqa: SLF001
+
+
+@contextmanager
+def track_phase(name: str) -> Iterator[None]:
+    """Adds the time spent within the context to the current record."""
+    record = _record.get()
+    if record is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        record.timings[name] = record.timings.get(name, 0.0) + elapsed
+
+
+def add_counts(**counts: int) -> None:
+    """Increments the counters of the current record."""
+    record = _record.get()
+    if record is None:
+        return
+    for key, value in counts.items():
+        setattr(record, key, getattr(record, key) + int(value))
+
+
+def run_collected(func: Callable[..., T], *args) -> tuple[T, list[FileRecord]]:
+    """Runs func in a new collector, e.g., in a worker process.
+
+    The context of the caller is not passed to worker processes, so the
+    records are returned with the result and can be added to the collector of
+    the parent process with `add_records`.
+    """
+    with Collector() as collector:
+        result = func(*args)
+    return result, collector.records
+
+
+def add_records(records: list[FileRecord]) -> None:
+    """Adds records collected by `run_collected` to the current collector."""
+    collector = _collector.get()
+    if collector is None:
+        return
+    for record in records:
+        collector._add(record)  # noqa: SLF001
@@ -0,0 +1,163 @@
+"""Module for keeping track of converted files between runs."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from functools import partial
+from typing import TYPE_CHECKING
+
+from rpgpy import instrumentation
+from rpgpy.archive import get_path
+from rpgpy.utils import RPGFileError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from concurrent.futures import Future
+    from os import PathLike
+
+    from rpgpy.archive import ArchiveMember
+
+
+class Manifest:
+    """Record of output files and the input files they were converted from.
+
+    Every input file is stored with its size and modification time, so that an
+    output file is up to date as long as it exists and its inputs are unchanged.
+    The manifest is a JSON Lines file. A line is appended after each added
+    output, so that a run interrupted by a crash can be resumed, and the later
+    line of an output replaces the earlier ones. Lines left incomplete by a
+    crash are ignored, and the file is compacted when it is opened.
+
+    Args:
+    ----
+        path: Manifest file. Created when the first output is added.
+
+    """
+
+    def __init__(self, path: PathLike | str):
+        self.path = os.fspath(path)
+        self.outputs: dict[str, list] = {}
+        if os.path.exists(self.path):
+            with open(self.path) as file:
+                lines = file.readlines()
+            for line in lines:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self.outputs[entry["output"]] = entry["inputs"]
+            if len(lines) > len(self.outputs):
+                self._compact()
+
+    def is_up_to_date(
+        self, inputs: Sequence[PathLike | str], output: PathLike | str
+    ) -> bool:
+        """Checks if output exists and was converted from the current inputs."""
+        key = os.path.abspath(output)
+        if key not in self.outputs or not os.path.exists(output):
+            return False
+        try:
+            return self.outputs[key] == [_stamp(file) for file in inputs]
+        except FileNotFoundError:
+            return False
+
+    def add(self, inputs: Sequence[PathLike | str], output: PathLike | str) -> None:
+        """Records output converted from inputs and appends it to the manifest."""
+        key = os.path.abspath(output)
+        self.outputs[key] = [_stamp(file) for file in inputs]
+        with open(self.path, "a") as file:
+            file.write(_format_line(key, self.outputs[key]))
+
+    def _compact(self) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as file:
+            file.writelines(
+                _format_line(key, stamps) for key, stamps in self.outputs.items()
+            )
+        os.replace(tmp_path, self.path)
+
+
+def run_conversions(
+    tasks: Sequence[tuple[Callable, tuple, Sequence[PathLike | str], PathLike | str]],
+    manifest: Manifest | None = None,
+    jobs: int = 1,
+) -> list[str]:
+    """Runs conversion tasks, skipping those whose output is up to date.
+
+    Args:
+    ----
+        tasks: Tuples of function, its arguments, input files and output file.
+        manifest: Manifest used for skipping and recording the tasks.
+            Default is None, i.e., all tasks are run.
+        jobs: Number of parallel worker processes. Default is 1.
+
+    Returns:
+    -------
+        Output files of the tasks that were run successfully, in the order of
+        the tasks. Tasks failing with an invalid input file are logged and
+        skipped, their partial output file is removed, and the other tasks are
+        still run. Other errors, e.g. of a full disk, are raised.
+
+    Raises:
+    ------
+        ValueError: Invalid `jobs`.
+
+    """
+    if jobs < 1:
+        msg = "jobs must be positive"
+        raise ValueError(msg)
+    if manifest is not None:
+        n_tasks = len(tasks)
+        tasks = [task for task in tasks if not manifest.is_up_to_date(*task[2:])]
+        msg = f"Skipping {n_tasks - len(tasks)} up-to-date files"
+        logging.info(msg)
+    done = [False] * len(tasks)
+
+    def finish(ind: int, run: Callable[[], object]) -> None:
+        _, _, inputs, output = tasks[ind]
+        try:
+            run()
+        except (IndexError, RPGFileError) as err:
+            msg = f"############### File {output} has not been converted: {err}"
+            logging.warning(msg)
+            with suppress(FileNotFoundError):
+                os.remove(output)
+            return
+        msg = f"Wrote {output}"
+        logging.info(msg)
+        if manifest is not None:
+            manifest.add(inputs, output)
+        done[ind] = True
+
+    if jobs == 1:
+        for ind, (func, args, _, _) in enumerate(tasks):
+            finish(ind, partial(func, *args))
+    else:
+        with ProcessPoolExecutor(jobs) as executor:
+            futures = [
+                executor.submit(instrumentation.run_collected, func, *args)
+                for func, args, _, _ in tasks
+            ]
+            for ind, future in enumerate(futures):
+                finish(ind, partial(_get_result, future))
+    return [os.fspath(task[3]) for task, ok in zip(tasks, done, strict=True) if ok]
+
+
+def _get_result(future: Future) -> object:
+    result, records = future.result()
+    instrumentation.add_records(records)
+    return result
+
+
+def _format_line(output: str, stamps: list) -> str:
+    return json.dumps({"output": output, "inputs": stamps}) + "\n"
+
+
+def _stamp(file_name: PathLike | str | ArchiveMember) -> list:
+    path = get_path(file_name)
+    stat = os.stat(path)
+    return [os.path.abspath(path), stat.st_size, stat.st_mtime_ns]
@@ -0,0 +1,170 @@
+"""Module for estimating memory usage and processing RPG binary files in chunks."""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from rpgpy import data as rpg_data
+from rpgpy import header as head
+from rpgpy import instrumentation, utils
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from os import PathLike
+
+    from rpgpy.archive import ArchiveMember
+
+_OPERATIONS = ("read_rpg", "spectra2moments", "rpg2nc")
+
+# bytes per (time, range) value of the spectra2moments output and temporaries:
+# five float32 moments and the no-signal mask
+_MOMENT_BYTES = 5 * 4 + 1
+
+# bytes per (time, range) value of the float32 velocity offsets of dealiasing
+_DEALIAS_BYTES = 4
+
+
+class MemoryEstimate(NamedTuple):
+    """Predicted peak memory in bytes of processing RPG binary file(s).
+
+    The estimates include the decoded arrays and the largest temporary arrays of
+    each step, but not the memory of the Python interpreter and the imported
+    libraries.
+
+    Attributes:
+        read_rpg: Peak memory of `read_rpg`.
+        spectra2moments: Peak memory of `read_rpg` followed by `spectra2moments`,
+            as in `spectra2nc`. Same as `read_rpg` for Level 1 files.
+        rpg2nc: Peak memory of `rpg2nc`.
+    """
+
+    read_rpg: int
+    spectra2moments: int
+    rpg2nc: int
+
+
+def estimate_memory(
+    file_names: PathLike | str | Iterable[PathLike | str],
+    *,
+    dealias: bool = False,
+) -> MemoryEstimate:
+    """Predicts the peak memory of processing RPG binary file(s).
+
+    Only the headers and the sample counts of the files are read. The high-level
+    functions process one file at a time, so the estimate of several files is
+    the maximum of the estimates of the individual files.
+
+    Args:
+    ----
+        file_names: RPG Level 1 / Level 0 binary file or list of files.
+        dealias: If True, estimates `spectra2moments` with `dealias=True`.
+            Default is False.
+
+    Returns:
+    -------
+        Estimated peak memory in bytes of each operation.
+
+    Examples:
+    --------
+        >>> from rpgpy.memory import estimate_memory
+        >>> estimate = estimate_memory(['rpg-data-1.LV0', 'rpg-data-2.LV0'])
+
+    """
+    if isinstance(file_names, (str, os.PathLike)):
+        file_names = [file_names]
+    estimates = []
+    for file_name in file_names:
+        header, _ = head.read_rpg_header(file_name)
+        n_samples = head.read_n_samples(file_name, header)
+        estimates.append(_estimate(header, n_samples, dealias=dealias))
+    return MemoryEstimate(
+        *(max(values, default=0) for values in zip(*estimates, strict=True))
+    )
+
+
+def read_chunks(
+    file_name: PathLike | str | ArchiveMember,
+    operation: str,
+    memory_budget: int | None,
+    spectra_layout: str = "padded",
+    samples: slice | np.ndarray | None = None,
+) -> Iterator[tuple[dict, dict]]:
+    """Reads RPG binary file at once or, if it does not fit the budget, in chunks.
+
+    Args:
+    ----
+        file_name: File name, possibly compressed, or member of a tar archive.
+        operation: Operation the data are read for, one of 'read_rpg',
+            'spectra2moments' and 'rpg2nc'.
+        memory_budget: Maximum estimated peak memory in bytes. If the estimate of
+            the whole file is larger, the file is decoded in chunks of samples
+            whose estimate fits the budget. Default is None, i.e., no limit.
+        spectra_layout: Layout of the Level 0 spectra, see `read_rpg`.
+        samples: Slice or indices of the samples to read, in the order they are
+            returned. Default is None, i.e., all samples.
+
+    Yields:
+    ------
+        2-element tuple containing header (dict) and data (dict) of consecutive
+        samples, using the RPG naming scheme.
+
+    Raises:
+    ------
+        ValueError: Invalid `operation` or `memory_budget`.
+
+    """
+    if operation not in _OPERATIONS:
+        msg = f"operation must be one of {_OPERATIONS}"
+        raise ValueError(msg)
+    if memory_budget is not None and memory_budget < 1:
+        msg = "memory_budget must be positive"
+        raise ValueError(msg)
+    if memory_budget is None and samples is None:
+        yield rpg_data.read_rpg(file_name, spectra_layout=spectra_layout)
+        return
+    source = head.get_source(file_name)
+    header, _ = head.read_rpg_header(source)
+    n_samples = head.read_n_samples(source, header)
+    sample_bytes = getattr(_estimate(header, 1), operation)
+    if samples is None and n_samples * sample_bytes <= memory_budget:
+        yield rpg_data.read_rpg(source, spectra_layout=spectra_layout)
+        return
+    offsets = head.read_record_index(source, header).offset
+    if samples is not None:
+        offsets = offsets[samples]
+    n_selected = len(offsets)
+    if memory_budget is None or n_selected * sample_bytes <= memory_budget:
+        samples_per_chunk = max(n_selected, 1)
+    else:
+        samples_per_chunk = max(1, memory_budget // sample_bytes)
+        msg = f"Reading {file_name} in chunks of {samples_per_chunk} samples"
+        logging.info(msg)
+    for ind in range(0, n_selected, samples_per_chunk):
+        with instrumentation.track_phase("decode"):
+            data = rpg_data.read_records(
+                source,
+                header,
+                offsets[ind : ind + samples_per_chunk],
+                spectra_layout=spectra_layout,
+            )
+        yield header, data
+
+
+def _estimate(header: dict, n_samples: int, *, dealias: bool = False) -> MemoryEstimate:
+    arrays = rpg_data._init_arrays(header, 1)  # noqa: SLF001
+    decoded = n_samples * sum(array.nbytes for array in arrays.values())
+    largest = n_samples * max(array.nbytes for array in arrays.values())
+    level, _ = utils.get_rpg_file_type(header)
+    moments = decoded
+    if level == 0:
+        ranges = np.diff(np.append(header["RngOffs"], header["RAltN"]))
+        # comparison of the spectra of one chirp with zero
+        no_signal = int(np.max(ranges * header["SpecN"]))
+        gate_bytes = _MOMENT_BYTES + _DEALIAS_BYTES if dealias else _MOMENT_BYTES
+        moments += n_samples * (int(header["RAltN"]) * gate_bytes + no_signal)
+    # netCDF4 converts the written arrays one variable at a time
+    return MemoryEstimate(decoded, moments, decoded + largest)
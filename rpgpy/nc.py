@@ -1,11 +1,12 @@
 """Module for writing netCDF file."""
 from __future__ import annotations
 
-import glob
+import itertools
 import logging
 import os
 import uuid
-from typing import TYPE_CHECKING
+from functools import partial
+from typing import TYPE_CHECKING, NamedTuple
 
 import netCDF4
 import numpy as np
@@ -14,12 +15,16 @@ from numpy.testing import assert_array_almost_equal
 from tqdm import tqdm
 
 import rpgpy.metadata
-from rpgpy import read_rpg, utils, version
+from rpgpy import archive, instrumentation, utils, version
+from rpgpy import header as head
+from rpgpy.manifest import Manifest, run_conversions
+from rpgpy.memory import read_chunks
 from rpgpy.spcutil import spectra2moments
 
 SKIP_ME = ("ProgName", "CustName", "HAlts", "TAlts", "StartTime", "StopTime")
 
 if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable, Iterator
     from os import PathLike
 
 
@@ -28,6 +33,8 @@ def spectra2nc(
     output_file: PathLike | str,
     n_points_min: int = 4,
     global_attr: dict | None = None,
+    *,
+    memory_budget: int | None = None,
 ) -> None:
     """Calculates moments from RPG Level 0 file and writes netCDF4 file.
 
@@ -37,18 +44,33 @@ def spectra2nc(
         output_file: Name of the output file.
         n_points_min: Number of points in a valid spectral line. Default is 4.
         global_attr: Additional global attributes.
+        memory_budget: Maximum estimated peak memory in bytes, see
+            `rpgpy.memory.estimate_memory`. If the file does not fit, it is
+            processed in chunks of samples. Default is None, i.e., no limit.
 
     """
-    with netCDF4.Dataset(output_file, "w", format="NETCDF4_CLASSIC") as f:
-        header, data = read_rpg(input_file)
-        moments = spectra2moments(data, header, fill_value=0, n_points_min=n_points_min)
-        data = {key: data[key] for key, array in data.items() if array.ndim == 1}
-        data = {**data, **moments}
-        metadata = rpgpy.metadata.METADATA
-        logging.info("Writing compressed netCDF4 file")
-        _create_dimensions(f, header, level=0)
-        _write_initial_data(f, header, metadata)
-        _write_initial_data(f, data, metadata)
+    with (
+        instrumentation.track_file(input_file),
+        netCDF4.Dataset(output_file, "w", format="NETCDF4_CLASSIC") as f,
+    ):
+        for ind, (header, spectra) in enumerate(
+            read_chunks(input_file, "spectra2moments", memory_budget)
+        ):
+            with instrumentation.track_phase("moments"):
+                moments = spectra2moments(
+                    spectra, header, fill_value=0, n_points_min=n_points_min
+                )
+            data = {key: array for key, array in spectra.items() if array.ndim == 1}
+            data = {**data, **moments}
+            metadata = rpgpy.metadata.METADATA
+            with instrumentation.track_phase("write"):
+                if ind > 0:
+                    _append_data(f, data, metadata)
+                    continue
+                logging.info("Writing compressed netCDF4 file")
+                _create_dimensions(f, header, level=0)
+                _write_header(f, header, metadata, level=0)
+                _write_initial_data(f, data, metadata)
         _create_global_attributes(f, header, global_attr)
 
 
@@ -56,6 +78,12 @@ def rpg2nc(
     path_to_files: PathLike | str,
     output_file: PathLike | str,
     global_attr: dict | None = None,
+    *,
+    progress: bool = True,
+    overview_levels: int = 0,
+    spectra_layout: str = "padded",
+    memory_budget: int | None = None,
+    merge: bool = False,
 ) -> None:
     """Converts RPG binary files into a netCDF4 file.
 
@@ -66,27 +94,376 @@ def rpg2nc(
             E.g. '/path/to/data/*.LV0'
         output_file: Name of the output file.
         global_attr: Additional global attributes.
+        progress: If True, shows a progress bar when converting several files.
+            Default is True.
+        overview_levels: Number of overview files with 2, 4, 8... times coarser
+            time resolution of the Level 1 moments, or the Level 0 sensitivity
+            limits and noise powers. The overviews are computed in the same pass
+            and written next to the output file, e.g. 'rpg-file_x2.nc'. Default
+            is 0.
+        spectra_layout: Layout of the Level 0 spectra, see `read_rpg`. With 'chirp',
+            each spectral variable is written as one variable per chirp, e.g.
+            'doppler_spectrum_c1', with dimensions (time, range_c1, spectrum_c1).
+            Default is 'padded'.
+        memory_budget: Maximum estimated peak memory in bytes, see
+            `rpgpy.memory.estimate_memory`. Files that do not fit are converted
+            in chunks of samples. Default is None, i.e., no limit.
+        merge: If True, the files are written in the order of their StartTime.
+            Samples of files whose time ranges overlap are merged by time, and
+            duplicate samples, having the same Time and MSec, are written only
+            once. Default is False, i.e., the files are written in the order of
+            their names.
 
     """
-    files, level = _get_rpg_files(path_to_files)
-    with netCDF4.Dataset(output_file, "w", format="NETCDF4_CLASSIC") as f:
-        header, data = read_rpg(files[0])
-        metadata = rpgpy.metadata.METADATA
-        metadata = _fix_metadata(metadata, header)
-        logging.info("Writing compressed netCDF4 file")
-        _create_dimensions(f, header, level)
-        _write_initial_data(f, header, metadata)
-        _write_initial_data(f, data, metadata)
-        if len(files) > 1:
-            for file in tqdm(files[1:]):
-                header, data = read_rpg(file)
-                _check_header_consistency(f, header)
-                _append_data(f, data, metadata)
-        _create_global_attributes(f, header, global_attr)
+    for _ in _convert_files(
+        path_to_files,
+        output_file,
+        global_attr,
+        progress=progress,
+        overview_levels=overview_levels,
+        spectra_layout=spectra_layout,
+        memory_budget=memory_budget,
+        merge=merge,
+    ):
+        pass
+
+
+def _convert_files(
+    path_to_files: PathLike | str,
+    output_file: PathLike | str,
+    global_attr: dict | None,
+    *,
+    progress: bool,
+    overview_levels: int,
+    spectra_layout: str = "padded",
+    memory_budget: int | None = None,
+    merge: bool = False,
+) -> Generator[str | archive.ArchiveMember, None, None]:
+    """Converts RPG binary files into a netCDF4 file, yielding after each file."""
+    files, _ = _get_rpg_files(path_to_files)
+    yield from _convert_parts(
+        [_FilePart(file) for file in files],
+        output_file,
+        global_attr,
+        progress=progress,
+        overview_levels=overview_levels,
+        spectra_layout=spectra_layout,
+        memory_budget=memory_budget,
+        merge=merge,
+    )
+
+
+class _FilePart(NamedTuple):
+    """Samples of RPG binary file, by default all of them."""
+
+    file: str | archive.ArchiveMember
+    samples: slice | np.ndarray | None = None
+
+
+def _merge_parts(parts: list[_FilePart]) -> list[_FilePart]:
+    """Orders parts of RPG binary files by time and drops duplicate samples.
+
+    Parts are sorted by their StartTime. Only the records of parts whose time
+    ranges overlap are indexed, without decoding them, and merged by time.
+    Samples are compared by their Time and MSec only: of samples having the
+    same timestamp, the one of the earliest starting part is kept, even if
+    their data differ. Parts left without samples are not read at all.
+    """
+    headers = [head.read_rpg_header(part.file)[0] for part in parts]
+    samples: list[tuple[np.ndarray, np.ndarray] | None] = [
+        None
+        if part.samples is None and "StartTime" in header
+        else _get_samples(part, header)
+        for part, header in zip(parts, headers, strict=True)
+    ]
+    ranges = [
+        _get_time_range(header, part_samples)
+        for header, part_samples in zip(headers, samples, strict=True)
+    ]
+    order = sorted(range(len(parts)), key=lambda ind: ranges[ind][0])
+    groups: list[list[int]] = []
+    group_stop = None
+    for ind in order:
+        start, stop = ranges[ind]
+        if group_stop is not None and start <= group_stop:
+            groups[-1].append(ind)
+            group_stop = max(group_stop, stop)
+        else:
+            groups.append([ind])
+            group_stop = stop
+    merged = []
+    for group in groups:
+        if len(group) == 1:
+            merged.append(parts[group[0]])
+            continue
+        group_samples = []
+        for ind in group:
+            part_samples = samples[ind]
+            if part_samples is None:
+                part_samples = _get_samples(parts[ind], headers[ind])
+            group_samples.append(part_samples)
+        merged.extend(_merge_overlapping([parts[ind] for ind in group], group_samples))
+    if not merged and parts:
+        # none of the files has samples, but the header is still converted
+        merged.append(parts[order[0]])
+    return merged
+
+
+def _get_time_range(
+    header: dict, samples: tuple[np.ndarray, np.ndarray] | None
+) -> tuple[int, int]:
+    if samples is None:
+        return int(header["StartTime"]), int(header["StopTime"])
+    time = samples[0] // 1000
+    if len(time) == 0:
+        return 0, -1
+    return int(time.min()), int(time.max())
+
+
+def _get_samples(part: _FilePart, header: dict) -> tuple[np.ndarray, np.ndarray]:
+    """Returns timestamps in milliseconds and indices of the samples of the part."""
+    index = head.read_record_index(part.file, header)
+    time = index.time.astype(np.int64) * 1000 + index.msec
+    indices = np.arange(len(time))
+    if part.samples is None:
+        return time, indices
+    return time[part.samples], indices[part.samples]
+
+
+def _merge_overlapping(
+    parts: list[_FilePart], samples: list[tuple[np.ndarray, np.ndarray]]
+) -> list[_FilePart]:
+    all_times = np.concatenate([time for time, _ in samples])
+    all_indices = np.concatenate([indices for _, indices in samples])
+    all_part_ids = np.concatenate(
+        [np.full(len(time), part_id) for part_id, (time, _) in enumerate(samples)]
+    )
+    order = np.argsort(all_times, kind="stable")
+    all_times = all_times[order]
+    is_unique = np.diff(all_times, prepend=all_times[:1] - 1) > 0
+    if not np.all(is_unique):
+        msg = f"Skipping {np.count_nonzero(~is_unique)} duplicate samples"
+        logging.info(msg)
+    kept_part_ids = all_part_ids[order][is_unique]
+    kept_indices = all_indices[order][is_unique]
+    if len(kept_indices) == 0:
+        return []
+    bounds = [0, *(np.flatnonzero(np.diff(kept_part_ids)) + 1), len(kept_part_ids)]
+    merged = []
+    for ind0, ind1 in itertools.pairwise(bounds):
+        part_id = int(kept_part_ids[ind0])
+        part, indices = parts[part_id], kept_indices[ind0:ind1]
+        if np.array_equal(indices, samples[part_id][1]):
+            merged.append(part)
+        elif np.all(np.diff(indices) == 1):
+            selected = slice(int(indices[0]), int(indices[-1]) + 1)
+            merged.append(_FilePart(part.file, selected))
+        else:
+            merged.append(_FilePart(part.file, indices))
+    return merged
+
+
+def _convert_parts(
+    parts: list[_FilePart],
+    output_file: PathLike | str,
+    global_attr: dict | None,
+    *,
+    progress: bool,
+    overview_levels: int,
+    spectra_layout: str = "padded",
+    memory_budget: int | None = None,
+    merge: bool = False,
+) -> Iterator[str | archive.ArchiveMember]:
+    """Converts parts of RPG binary files into a netCDF4 file, yielding after each.
+
+    With `merge`, the parts are first ordered by time, see `_merge_parts`.
+    """
+    if merge:
+        parts = _merge_parts(parts)
+    overview = None
+    metadata = None
+    try:
+        with netCDF4.Dataset(output_file, "w", format="NETCDF4_CLASSIC") as f:
+            for part_ind, part in enumerate(
+                tqdm(parts, disable=not progress or len(parts) == 1)
+            ):
+                with instrumentation.track_file(part.file):
+                    chunks = read_chunks(
+                        part.file, "rpg2nc", memory_budget, spectra_layout, part.samples
+                    )
+                    for ind, (header, data) in enumerate(chunks):
+                        with instrumentation.track_phase("write"):
+                            if part_ind > 0 and ind == 0:
+                                _check_header_consistency(f, header)
+                            if metadata is not None:
+                                _append_data(f, data, metadata)
+                                if overview is not None:
+                                    overview.append(data)
+                                continue
+                            logging.info("Writing compressed netCDF4 file")
+                            metadata = _fix_metadata(rpgpy.metadata.METADATA, header)
+                            level, _ = utils.get_rpg_file_type(header)
+                            _create_dimensions(f, header, level)
+                            _write_header(f, header, metadata, level)
+                            _write_initial_data(f, data, metadata)
+                            if overview_levels > 0:
+                                overview = _Overview(
+                                    output_file, header, metadata, 2, overview_levels
+                                )
+                                overview.append(data)
+                yield part.file
+            _create_global_attributes(f, header, global_attr)
+    except BaseException:
+        if overview is not None:
+            overview.abort()
+        raise
+    if overview is not None:
+        overview.close(global_attr)
     msg = f"Created new file: {output_file}"
     logging.info(msg)
 
 
+# averaged variables of the overviews and the variables whose non-zero values
+# mark the range gates having data
+_OVERVIEW_MASKS = {
+    **dict.fromkeys(
+        (
+            "Ze",
+            "MeanVel",
+            "SpecWidth",
+            "Skewn",
+            "Kurt",
+            "RefRat",
+            "CorrCoeff",
+            "DiffPh",
+            "SLDR",
+            "SCorrCoeff",
+            "KDP",
+            "DiffAtt",
+        ),
+        "Ze",
+    ),
+    **{key: key for key in ("SLv", "SLh", "TotNoisePow", "HNoisePow")},
+}
+
+
+class _Overview:
+    """Writes 2D variables averaged over pairs of samples into a sidecar file.
+
+    Data of each level are passed on to the next, two times coarser, level.
+    Range gate values are averaged over the samples having data, so the number
+    of these samples is carried along with the sums. Level 1 moments have data
+    in the gates where Ze is non-zero, and Level 0 sensitivity limits and noise
+    powers where they are non-zero.
+    """
+
+    def __init__(
+        self,
+        output_file: PathLike | str,
+        header: dict,
+        metadata: dict,
+        factor: int,
+        n_levels: int,
+    ):
+        root, ext = os.path.splitext(str(output_file))
+        self.file_name = f"{root}_x{factor}{ext}"
+        self.header = header
+        self.metadata = metadata
+        self.factor = factor
+        self.f = netCDF4.Dataset(self.file_name, "w", format="NETCDF4_CLASSIC")
+        level, _ = utils.get_rpg_file_type(header)
+        _create_dimensions(self.f, header, level)
+        _write_header(self.f, header, metadata, level)
+        self.pending: tuple[dict, dict] | None = None
+        self.next = (
+            _Overview(output_file, header, metadata, 2 * factor, n_levels - 1)
+            if n_levels > 1
+            else None
+        )
+
+    def append(self, data: dict, counts: dict | None = None) -> None:
+        if counts is None:
+            counts = {
+                key: (data[mask_key] != 0).astype(np.int32)
+                for key, mask_key in _OVERVIEW_MASKS.items()
+                if key in data and mask_key in data
+            }
+        data = {
+            key: array
+            for key, array in data.items()
+            if key in ("Time", "MSec") or key in counts
+        }
+        if self.pending is not None:
+            data, counts = (
+                {key: np.concatenate((old[key], new[key])) for key in new}
+                for old, new in zip(self.pending, (data, counts), strict=True)
+            )
+            self.pending = None
+        n_pairs = len(data["Time"]) // 2
+        if 2 * n_pairs < len(data["Time"]):
+            self.pending = (
+                {key: array[-1:] for key, array in data.items()},
+                {key: array[-1:] for key, array in counts.items()},
+            )
+        if n_pairs > 0:
+            pairs = slice(0, 2 * n_pairs)
+            self._write(
+                {key: array[pairs] for key, array in data.items()},
+                {key: array[pairs] for key, array in counts.items()},
+                2,
+            )
+
+    def abort(self) -> None:
+        self.f.close()
+        if self.next is not None:
+            self.next.abort()
+
+    def close(self, global_attr: dict | None) -> None:
+        if self.pending is not None:
+            data, counts = self.pending
+            self._write(data, counts, 1)
+            self.pending = None
+        if self.next is not None:
+            self.next.close(global_attr)
+        _create_global_attributes(self.f, self.header, global_attr)
+        self.f.time_decimation = self.factor
+        self.f.close()
+        msg = f"Created new file: {self.file_name}"
+        logging.info(msg)
+
+    def _write(self, data: dict, counts: dict, n_merged: int) -> None:
+        coarse, coarse_counts = {}, {}
+        for key, array in data.items():
+            if key in counts:
+                shape = (-1, n_merged, *array.shape[1:])
+                weights = counts[key].reshape(shape)
+                sums = np.sum(array.reshape(shape) * weights, axis=1)
+                coarse_counts[key] = np.sum(weights, axis=1)
+                coarse[key] = np.divide(
+                    sums,
+                    coarse_counts[key],
+                    out=np.zeros(sums.shape, dtype=np.float32),
+                    where=coarse_counts[key] > 0,
+                )
+            else:
+                coarse[key] = array[::n_merged]
+        if "time" not in self.f.variables:
+            for key, array in coarse.items():
+                var = self.f.createVariable(
+                    self.metadata[key].name,
+                    _get_dtype(array),
+                    ("time", "range")[: array.ndim],
+                    zlib=True,
+                    fill_value=0 if array.ndim > 1 else None,
+                )
+                _set_attributes(var, key, self.metadata)
+        ind0 = len(self.f.variables["time"])
+        for key, array in coarse.items():
+            self.f.variables[self.metadata[key].name][ind0 : ind0 + len(array)] = array
+        if self.next is not None:
+            self.next.append(coarse, coarse_counts)
+
+
 def rpg2nc_multi(
     file_directory: PathLike | str | None = None,
     output_directory: PathLike | str | None = None,
@@ -95,6 +472,9 @@ def rpg2nc_multi(
     *,
     include_lv0: bool = True,
     recursive: bool = True,
+    jobs: int = 1,
+    manifest: PathLike | str | None = None,
+    memory_budget: int | None = None,
 ) -> list:
     """Converts several RPG binary files individually.
 
@@ -114,35 +494,172 @@ def rpg2nc_multi(
         recursive: If False, does not search recursively. Default is True.
         base_name: Base name for new filenames.
         global_attr: Additional global attributes.
+        jobs: Number of files converted in parallel worker processes. Default is 1.
+        manifest: JSON Lines file recording the converted files. If given, files
+            whose output exists and which have not changed since they were
+            recorded are skipped. Default is None.
+        memory_budget: Maximum estimated peak memory in bytes of each conversion,
+            see `rpg2nc`. Default is None, i.e., no limit.
 
     Returns:
     -------
         A list containing the full paths of the created netCDF files.
 
     """
-    new_files = []
     if file_directory is None:
         file_directory = os.getcwd()
     if output_directory is None:
         output_directory = os.getcwd()
+    prefix = f"{base_name}_" if base_name is not None else ""
+    convert = partial(rpg2nc, memory_budget=memory_budget)
+    tasks = []
     for filepath in _generator_files(
         file_directory, include_lv0=include_lv0, recursive=recursive
     ):
-        msg = f"Converting {filepath}"
-        logging.info(msg)
-        try:
-            prefix = f"{base_name}_" if base_name is not None else ""
-            new_filename = f"{output_directory}/{prefix}{_new_filename(filepath)}"
-            rpg2nc(filepath, new_filename, global_attr)
-            new_files.append(new_filename)
-        except IndexError as err:
-            msg = f"############### File {filepath} has not been converted: {err}"
-            logging.warning(msg)
+        new_filename = f"{output_directory}/{prefix}{_new_filename(filepath)}"
+        tasks.append(
+            (
+                convert,
+                (filepath, new_filename, global_attr),
+                [archive.get_path(filepath)],
+                new_filename,
+            )
+        )
+    new_files = run_conversions(
+        tasks, Manifest(manifest) if manifest is not None else None, jobs
+    )
     msg = f"Converted {len(new_files)} files"
     logging.info(msg)
     return new_files
 
 
+def rpg2nc_daily(
+    path_to_files: PathLike | str | Iterable[PathLike | str],
+    output_directory: PathLike | str | None = None,
+    global_attr: dict | None = None,
+    base_name: str | None = None,
+    *,
+    jobs: int = 1,
+    manifest: PathLike | str | None = None,
+    spectra_layout: str = "padded",
+    memory_budget: int | None = None,
+    merge: bool = False,
+) -> list:
+    """Converts RPG binary files of any number of days into one netCDF4 file per day.
+
+    The samples are grouped by UTC date using the StartTime and StopTime of the
+    file headers. Files crossing midnight are split at the first sample of the
+    next day, which is found by scanning the record timestamps of these files
+    only. The files of each day are written in the order of their first samples.
+
+    Args:
+    ----
+        path_to_files: RPG binary files of the same level, given as one or several
+            file names, optionally with wildcards, e.g. '/path/to/data/*.LV1'.
+        output_directory: Directory where the files, named by date, e.g.
+            '20230401.nc', are written. Default is the current working directory.
+        global_attr: Additional global attributes.
+        base_name: Base name for new filenames, e.g. 'base_20230401.nc'.
+        jobs: Number of days converted in parallel worker processes. Default is 1.
+        manifest: JSON Lines file recording the converted days. If given, days
+            whose output exists and whose files have not changed since they were
+            recorded are skipped. Default is None.
+        spectra_layout: Layout of the Level 0 spectra, see `rpg2nc`.
+        memory_budget: Maximum estimated peak memory in bytes of converting a
+            file, see `rpg2nc`. Default is None, i.e., no limit.
+        merge: If True, samples of files whose time ranges overlap are merged
+            by time and duplicate samples are dropped, see `rpg2nc`. Default is
+            False.
+
+    Returns:
+    -------
+        A list containing the full paths of the created netCDF files.
+
+    Examples:
+    --------
+        >>> from rpgpy import rpg2nc_daily
+        >>> rpg2nc_daily('/path/to/2023/*/*.LV1', '/path/to/output', jobs=4)
+
+    """
+    if output_directory is None:
+        output_directory = os.getcwd()
+    files, _ = _get_rpg_files(path_to_files)
+    prefix = f"{base_name}_" if base_name is not None else ""
+    convert = partial(
+        _convert_day,
+        spectra_layout=spectra_layout,
+        memory_budget=memory_budget,
+        merge=merge,
+    )
+    tasks = []
+    for date, parts in _split_days(files).items():
+        name = date.replace("-", "")
+        new_filename = os.path.join(output_directory, f"{prefix}{name}.nc")
+        inputs = list(dict.fromkeys(archive.get_path(part.file) for part in parts))
+        tasks.append(
+            (convert, (parts, new_filename, global_attr), inputs, new_filename)
+        )
+    new_files = run_conversions(
+        tasks, Manifest(manifest) if manifest is not None else None, jobs
+    )
+    msg = f"Converted {len(new_files)} days"
+    logging.info(msg)
+    return new_files
+
+
+def _convert_day(
+    parts: list[_FilePart],
+    output_file: str,
+    global_attr: dict | None,
+    *,
+    spectra_layout: str,
+    memory_budget: int | None,
+    merge: bool,
+) -> None:
+    for _ in _convert_parts(
+        parts,
+        output_file,
+        global_attr,
+        progress=False,
+        overview_levels=0,
+        spectra_layout=spectra_layout,
+        memory_budget=memory_budget,
+        merge=merge,
+    ):
+        pass
+
+
+def _split_days(files: list) -> dict[str, list[_FilePart]]:
+    """Groups the samples of RPG binary files by UTC date, e.g. '2023-04-01'.
+
+    Only files without StartTime / StopTime, or whose StartTime and StopTime are
+    on different dates, are scanned for the timestamps of their records.
+    """
+    days: dict[str, list[tuple[int, _FilePart]]] = {}
+    for file in files:
+        header, _ = head.read_rpg_header(file)
+        if "StartTime" in header:
+            time = np.array([header["StartTime"], header["StopTime"]])
+            start, stop = _get_dates(time)
+            if start == stop:
+                days.setdefault(str(start), []).append((int(time[0]), _FilePart(file)))
+                continue
+        time = head.read_record_index(file, header).time
+        dates = _get_dates(time)
+        bounds = [0, *(np.flatnonzero(dates[1:] != dates[:-1]) + 1), len(dates)]
+        for ind0, ind1 in itertools.pairwise(bounds):
+            part = _FilePart(file, slice(int(ind0), int(ind1)))
+            days.setdefault(str(dates[ind0]), []).append((int(time[ind0]), part))
+    return {
+        date: [part for _, part in sorted(parts, key=lambda item: item[0])]
+        for date, parts in sorted(days.items())
+    }
+
+
+def _get_dates(time: np.ndarray) -> np.ndarray:
+    return utils.rpg_seconds2datetime64(time).astype("datetime64[D]")
+
+
 def _check_header_consistency(f: netCDF4.Dataset, header: dict) -> None:
     """Checks if header data is identical in all converted files."""
     for key, array in header.items():
@@ -157,25 +674,63 @@ def _check_header_consistency(f: netCDF4.Dataset, header: dict) -> None:
 def _create_dimensions(f: netCDF4.Dataset, header: dict, level: int) -> None:
     f.createDimension("time", None)
     f.createDimension("range", header["RAltN"])
+    f.createDimension("chirp", header["SequN"])
     if level == 0:
         f.createDimension("spectrum", max(header["SpecN"]))
-        f.createDimension("chirp", header["SequN"])
+
+
+def _write_header(f: netCDF4.Dataset, header: dict, metadata: dict, level: int) -> None:
+    for key, array in header.items():
+        if key not in SKIP_ME:
+            dims = _get_header_dims(key, array, level)
+            _write_variable(f, key, array, dims, metadata)
 
 
 def _write_initial_data(f: netCDF4.Dataset, data: dict, metadata: dict) -> None:
     for key, array in data.items():
         if key in SKIP_ME:
             continue
-        fill_value = 0 if array.ndim > 1 and not ma.isMaskedArray(array) else None
+        if isinstance(array, tuple):
+            _write_chirp_data(f, key, array, metadata)
+            continue
+        dims = ("time", "range", "spectrum")[: array.ndim]
+        _write_variable(f, key, array, dims, metadata)
+
+
+def _write_variable(
+    f: netCDF4.Dataset, key: str, array: np.ndarray, dims: tuple, metadata: dict
+) -> None:
+    fill_value = 0 if array.ndim > 1 and not ma.isMaskedArray(array) else None
+    var = f.createVariable(
+        metadata[key].name,
+        _get_dtype(array),
+        dims,
+        zlib=True,
+        fill_value=fill_value,
+    )
+    var[:] = array
+    _set_attributes(var, key, metadata)
+
+
+def _write_chirp_data(
+    f: netCDF4.Dataset, key: str, arrays: tuple, metadata: dict
+) -> None:
+    """Writes spectra of each chirp into own variable and dimensions."""
+    for ind, array in enumerate(arrays, start=1):
+        dims = ("time", f"range_c{ind}", f"spectrum_c{ind}")
+        for dim, length in zip(dims[1:], array.shape[1:], strict=True):
+            if dim not in f.dimensions:
+                f.createDimension(dim, length)
         var = f.createVariable(
-            metadata[key].name,
+            f"{metadata[key].name}_c{ind}",
             _get_dtype(array),
-            _get_dim(f, array),
+            dims,
             zlib=True,
-            fill_value=fill_value,
+            fill_value=0,
         )
         var[:] = array
         _set_attributes(var, key, metadata)
+        var.chirp = ind
 
 
 def _set_attributes(obj, key: str, metadata: dict) -> None:
@@ -193,7 +748,10 @@ def _append_data(f: netCDF4.Dataset, data: dict, metadata: dict) -> None:
         if key in SKIP_ME:
             continue
         name = metadata[key].name
-        if array.ndim == 1:
+        if isinstance(array, tuple):
+            for ind, chirp_array in enumerate(array, start=1):
+                f.variables[f"{name}_c{ind}"][ind0:ind1, :, :] = chirp_array
+        elif array.ndim == 1:
             f.variables[name][ind0:ind1] = array
         elif array.ndim == 2:
             f.variables[name][ind0:ind1, :] = array
@@ -207,17 +765,27 @@ def _get_dtype(array: np.ndarray) -> str:
     return "f4"
 
 
-def _get_rpg_files(path_to_files: PathLike | str) -> tuple[list, int]:
-    """Returns list of RPG files for one day sorted by filename and level (0 or 1)."""
-    files = glob.glob(str(path_to_files))
-    files.sort()
+def _get_rpg_files(
+    path_to_files: PathLike | str | Iterable[PathLike | str],
+) -> tuple[list, int]:
+    """Returns list of RPG files for one day sorted by filename and level (0 or 1).
+
+    Compressed files and tar archives, or their members, can also be given.
+    Files of several patterns are listed in the order of the patterns.
+    """
+    patterns = (
+        [path_to_files]
+        if isinstance(path_to_files, (str, os.PathLike))
+        else path_to_files
+    )
+    files = [file for pattern in patterns for file in archive.glob_files(pattern)]
     if not files:
         msg = f"No RPG binary files found in {path_to_files}"
         raise RuntimeError(msg)
-    extension = [file[-4:] for file in files]
-    if all(ext.lower() == ".lv1" for ext in extension):
+    extension = [archive.get_extension(file) for file in files]
+    if all(ext == ".lv1" for ext in extension):
         level = 1
-    elif all(ext.lower() == ".lv0" for ext in extension):
+    elif all(ext == ".lv0" for ext in extension):
         level = 0
     else:
         msg = "No consistent RPG level (0 or 1) files found."
@@ -225,19 +793,16 @@ def _get_rpg_files(path_to_files: PathLike | str) -> tuple[list, int]:
     return files, level
 
 
-def _get_dim(f: netCDF4.Dataset, array: np.ndarray) -> tuple:
-    """Finds correct dimensions for a variable."""
+def _get_header_dims(key: str, array: np.ndarray, level: int) -> tuple:
+    """Returns dimensions of a header variable, arrays of one value being scalars."""
     if utils.isscalar(array):
         return ()
-    file_dims = f.dimensions
-
-    def get_dimension(length):
-        for key in file_dims:
-            if file_dims[key].size == length:
-                return key
-        return "time"
-
-    return tuple(get_dimension(length) for length in array.shape)
+    if key in ("RAlts", "Fr"):
+        return ("range",)
+    if key == "velocity_vectors" and level == 0:
+        return ("chirp", "spectrum")
+    # the other arrays have one value per chirp
+    return ("chirp",)
 
 
 def _create_global_attributes(
@@ -261,7 +826,12 @@ def _create_global_attributes(
 def _get_measurement_date(file: netCDF4.Dataset) -> list:
     time = file.variables["time"][:]
     time_ms = file.variables["time_ms"][:]
-    date_times = utils.rpg_seconds2datetime64(time, time_ms)
+    # in Level 1 files shorter than the per-chirp header arrays, which extend
+    # the time dimension, the samples beyond the data are masked
+    is_valid = ~ma.getmaskarray(time)
+    date_times = utils.rpg_seconds2datetime64(
+        ma.getdata(time)[is_valid], ma.getdata(time_ms)[is_valid]
+    )
     dates = np.unique(date_times.astype("datetime64[D]"))
     if len(np.unique(dates)) > 1:
         msg = "More than one date in the file"
@@ -270,20 +840,31 @@ def _get_measurement_date(file: netCDF4.Dataset) -> list:
 
 
 def _generator_files(dir_name: PathLike | str, *, include_lv0: bool, recursive: bool):
-    includes = (".lv1",) if include_lv0 is False else (".lv0", "lv1")
+    """Yields RPG files, also compressed ones and the RPG files in tar archives."""
+    includes = (".lv1",) if include_lv0 is False else (".lv0", ".lv1")
     if recursive is False:
-        for file in os.listdir(dir_name):
-            if file.lower().endswith(includes):
-                yield os.path.join(dir_name, file)
+        paths = (os.path.join(dir_name, file) for file in os.listdir(dir_name))
     else:
-        for subdir, _, files in sorted(os.walk(str(dir_name))):
-            for file in files:
-                if file.lower().endswith(includes):
-                    yield os.path.join(subdir, file)
-
-
-def _new_filename(filepath: str):
-    return f"{os.path.split(filepath)[-1]}.nc"
+        paths = (
+            os.path.join(subdir, file)
+            for subdir, _, files in sorted(os.walk(str(dir_name)))
+            for file in files
+        )
+    for path in paths:
+        if archive.is_tar(path):
+            for member in archive.list_members(path):
+                if archive.get_extension(member) in includes:
+                    yield member
+        elif archive.get_extension(path) in includes:
+            yield path
+
+
+def _new_filename(filepath: str | archive.ArchiveMember):
+    name = filepath.name if isinstance(filepath, archive.ArchiveMember) else filepath
+    name = os.path.basename(name)
+    if archive.is_compressed(name):
+        name = os.path.splitext(name)[0]
+    return f"{name}.nc"
 
 
 def _fix_metadata(metadata: dict, header: dict) -> dict:
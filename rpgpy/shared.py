@@ -0,0 +1,189 @@
+"""Module for decoding RPG binary files into shared memory."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from rpgpy import data as rpg_data
+from rpgpy import header as head
+from rpgpy import instrumentation
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from os import PathLike
+
+_ALIGNMENT = 64
+
+
+class SharedData(NamedTuple):
+    """Handle of decoded data in a shared memory block.
+
+    The handle is small and can be pickled, e.g., returned from a worker
+    process, and the arrays are mapped from the block without copying them.
+
+    Attributes:
+        name: Name of the shared memory block.
+        layout: Byte offset, shape and dtype of each array in the block.
+    """
+
+    name: str
+    layout: dict[str, tuple[int, tuple[int, ...], str]]
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes needed for the arrays."""
+        return _get_size(self.layout)
+
+    @contextmanager
+    def open(self, *, unlink: bool = True) -> Iterator[dict]:
+        """Maps the arrays of the shared memory block.
+
+        The arrays are valid only within the context. Copy the arrays that are
+        needed afterwards.
+
+        Args:
+        ----
+            unlink: If True, the shared memory block is freed when leaving the
+                context. Default is True.
+
+        Yields:
+        ------
+            Data (dict) whose arrays are views of the shared memory block.
+
+        Examples:
+        --------
+            >>> with handle.open() as data:
+                    ze = data['TotSpec'].sum(axis=2)
+
+        """
+        block = shared_memory.SharedMemory(self.name)
+        data = _map_arrays(block, self.layout)
+        try:
+            yield data
+        finally:
+            data.clear()
+            block.close()
+            if unlink:
+                block.unlink()
+
+    def unlink(self) -> None:
+        """Frees the shared memory block without mapping it."""
+        block = shared_memory.SharedMemory(self.name)
+        block.close()
+        block.unlink()
+
+
+def read_rpg_shared(
+    file_name: PathLike | str,
+    *,
+    rpg_names: bool = True,
+    block_name: str | None = None,
+) -> tuple[dict, SharedData]:
+    """Reads RPG Level 1 / Level 0 binary file into shared memory.
+
+    The output arrays are allocated in one `multiprocessing.shared_memory` block
+    and decoded in place. Only a small handle of the block is returned, so that
+    reading in a worker process does not pickle and copy the data to the parent.
+    The block is not freed by this function, see `SharedData.open` and
+    `SharedData.unlink`.
+
+    Args:
+    ----
+        file_name: File name.
+        rpg_names: If True, uses RPG naming scheme for the returned data dict.
+            Otherwise, uses custom names. Default is True.
+        block_name: Name of an existing shared memory block to decode the data
+            into. It must have at least `estimate_shared_size` bytes. Default is
+            None, i.e., a new block is created.
+
+    Returns:
+    -------
+        2-element tuple containing header (dict) and handle of data (SharedData).
+
+    Raises:
+    ------
+        ValueError: The given shared memory block is too small.
+
+    Examples:
+    --------
+        >>> from concurrent.futures import ProcessPoolExecutor
+        >>> from rpgpy.shared import read_rpg_shared
+        >>> with ProcessPoolExecutor() as executor:
+                future = executor.submit(read_rpg_shared, 'rpg-data.LV0')
+        >>> header, handle = future.result()
+        >>> with handle.open() as data:
+                print(data['TotSpec'].shape)
+
+    """
+    with instrumentation.track_file(file_name):
+        with instrumentation.track_phase("header"):
+            header, _ = head.read_rpg_header(file_name)
+        layout = _get_layout(header, head.read_n_samples(file_name, header))
+        size = _get_size(layout)
+        if block_name is None:
+            block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        else:
+            block = shared_memory.SharedMemory(block_name)
+            if block.size < size:
+                block.close()
+                msg = f"Shared memory block has {block.size} bytes, {size} needed"
+                raise ValueError(msg)
+        out = _map_arrays(block, layout)
+        try:
+            if block_name is not None:
+                for array in out.values():
+                    array.fill(0)
+            with instrumentation.track_phase("decode"):
+                rpg_data.read_records(file_name, header, out=out)
+        except BaseException:
+            out.clear()
+            block.close()
+            if block_name is None:
+                block.unlink()
+            raise
+        out.clear()
+        block.close()
+    handle = SharedData(block.name, layout)
+    if not rpg_names:
+        header, layout = rpg_data._change_names(header, layout)  # noqa: SLF001
+        handle = SharedData(block.name, layout)
+    return header, handle
+
+
+def estimate_shared_size(file_name: PathLike | str) -> int:
+    """Returns the number of bytes `read_rpg_shared` needs for the file."""
+    header, _ = head.read_rpg_header(file_name)
+    return _get_size(_get_layout(header, head.read_n_samples(file_name, header)))
+
+
+def _get_layout(header: dict, n_samples: int) -> dict:
+    """Places the decoder output arrays one after another into a block."""
+    templates = rpg_data._init_arrays(header, 0)  # noqa: SLF001
+    layout, offset = {}, 0
+    for key, template in templates.items():
+        shape = (n_samples, *template.shape[1:])
+        layout[key] = (offset, shape, template.dtype.str)
+        nbytes = int(np.prod(shape)) * template.dtype.itemsize
+        offset += -(-nbytes // _ALIGNMENT) * _ALIGNMENT
+    return layout
+
+
+def _get_size(layout: dict) -> int:
+    return max(
+        (
+            offset + int(np.prod(shape)) * np.dtype(dtype).itemsize
+            for offset, shape, dtype in layout.values()
+        ),
+        default=0,
+    )
+
+
+def _map_arrays(block: shared_memory.SharedMemory, layout: dict) -> dict:
+    return {
+        key: np.ndarray(shape, dtype, buffer=block.buf, offset=offset)
+        for key, (offset, shape, dtype) in layout.items()
+    }
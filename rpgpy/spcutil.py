@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 import numpy as np
-from numba import jit
+from numba import jit, prange
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_NOISE_KEYS = ("level", "threshold", "snr")
 
 
 def spectra2moments(
@@ -12,6 +17,10 @@ def spectra2moments(
     spec_var: Literal["TotSpec", "VSpec", "HSpec"] = "TotSpec",
     fill_value: float = -999.0,
     n_points_min: int = 4,
+    noise: dict | None = None,
+    dtype: type[np.floating] = np.float32,
+    *,
+    dealias: bool = False,
 ) -> dict:
     """Calculates radar moments from the main peak.
 
@@ -21,16 +30,25 @@ def spectra2moments(
 
     Args:
     ----
-        data: Level 0 nD variables.
+        data: Level 0 nD variables, with spectra in either layout of `read_rpg`.
         header: Level 0 metadata.
         spec_var: Name of the spectral variable. Possible names are 'TotSpec', 'VSpec',
             and 'HSpec'.
         fill_value: Clear sky fill value.
         n_points_min: Minimum number of points in a valid spectral line.
+        noise: Noise estimate from `estimate_noise`. If given, the noise threshold
+            defines the peak edges and the noise level is subtracted from the
+            spectra. Otherwise, the minimum of each spectrum is used as threshold.
+        dtype: Data type of the output arrays. Use np.float64 for reference runs.
+            Default is np.float32.
+        dealias: If True, the mean velocity of anti-aliased spectra is computed
+            using the unfolded velocity axis, see `dealias_velocity`. Default is
+            False.
 
     Returns:
     -------
-        A dict with keys: 'Ze', 'MeanVel', 'SpecWidth', 'Skewn', 'Kurt'.
+        A dict with keys: 'Ze', 'MeanVel', 'SpecWidth', 'Skewn', 'Kurt'. The arrays
+        are C-contiguous.
 
     Examples:
     --------
@@ -39,36 +57,48 @@ def spectra2moments(
         >>> moments = spectra2moments(data, header)
 
     """
-    spectra = data[spec_var]
-    n_time, n_range, _ = spectra.shape
-    moments = np.full((n_time, n_range, 5), np.nan)
-    no_signal = np.all(spectra == 0, axis=2)
-    ranges = np.append(header["RngOffs"], header["RAltN"])
-
-    for ind_chirp in range(header["SequN"]):
-        for ind_range in range(ranges[ind_chirp], ranges[ind_chirp + 1]):
+    n_time, n_range = _get_shape(data[spec_var], header)
+    moments: np.ndarray = np.full((5, n_time, n_range), np.nan, dtype=dtype)
+    no_signal = np.zeros((n_time, n_range), dtype=bool)
+
+    for ind_chirp, (ranges, spectra, velocity) in enumerate(
+        _iter_chirps(data[spec_var], header)
+    ):
+        no_signal[:, ranges] = np.all(spectra == 0, axis=2)
+        for ind_range in range(ranges.start, ranges.stop):
+            ind_chirp_range = ind_range - ranges.start
             for ind_time in range(n_time):
                 if no_signal[ind_time, ind_range]:
                     continue
-                edge_left, edge_right = find_peak_edges(spectra[ind_time, ind_range, :])
+                threshold = (
+                    None if noise is None else noise["threshold"][ind_time, ind_range]
+                )
+                edge_left, edge_right = find_peak_edges(
+                    spectra[ind_time, ind_chirp_range, :], threshold
+                )
                 if (edge_right - edge_left) < n_points_min:
                     no_signal[ind_time, ind_range] = True
                     continue
-                velocity_vector = header["velocity_vectors"][ind_chirp][
-                    edge_left:edge_right
-                ]
+                velocity_vector = velocity[edge_left:edge_right]
                 assert np.all(velocity_vector != 0)
-                moments[ind_time, ind_range, :] = radar_moment_calculation(
-                    spectra[ind_time, ind_range, edge_left:edge_right],
+                signal = spectra[ind_time, ind_chirp_range, edge_left:edge_right]
+                if noise is not None:
+                    signal = signal - noise["level"][ind_time, ind_range]
+                moments[:, ind_time, ind_range] = radar_moment_calculation(
+                    signal,
                     velocity_vector,
+                    dtype,
                 )
 
         # shift mean Doppler velocity by half a bin
         half_bin_width = header["MaxVel"][ind_chirp] / header["SpecN"][ind_chirp]
-        moments[:, ranges[ind_chirp] : ranges[ind_chirp + 1], 1] -= half_bin_width
+        moments[1, :, ranges] -= half_bin_width
+
+    if dealias:
+        moments[1] += dealias_velocity(data, header)
 
     output = {
-        key: moments[:, :, i]
+        key: moments[i]
         for i, key in enumerate(["Ze", "MeanVel", "SpecWidth", "Skewn", "Kurt"])
     }
     for key in output:
@@ -76,8 +106,150 @@ def spectra2moments(
     return output
 
 
+def spectra2peak_moments(
+    data: dict,
+    header: dict,
+    n_peaks: int = 3,
+    spec_var: Literal["TotSpec", "VSpec", "HSpec"] = "TotSpec",
+    fill_value: float = -999.0,
+    n_points_min: int = 4,
+    noise: dict | None = None,
+    dtype: type[np.floating] = np.float32,
+    *,
+    dealias: bool = False,
+) -> dict:
+    """Calculates radar moments from several peaks of each spectrum.
+
+    A peak is a contiguous part of the spectrum above its minimum value, or above
+    the noise threshold if `noise` is given, as in `find_peak_edges`. Peaks
+    narrower than `n_points_min` are skipped and the rest are ordered by their
+    maximum value. The first peak is thus the main peak used by `spectra2moments`,
+    except when the main peak is too narrow: `spectra2moments` then reports no
+    signal, whereas the first peak here is the highest of the wider peaks. All
+    spectra are processed in parallel by a compiled kernel.
+
+    Args:
+    ----
+        data: Level 0 nD variables, with spectra in either layout of `read_rpg`.
+        header: Level 0 metadata.
+        n_peaks: Maximum number of peaks per spectrum.
+        spec_var: Name of the spectral variable. Possible names are 'TotSpec', 'VSpec',
+            and 'HSpec'.
+        fill_value: Fill value for missing peaks.
+        n_points_min: Minimum number of points in a valid peak.
+        noise: Noise estimate from `estimate_noise`. If given, the noise level is
+            subtracted from the peaks.
+        dtype: Data type of the output arrays. Use np.float64 for reference runs.
+            Default is np.float32.
+        dealias: If True, the mean velocity of anti-aliased spectra is computed
+            using the unfolded velocity axis, see `dealias_velocity`. Default is
+            False.
+
+    Returns:
+    -------
+        A dict with keys: 'Ze', 'MeanVel', 'SpecWidth', 'Skewn', 'Kurt', each being a
+        C-contiguous array of shape (time, range, n_peaks).
+
+    Examples:
+    --------
+        >>> from rpgpy import read_rpg
+        >>> from rpgpy.spcutil import spectra2peak_moments
+        >>> header, data = read_rpg('rpg-fmcw-94-file.LV0')
+        >>> moments = spectra2peak_moments(data, header, n_peaks=3)
+
+    """
+    n_time, n_range = _get_shape(data[spec_var], header)
+    moments: np.ndarray = np.full(
+        (5, n_time, n_range, n_peaks), fill_value, dtype=dtype
+    )
+    for ind_chirp, (ranges, spectra, velocity) in enumerate(
+        _iter_chirps(data[spec_var], header)
+    ):
+        n_chirp_range = ranges.stop - ranges.start
+        half_bin_width = header["MaxVel"][ind_chirp] / header["SpecN"][ind_chirp]
+        if noise is None:
+            thresholds = np.min(spectra, axis=2)
+            levels = np.zeros(spectra.shape[:2], dtype=np.float32)
+        else:
+            thresholds, levels = (
+                noise["threshold"][:, ranges],
+                noise["level"][:, ranges],
+            )
+        _peak_moments_kernel(
+            spectra,
+            np.broadcast_to(velocity, (n_chirp_range, len(velocity))),
+            np.full(n_chirp_range, half_bin_width),
+            thresholds,
+            levels,
+            n_points_min,
+            moments[:, :, ranges],
+        )
+    if dealias:
+        offset = dealias_velocity(data, header)[:, :, np.newaxis]
+        moments[1] += np.where(moments[0] != fill_value, offset, 0)
+    return {
+        key: moments[i]
+        for i, key in enumerate(["Ze", "MeanVel", "SpecWidth", "Skewn", "Kurt"])
+    }
+
+
+@jit(nopython=True, parallel=True, fastmath=True)
+def _peak_moments_kernel(
+    spectra: np.ndarray,
+    velocity: np.ndarray,
+    half_bin_width: np.ndarray,
+    thresholds: np.ndarray,
+    levels: np.ndarray,
+    n_points_min: int,
+    moments: np.ndarray,
+) -> None:
+    n_time, n_range, n_bins = spectra.shape
+    n_peaks = moments.shape[3]
+    for ind in prange(n_time * n_range):
+        ind_time, ind_range = ind // n_range, ind % n_range
+        signal = spectra[ind_time, ind_range, :]
+        threshold = thresholds[ind_time, ind_range]
+        left = np.zeros(n_peaks, dtype=np.int64)
+        right = np.zeros(n_peaks, dtype=np.int64)
+        maxima = np.zeros(n_peaks, dtype=np.float64)
+        n_found = 0
+        ind_bin = 0
+        while ind_bin < n_bins:
+            if signal[ind_bin] <= threshold:
+                ind_bin += 1
+                continue
+            edge_left, peak_max = ind_bin, signal[ind_bin]
+            while ind_bin < n_bins and signal[ind_bin] > threshold:
+                peak_max = max(peak_max, signal[ind_bin])
+                ind_bin += 1
+            if ind_bin - edge_left < n_points_min:
+                continue
+            # insert into peaks sorted by maximum value (descending)
+            pos = n_found
+            while pos > 0 and maxima[pos - 1] < peak_max:
+                pos -= 1
+            if pos >= n_peaks:
+                continue
+            for k in range(min(n_found, n_peaks - 1), pos, -1):
+                left[k], right[k], maxima[k] = left[k - 1], right[k - 1], maxima[k - 1]
+            left[pos], right[pos], maxima[pos] = edge_left, ind_bin, peak_max
+            n_found = min(n_found + 1, n_peaks)
+        for k in range(n_found):
+            values = radar_moment_calculation(
+                signal[left[k] : right[k]] - levels[ind_time, ind_range],
+                velocity[ind_range, left[k] : right[k]],
+                np.float64,
+            )
+            values[1] -= half_bin_width[ind_range]
+            moments[:, ind_time, ind_range, k] = values
+
+
 @jit(nopython=True, fastmath=True)
-def radar_moment_calculation(signal: np.ndarray, vel_bins: np.ndarray) -> np.ndarray:
+def radar_moment_calculation(
+    signal: np.ndarray,
+    vel_bins: np.ndarray,
+    dtype: type[np.floating] = np.float32,
+) -> np.ndarray:
     """Calculates radar moments from one a single spectral line.
 
     Calculation reflectivity, mean Doppler velocity, spectral width,
@@ -87,6 +259,7 @@ def radar_moment_calculation(signal: np.ndarray, vel_bins: np.ndarray) -> np.nda
     ----
         signal: Detected signal from a Doppler spectrum.
         vel_bins: Extracted velocity bins of the signal (same length as signal).
+        dtype: Data type of the returned array. Default is np.float32.
 
     Returns:
     -------
@@ -113,17 +286,20 @@ def radar_moment_calculation(signal: np.ndarray, vel_bins: np.ndarray) -> np.nda
     sw2 = sw * sw
     skew = np.sum(pwr_nrm * vel_diff * vel_diff2 / (sw * sw2))
     kurt = np.sum(pwr_nrm * vel_diff2 * vel_diff2 / (sw2 * sw2))
-    return np.array((ze_lin, vel, sw, skew, kurt), dtype=np.float32)
+    return np.array((ze_lin, vel, sw, skew, kurt), dtype=dtype)
 
 
 @jit(nopython=True, fastmath=True)
-def find_peak_edges(signal: np.ndarray) -> tuple[int, int]:
+def find_peak_edges(
+    signal: np.ndarray, threshold: float | None = None
+) -> tuple[int, int]:
     """Returns the indices of left and right edge of the main signal peak in a Doppler
     spectra.
 
     Args:
     ----
         signal: 1D array Doppler spectra.
+        threshold: Noise threshold. Default is the minimum of the signal.
 
     Returns:
     -------
@@ -132,7 +308,8 @@ def find_peak_edges(signal: np.ndarray) -> tuple[int, int]:
     """
     len_sig = len(signal)
     edge_left, edge_right = 0, len_sig
-    threshold = np.min(signal)
+    if threshold is None:
+        threshold = np.min(signal)
     imax = np.argmax(signal)
 
     for ind in range(imax, len_sig):
@@ -152,53 +329,272 @@ def find_peak_edges(signal: np.ndarray) -> tuple[int, int]:
     return edge_left, edge_right
 
 
-def calc_spectral_LDR(header: dict, data: dict) -> np.ndarray:
+def dealias_velocity(data: dict, header: dict) -> np.ndarray:
+    """Returns velocity offsets of the anti-aliased spectra.
+
+    With anti-aliasing (AntiAlias = 1), the radar software stores aliased spectra
+    already unfolded, so that the first Doppler bin of the chirp has velocity MinVel
+    instead of -MaxVel. Adding the offset to a velocity computed with the nominal
+    velocity axis gives the velocity on the unfolded axis.
+
+    Args:
+    ----
+        data: Level 0 nD variables.
+        header: Level 0 metadata.
+
+    Returns:
+    -------
+        Velocity offset [m/s] with shape (time, range). Zero for spectra that are
+        not anti-aliased.
+
+    """
+    n_time, n_range = _get_shape(data["TotSpec"], header)
+    offset = np.zeros((n_time, n_range), dtype=np.float32)
+    if "AliasMsk" not in data:
+        return offset
+    ranges = np.append(header["RngOffs"], header["RAltN"])
+    max_vel = np.repeat(header["MaxVel"], np.diff(ranges)).astype(np.float32)
+    _dealias_kernel(data["AliasMsk"], data["MinVel"], max_vel, offset)
+    return offset
+
+
+@jit(nopython=True, parallel=True)
+def _dealias_kernel(
+    alias_msk: np.ndarray,
+    min_vel: np.ndarray,
+    max_vel: np.ndarray,
+    offset: np.ndarray,
+) -> None:
+    n_time, n_range = offset.shape
+    for ind_time in prange(n_time):
+        for ind_range in range(n_range):
+            if alias_msk[ind_time, ind_range] == 1:
+                offset[ind_time, ind_range] = (
+                    min_vel[ind_time, ind_range] + max_vel[ind_range]
+                )
+
+
+def estimate_noise(
+    data: dict,
+    header: dict,
+    spec_var: Literal["TotSpec", "VSpec", "HSpec"] = "TotSpec",
+    n_avg: np.ndarray | None = None,
+    dtype: type[np.floating] = np.float32,
+) -> dict:
+    """Estimates noise of each spectrum using the method of Hildebrand and Sekhon.
+
+    Intended for uncompressed Level 0 files (CompEna = 0) which contain no
+    integrated noise power. All spectra are processed in parallel by a compiled
+    kernel, using only the Doppler bins of the corresponding chirp.
+
+    Args:
+    ----
+        data: Level 0 nD variables, with spectra in either layout of `read_rpg`.
+        header: Level 0 metadata.
+        spec_var: Name of the spectral variable. Possible names are 'TotSpec', 'VSpec',
+            and 'HSpec'.
+        n_avg: Number of spectral averages of each chirp. Default is
+            ChirpReps / SpecN.
+        dtype: Data type of the output arrays. Default is np.float32.
+
+    Returns:
+    -------
+        A dict with keys: 'level' (mean noise power per Doppler bin), 'threshold'
+        (largest noise value) and 'snr' (linear signal-to-noise ratio), each having
+        shape (time, range).
+
+    References:
+    ----------
+        Hildebrand, P. H., and R. S. Sekhon, 1974: Objective Determination of the Noise
+        Level in Doppler Spectra. J. Appl. Meteor., 13, 808–811.
+
+    """
+    shape = _get_shape(data[spec_var], header)
+    if n_avg is None:
+        n_avg = np.asarray(header["ChirpReps"]) / np.asarray(header["SpecN"])
+    n_avg = np.asarray(n_avg, dtype=np.float64)
+    noise = {key: np.zeros(shape, dtype=dtype) for key in _NOISE_KEYS}
+    for ind_chirp, (ranges, spectra, _) in enumerate(
+        _iter_chirps(data[spec_var], header)
+    ):
+        n_chirp_range = ranges.stop - ranges.start
+        n_bins = header["SpecN"][ind_chirp]
+        bin_start = np.full(n_chirp_range, (spectra.shape[2] - n_bins) // 2)
+        _hildebrand_sekhon_kernel(
+            spectra,
+            bin_start,
+            bin_start + n_bins,
+            np.full(n_chirp_range, n_avg[ind_chirp]),
+            *(array[:, ranges] for array in noise.values()),
+        )
+    return noise
+
+
+@jit(nopython=True, parallel=True)
+def _hildebrand_sekhon_kernel(
+    spectra: np.ndarray,
+    bin_start: np.ndarray,
+    bin_stop: np.ndarray,
+    n_avg: np.ndarray,
+    level: np.ndarray,
+    threshold: np.ndarray,
+    snr: np.ndarray,
+) -> None:
+    n_time, n_range, _ = spectra.shape
+    for ind in prange(n_time * n_range):
+        ind_time, ind_range = ind // n_range, ind % n_range
+        values = np.sort(
+            spectra[ind_time, ind_range, bin_start[ind_range] : bin_stop[ind_range]]
+        )
+        # largest number of the weakest points that look like white noise
+        total, total2, n_noise = 0.0, 0.0, 1
+        for ind_bin in range(len(values)):
+            total += values[ind_bin]
+            total2 += values[ind_bin] * values[ind_bin]
+            mean = total / (ind_bin + 1)
+            variance = total2 / (ind_bin + 1) - mean * mean
+            if mean * mean >= variance * n_avg[ind_range]:
+                n_noise = ind_bin + 1
+        noise_level = np.mean(values[:n_noise])
+        noise_power = noise_level * len(values)
+        level[ind_time, ind_range] = noise_level
+        threshold[ind_time, ind_range] = values[n_noise - 1]
+        if noise_power > 0:
+            snr[ind_time, ind_range] = (np.sum(values) - noise_power) / noise_power
+
+
+def calc_spectral_LDR(
+    header: dict,
+    data: dict,
+    chunk_size: int | None = None,
+    dtype: type[np.floating] = np.float32,
+) -> np.ndarray | tuple[np.ndarray, ...]:
     """Computes spectral (S)LDR for vertically pointing STSR radar.
 
     Method by Galetti et al. (2012); Based on code by Alexander Myagkov (RPG).
+    The output is allocated once and SLDR of each Doppler bin is computed by a
+    parallel kernel which writes directly to the range gates of each chirp, so no
+    full-size temporaries are needed.
 
     Args:
     ----
         header: Level 0 nD variables.
         data: Level 0 nD metadata.
+        chunk_size: Number of time steps processed at a time. Limits the memory of
+            the converted copies of the input spectra. Default is all time steps.
+        dtype: Data type used in the computation and of the output array. Use
+            np.float64 for reference runs. Default is np.float32.
 
     Returns:
     -------
-        Computed SLDR [dB].
+        Computed SLDR [dB], in the same layout as the spectra: one array, or a
+        tuple of arrays, one per chirp.
 
     """
-    spec_tot = scale_spectra(data["TotSpec"], header["SWVersion"])
-    spec_V = spec_tot - data["HSpec"] - 2 * data["ReVHSpec"]
-    noise_V = (
-        data["TotNoisePow"] / 2.0
-    )  # TBD: how to obtain noise power in vertical channel?
-
-    bins_per_chirp = np.diff(np.hstack((header["RngOffs"], header["RAltN"])))
-    noise_h_per_bin = (data["HNoisePow"] / np.repeat(header["SpecN"], bins_per_chirp))[
-        :,
-        :,
-        np.newaxis,
-    ]
-    noise_v_per_bin = (noise_V / np.repeat(header["SpecN"], bins_per_chirp))[
-        :,
-        :,
-        np.newaxis,
+    n_time, _ = _get_shape(data["TotSpec"], header)
+    if chunk_size is None:
+        chunk_size = max(n_time, 1)
+    if chunk_size < 1:
+        msg = "chunk_size must be positive"
+        raise ValueError(msg)
+    scale = dtype(2 if header["SWVersion"] < 540 else 4)
+    chirps = [
+        list(_iter_chirps(data[key], header))
+        for key in ("TotSpec", "HSpec", "ReVHSpec", "ImVHSpec")
     ]
+    output: np.ndarray | tuple[np.ndarray, ...]
+    if isinstance(data["TotSpec"], tuple):
+        output = tuple(np.empty(array.shape, dtype=dtype) for array in data["TotSpec"])
+    else:
+        output = np.empty(data["TotSpec"].shape, dtype=dtype)
+    for ind_chirp, (ranges, sldr, _) in enumerate(_iter_chirps(output, header)):
+        spectra = [chirps_of_key[ind_chirp][1] for chirps_of_key in chirps]
+        n_bins = np.full(ranges.stop - ranges.start, header["SpecN"][ind_chirp], dtype)
+        for ind in range(0, n_time, chunk_size):
+            time_slice = slice(ind, ind + chunk_size)
+            tot_spec, h_spec, re_vh_spec, im_vh_spec = (
+                np.asarray(array[time_slice], dtype=dtype) for array in spectra
+            )
+            tot_noise, h_noise = (
+                np.asarray(data[key][time_slice, ranges], dtype=dtype)
+                for key in ("TotNoisePow", "HNoisePow")
+            )
+            _spectral_ldr_kernel(
+                tot_spec,
+                h_spec,
+                re_vh_spec,
+                im_vh_spec,
+                tot_noise,
+                h_noise,
+                n_bins,
+                scale,
+                sldr[time_slice],
+            )
+    return output
 
-    # Avoid division by zero
-    noise_v_per_bin[noise_v_per_bin == 0] = 1e-10
-    noise_h_per_bin[noise_h_per_bin == 0] = 1e-10
 
-    SNRv = spec_V / noise_v_per_bin
-    SNRh = data["HSpec"] / noise_h_per_bin
-    snr_mask = (SNRv < 1000) | (SNRh < 1000)
-    rhv = np.abs(data["ReVHSpec"] + complex(imag=1) * data["ImVHSpec"]) / np.sqrt(
-        (spec_V + noise_v_per_bin) * (data["HSpec"] + noise_h_per_bin),
-    )
-    sldr = 10 * np.log10((1 - rhv) / (1 + rhv))
-    snr_mask = snr_mask | (data["TotSpec"] == 0.0)
-    sldr[snr_mask] = -999
-    return sldr
+@jit(nopython=True, parallel=True)
+def _spectral_ldr_kernel(
+    spec_tot: np.ndarray,
+    spec_h: np.ndarray,
+    re_vh: np.ndarray,
+    im_vh: np.ndarray,
+    tot_noise: np.ndarray,
+    h_noise: np.ndarray,
+    n_bins: np.ndarray,
+    scale: np.floating,
+    sldr: np.ndarray,
+) -> None:
+    n_time, n_range, n_doppler = spec_tot.shape
+    for ind in prange(n_time * n_range):
+        ind_time, ind_range = ind // n_range, ind % n_range
+        # TBD: how to obtain noise power in vertical channel?
+        noise_v = tot_noise[ind_time, ind_range] / 2 / n_bins[ind_range]
+        noise_h = h_noise[ind_time, ind_range] / n_bins[ind_range]
+        # Avoid division by zero
+        if noise_v == 0:
+            noise_v = 1e-10
+        if noise_h == 0:
+            noise_h = 1e-10
+        for ind_bin in range(n_doppler):
+            tot = spec_tot[ind_time, ind_range, ind_bin]
+            h = spec_h[ind_time, ind_range, ind_bin]
+            re = re_vh[ind_time, ind_range, ind_bin]
+            v = scale * tot - h - 2 * re
+            if tot == 0 or v / noise_v < 1000 or h / noise_h < 1000:
+                sldr[ind_time, ind_range, ind_bin] = -999
+                continue
+            im = im_vh[ind_time, ind_range, ind_bin]
+            rhv = np.sqrt(re * re + im * im) / np.sqrt((v + noise_v) * (h + noise_h))
+            sldr[ind_time, ind_range, ind_bin] = 10 * np.log10((1 - rhv) / (1 + rhv))
+
+
+def _get_shape(spectra: np.ndarray | tuple, header: dict) -> tuple[int, int]:
+    """Returns the number of time steps and range gates of the spectra."""
+    if isinstance(spectra, tuple):
+        return spectra[0].shape[0], header["RAltN"]
+    return spectra.shape[:2]
+
+
+def _iter_chirps(
+    spectra: np.ndarray | tuple, header: dict
+) -> Iterator[tuple[slice, np.ndarray, np.ndarray]]:
+    """Yields range gates, spectra and velocity axis of each chirp.
+
+    Supports both spectra layouts of `read_rpg`: padded arrays of shape (time,
+    range, max(SpecN)), and tuples of per-chirp arrays without padding.
+    """
+    ranges = np.append(header["RngOffs"], header["RAltN"])
+    velocity_vectors = np.asarray(header["velocity_vectors"])
+    for ind_chirp in range(header["SequN"]):
+        range_slice = slice(ranges[ind_chirp], ranges[ind_chirp + 1])
+        if isinstance(spectra, tuple):
+            n_bins = header["SpecN"][ind_chirp]
+            first_bin = (velocity_vectors.shape[1] - n_bins) // 2
+            velocity = velocity_vectors[ind_chirp, first_bin : first_bin + n_bins]
+            yield range_slice, spectra[ind_chirp], velocity
+        else:
+            yield range_slice, spectra[:, range_slice], velocity_vectors[ind_chirp]
 
 
 def scale_spectra(signal: np.ndarray, software_version: float) -> np.ndarray:
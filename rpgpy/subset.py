@@ -0,0 +1,114 @@
+"""Module for writing subsets of RPG binary files without decoding them."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from rpgpy import header as head
+from rpgpy import utils
+
+if TYPE_CHECKING:
+    import datetime as dt
+    from collections.abc import Sequence
+    from os import PathLike
+
+CHUNK_SIZE = 2**24
+
+
+def subset_rpg(
+    input_file: PathLike | str,
+    output_file: PathLike | str,
+    start_time: dt.datetime | np.datetime64 | None = None,
+    stop_time: dt.datetime | np.datetime64 | None = None,
+    samples: Sequence[int] | slice | None = None,
+) -> int:
+    """Writes a subset of the samples of RPG binary file into a new file.
+
+    The header and the selected sample records are copied byte by byte. Only
+    the number of samples, and StartTime / StopTime of version > 2.0 files,
+    are updated in the new file.
+
+    Args:
+    ----
+        input_file: Level 0 or Level 1 filename, possibly compressed, see
+            `rpgpy.header.get_source`. The subset is written uncompressed.
+        output_file: Name of the output file.
+        start_time: Include samples at or after this UTC time.
+        stop_time: Include samples before this UTC time.
+        samples: Indices of the samples to include, applied before the time window.
+            The records are always written in file order, once each.
+
+    Returns:
+    -------
+        Number of samples written.
+
+    Raises:
+    ------
+        RPGFileError: No samples selected.
+
+    Examples:
+    --------
+        >>> import datetime
+        >>> from rpgpy import subset_rpg
+        >>> subset_rpg('rpg-data.LV0', 'subset.LV0',
+                       start_time=datetime.datetime(2023, 4, 1, 0, 10),
+                       stop_time=datetime.datetime(2023, 4, 1, 0, 20))
+
+    """
+    source = head.get_source(input_file)
+    header, _ = head.read_rpg_header(source)
+    index = head.read_record_index(source, header)
+    selected = np.arange(len(index.offset))
+    if samples is not None:
+        selected = np.unique(selected[samples])
+    timestamps = utils.rpg_seconds2datetime64(index.time, index.msec)[selected]
+    is_valid = np.ones(len(selected), dtype=bool)
+    if start_time is not None:
+        is_valid &= timestamps >= np.datetime64(start_time)
+    if stop_time is not None:
+        is_valid &= timestamps < np.datetime64(stop_time)
+    selected = selected[is_valid]
+    if len(selected) == 0:
+        msg = f"No samples selected from {input_file}"
+        raise utils.RPGFileError(msg)
+
+    _, version = utils.get_rpg_file_type(header)
+    with head._open(source) as src, open(output_file, "wb") as dst:  # noqa: SLF001
+        header_bytes = bytearray(src.read(8 + int(header["HeaderLen"])))
+        if version > 2.0:
+            header_bytes[8:16] = np.array(
+                [index.time[selected[0]], index.time[selected[-1]]], "<u4"
+            ).tobytes()
+        dst.write(header_bytes)
+        dst.write(np.int32(len(selected)).tobytes())
+        for offset, size in _merge_records(index, selected):
+            src.seek(offset)
+            _copy_bytes(src, dst, size)
+    msg = f"Wrote {len(selected)} samples from {input_file} to {output_file}"
+    logging.info(msg)
+    return len(selected)
+
+
+def _merge_records(index: head.RecordIndex, selected: np.ndarray) -> list:
+    """Merges adjacent records into contiguous byte ranges."""
+    ranges: list = []
+    for ind in selected:
+        offset, size = int(index.offset[ind]), int(index.size[ind])
+        if ranges and sum(ranges[-1]) == offset:
+            ranges[-1][1] += size
+        else:
+            ranges.append([offset, size])
+    return ranges
+
+
+def _copy_bytes(src, dst, n_bytes: int) -> None:
+    while n_bytes > 0:
+        chunk = src.read(min(n_bytes, CHUNK_SIZE))
+        if not chunk:
+            msg = "Unexpected end of file"
+            raise utils.RPGFileError(msg)
+        dst.write(chunk)
+        n_bytes -= len(chunk)
@@ -0,0 +1,490 @@
+"""Module for writing synthetic RPG cloud radar binary files."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+FILE_CODES = {
+    (0, 2.0): 789346,
+    (0, 3.5): 889346,
+    (1, 1.0): 789345,
+    (1, 2.0): 789347,
+    (1, 3.5): 889347,
+    (1, 4.0): 889348,
+}
+
+HOUSEKEEPING_KEYS = (
+    "RR",
+    "RelHum",
+    "EnvTemp",
+    "BaroP",
+    "WS",
+    "WD",
+    "DDVolt",
+    "DDTb",
+    "LWP",
+    "PowIF",
+    "Elev",
+    "Azi",
+    "Status",
+    "TransPow",
+    "TransT",
+    "RecT",
+    "PCT",
+)
+
+START_TIME = 702000000  # 2023-03-31 23:59:59.999
+
+
+def write_rpg(
+    file_name: PathLike | str,
+    level: int = 1,
+    version: float = 4.0,
+    *,
+    n_samples: int = 10,
+    n_levels: int = 30,
+    spec_n: tuple[int, ...] = (128, 256, 64),
+    compression: int = 1,
+    dual_pol: int = 0,
+    anti_alias: int = 0,
+    sparsity: float = 0.5,
+    n_blocks_max: int = 3,
+    seed: int = 0,
+    start_time: int = START_TIME + 1,
+) -> dict:
+    """Writes synthetic RPG Level 0 / Level 1 binary file.
+
+    Args:
+    ----
+        file_name: Name of the output file.
+        level: Level of the file (0 or 1).
+        version: Version of the file (2.0 or 3.5 for Level 0, and 1.0, 2.0, 3.5 or
+            4.0 for Level 1).
+        n_samples: Number of samples.
+        n_levels: Number of range gates.
+        spec_n: Number of Doppler bins in each chirp.
+        compression: Level 0 compression (0, 1 or 2).
+        dual_pol: Polarisation mode (0, 1 or 2).
+        anti_alias: Level 0 anti-aliasing flag (0 or 1).
+        sparsity: Fraction of range gates without data.
+        n_blocks_max: Maximum number of spectral blocks in compressed spectra.
+        seed: Seed of the random generator.
+        start_time: Time of the first sample in seconds since 2001-01-01. The
+            samples are 3 s apart. Default is 2023-04-01 00:00:00.
+
+    Returns:
+    -------
+        Data written in the file, in the same format as returned by `read_rpg`.
+
+    Raises:
+    ------
+        ValueError: Invalid combination of arguments.
+
+    """
+    if (level, version) not in FILE_CODES:
+        msg = f"Unsupported level {level} and version {version}"
+        raise ValueError(msg)
+    if len(spec_n) > n_levels:
+        msg = "More chirps than range gates"
+        raise ValueError(msg)
+    if level == 1:
+        compression, anti_alias = 0, 0
+    if version == 1.0:
+        dual_pol = 0
+    rng = np.random.default_rng(seed)
+    header = _create_header(
+        level,
+        version,
+        n_samples,
+        n_levels,
+        spec_n,
+        compression,
+        dual_pol,
+        anti_alias,
+        start_time,
+    )
+    data = _create_data(header, level, version, n_samples, rng, sparsity, n_blocks_max)
+    with open(file_name, "wb") as file:
+        header_bytes = _encode_header(header, level, version)
+        file.write(_pack(("FileCode", "<i4"), ("HeaderLen", "<i4"), source=header))
+        file.write(header_bytes)
+        file.write(np.int32(n_samples).tobytes())
+        for sample in range(n_samples):
+            record = _encode_record(header, data, level, version, sample)
+            file.write(np.int32(len(record)).tobytes())
+            file.write(record)
+    return {key: array for key, array in data.items() if not key.startswith("_")}
+
+
+def _create_header(
+    level: int,
+    version: float,
+    n_samples: int,
+    n_levels: int,
+    spec_n: tuple[int, ...],
+    compression: int,
+    dual_pol: int,
+    anti_alias: int,
+    start_time: int,
+) -> dict:
+    n_chirps = len(spec_n)
+    n_temp, n_hum = 3, 2
+    range_offsets = np.linspace(0, n_levels, n_chirps, endpoint=False).astype(int)
+    return {
+        "FileCode": FILE_CODES[(level, version)],
+        "HeaderLen": 0,
+        "StartTime": start_time,
+        "StopTime": start_time + 3 * (n_samples - 1),
+        "CGProg": 1,
+        "ModelNo": 1 if dual_pol > 0 else 0,
+        "ProgName": "synthetic",
+        "CustName": "rpgpy",
+        "Freq": 94.0,
+        "AntSep": 0.6,
+        "AntDia": 0.5,
+        "AntG": 1e5,
+        "HPBW": 0.5,
+        "Cr": 1e3,
+        "DualPol": dual_pol,
+        "CompEna": compression,
+        "AntiAlias": anti_alias,
+        "SampDur": 3.0,
+        "GPSLat": 61.8,
+        "GPSLong": 24.3,
+        "CalInt": 600,
+        "RAltN": n_levels,
+        "TAltN": n_temp,
+        "HAltN": n_hum,
+        "SequN": n_chirps,
+        "RAlts": np.linspace(100, 100 + 30 * (n_levels - 1), n_levels),
+        "TAlts": np.linspace(0, 1000, n_temp),
+        "HAlts": np.linspace(0, 1000, n_hum),
+        "Fr": np.ones(n_levels),
+        "SpecN": np.array(spec_n),
+        "RngOffs": range_offsets,
+        "ChirpReps": np.full(n_chirps, 8192),
+        "SeqIntTime": np.full(n_chirps, 1.0),
+        "dR": np.full(n_chirps, 30.0),
+        "MaxVel": np.linspace(10, 5, n_chirps),
+        "DoppRes": 2 * np.linspace(10, 5, n_chirps) / np.array(spec_n),
+        "ChanBW": np.full(n_chirps, 1e5),
+        "ChirpLowIF": np.full(n_chirps, 100),
+        "ChirpHighIF": np.full(n_chirps, 1000),
+        "RangeMin": range_offsets,
+        "RangeMax": np.append(range_offsets[1:], n_levels) - 1,
+        "ChirpFFTSize": np.full(n_chirps, 512),
+        "ChirpInvSamples": np.full(n_chirps, 0),
+        "ChirpCenterFr": np.full(n_chirps, 1.0),
+        "ChirpBWFr": np.full(n_chirps, 1.0),
+        "FFTStartInd": np.full(n_chirps, 0),
+        "FFTStopInd": np.full(n_chirps, 511),
+        "ChirpFFTNo": np.full(n_chirps, 1),
+        "SampRate": 1000,
+        "MaxRange": 12000,
+        "SupPowLev": 0,
+        "SpkFilEna": 0,
+        "PhaseCorr": 0,
+        "RelPowCorr": 0,
+        "FFTWindow": 4,
+        "FFTInputRng": 1000,
+        "SWVersion": 560,
+        "NoiseFilt": 7.0,
+        "InstCalPar": 0,
+    }
+
+
+def _encode_header(header: dict, level: int, version: float) -> bytes:
+    """Encodes header in the order read by `rpgpy.header._read_header`."""
+    n_chirps = header["SequN"]
+    chunks = []
+
+    def write(*fields):
+        chunks.append(_pack(*fields, source=header))
+
+    def write_string(value: str):
+        chunks.append(value.encode("latin-1") + b"\x00")
+
+    if version > 2.0:
+        write(("StartTime", "<u4"), ("StopTime", "<u4"))
+    if version > 1.0:
+        write(("CGProg", "<i4"))
+    write(("ModelNo", "<i4"))
+    write_string(header["ProgName"])
+    write_string(header["CustName"])
+
+    if version > 1.0:
+        write(("Freq", "<f4"), ("AntSep", "<f4"), ("AntDia", "<f4"), ("AntG", "<f4"))
+        write(("HPBW", "<f4"))
+        if level == 0:
+            write(("Cr", "<f4"))
+        write(("DualPol", "<i1"))
+        if level == 0:
+            write(("CompEna", "<i1"), ("AntiAlias", "<i1"))
+        write(
+            ("SampDur", "<f4"),
+            ("GPSLat", "<f4"),
+            ("GPSLong", "<f4"),
+            ("CalInt", "<i4"),
+            ("RAltN", "<i4"),
+            ("TAltN", "<i4"),
+            ("HAltN", "<i4"),
+            ("SequN", "<i4"),
+        )
+        write(("RAlts", "<f4"), ("TAlts", "<f4"), ("HAlts", "<f4"))
+        if level == 0:
+            write(("Fr", "<f4"))
+        write(
+            ("SpecN", "<i4"),
+            ("RngOffs", "<i4"),
+            ("ChirpReps", "<i4"),
+            ("SeqIntTime", "<f4"),
+            ("dR", "<f4"),
+            ("MaxVel", "<f4"),
+        )
+        if version > 2.0:
+            if level == 0:
+                write(
+                    ("ChanBW", "<f4"),
+                    ("ChirpLowIF", "<i4"),
+                    ("ChirpHighIF", "<i4"),
+                    ("RangeMin", "<i4"),
+                    ("RangeMax", "<i4"),
+                    ("ChirpFFTSize", "<i4"),
+                    ("ChirpInvSamples", "<i4"),
+                    ("ChirpCenterFr", "<f4"),
+                    ("ChirpBWFr", "<f4"),
+                    ("FFTStartInd", "<i4"),
+                    ("FFTStopInd", "<i4"),
+                    ("ChirpFFTNo", "<i4"),
+                    ("SampRate", "<i4"),
+                    ("MaxRange", "<i4"),
+                )
+            write(
+                ("SupPowLev", "<i1"),
+                ("SpkFilEna", "<i1"),
+                ("PhaseCorr", "<i1"),
+                ("RelPowCorr", "<i1"),
+                ("FFTWindow", "<i1"),
+                ("FFTInputRng", "<u2"),
+                ("SWVersion", "<u2"),
+                ("NoiseFilt", "<f4"),
+            )
+            if level == 1 and version > 3.5:
+                write(("InstCalPar", "<i4"))
+            elif level == 0:
+                chunks.append(np.zeros(1, "<i4").tobytes())
+            if level == 0 or (level == 1 and version > 3.5):
+                chunks.append(np.zeros(24, "<i4").tobytes())
+                chunks.append(np.zeros(10000, "<u4").tobytes())
+    else:
+        write(("RAltN", "<i4"), ("RAlts", "<f4"), ("SequN", "<i4"))
+        write(
+            ("RngOffs", "<i4"),
+            ("dR", "<f4"),
+            ("SpecN", "<i4"),
+            ("DoppRes", "<f4"),
+            ("MaxVel", "<f4"),
+        )
+        write(("CalInt", "<i4"), ("AntSep", "<f4"), ("HPBW", "<f4"), ("SampDur", "<f4"))
+
+    assert all(np.size(header[key]) == n_chirps for key in ("SpecN", "MaxVel"))
+    header_bytes = b"".join(chunks)
+    header["HeaderLen"] = len(header_bytes)
+    return header_bytes
+
+
+def _create_data(
+    header: dict,
+    level: int,
+    version: float,
+    n_samples: int,
+    rng: np.random.Generator,
+    sparsity: float,
+    n_blocks_max: int,
+) -> dict:
+    n_levels = header["RAltN"]
+    compression = header["CompEna"]
+    polarization = header["DualPol"]
+    data: dict = {
+        "Time": (header["StartTime"] + 3 * np.arange(n_samples)).astype(np.uint32),
+        "MSec": rng.integers(0, 1000, n_samples).astype(np.int32),
+        "QF": np.zeros(n_samples, np.int8),
+    }
+    for key in HOUSEKEEPING_KEYS:
+        data[key] = rng.uniform(0, 300, n_samples).astype(np.float32)
+    is_data = rng.random((n_samples, n_levels)) >= sparsity
+    data["_is_data"] = is_data.astype(np.int8)
+
+    def random_2d(low: float = 0.1, high: float = 1.0) -> np.ndarray:
+        array = rng.uniform(low, high, (n_samples, n_levels)).astype(np.float32)
+        return np.where(is_data, array, 0).astype(np.float32)
+
+    if level == 1:
+        keys = ["Ze", "MeanVel", "SpecWidth", "Skewn", "Kurt"]
+        if polarization > 0:
+            keys += ["RefRat", "CorrCoeff", "DiffPh"]
+        if polarization == 2:
+            keys += ["SLDR", "SCorrCoeff", "KDP", "DiffAtt"]
+        for key in keys:
+            data[key] = random_2d()
+        if version == 1.0:
+            data["_Spec"] = rng.uniform(
+                0, 1, (n_samples, n_levels, max(header["SpecN"]))
+            )
+        return data
+
+    data["SLv"] = rng.uniform(0, 1, (n_samples, n_levels)).astype(np.float32)
+    spectral_keys = ["TotSpec"]
+    if polarization > 0:
+        data["SLh"] = rng.uniform(0, 1, (n_samples, n_levels)).astype(np.float32)
+        spectral_keys += ["HSpec", "ReVHSpec", "ImVHSpec"]
+    if compression == 2:
+        spectral_keys += ["RefRat", "CorrCoeff", "DiffPh"]
+    if compression == 2 and polarization == 2:
+        spectral_keys += ["SLDR", "SCorrCoeff"]
+        data["KDP"], data["DiffAtt"] = random_2d(), random_2d()
+    if compression > 0:
+        data["TotNoisePow"] = random_2d(1e-3, 1e-2)
+    if compression > 0 and polarization > 0:
+        data["HNoisePow"] = random_2d(1e-3, 1e-2)
+    if header["AntiAlias"] == 1:
+        # uncompressed spectra have no anti-aliasing information
+        has_alias = is_data & (compression > 0)
+        data["AliasMsk"] = np.where(
+            has_alias, rng.integers(0, 2, (n_samples, n_levels)), 0
+        ).astype(np.int8)
+        data["MinVel"] = np.where(has_alias, random_2d(-10, -0.1), 0).astype(np.float32)
+
+    n_spectra = max(header["SpecN"])
+    mask = np.zeros((n_samples, n_levels, n_spectra), dtype=bool)
+    blocks = {}
+    chirp_of_level = np.digitize(range(n_levels), header["RngOffs"]) - 1
+    for sample, level_ind in zip(*np.nonzero(is_data), strict=True):
+        n_bins = header["SpecN"][chirp_of_level[level_ind]]
+        shift = (n_spectra - n_bins) // 2
+        if compression == 0:
+            mask[sample, level_ind, shift : shift + n_bins] = True
+            continue
+        n_blocks = int(rng.integers(1, min(n_blocks_max, n_bins // 2) + 1))
+        edges = np.sort(rng.choice(n_bins, 2 * n_blocks, replace=False))
+        min_ind, max_ind = edges[0::2], edges[1::2]
+        blocks[(sample, level_ind)] = (min_ind, max_ind)
+        for start, stop in zip(min_ind, max_ind, strict=True):
+            mask[sample, level_ind, shift + start : shift + stop + 1] = True
+    data["_blocks"] = blocks
+
+    velocity = np.linspace(-1, 1, n_spectra)
+    for key in spectral_keys:
+        centre = rng.uniform(-0.5, 0.5, (n_samples, n_levels, 1))
+        peak = np.exp(-(((velocity - centre) / 0.1) ** 2))
+        noise = rng.uniform(1e-3, 2e-3, mask.shape)
+        data[key] = np.where(mask, peak + noise, 0).astype(np.float32)
+    return data
+
+
+def _encode_record(
+    header: dict, data: dict, level: int, version: float, sample: int
+) -> bytes:
+    """Encodes one sample in the order read by `rpgpy.data`."""
+    n_levels = header["RAltN"]
+    polarization = header["DualPol"]
+    compression = header["CompEna"]
+    n_spectra = max(header["SpecN"])
+    chirp_of_level = np.digitize(range(n_levels), header["RngOffs"]) - 1
+    chunks = [
+        np.uint32(data["Time"][sample]).tobytes(),
+        np.int32(data["MSec"][sample]).tobytes(),
+    ]
+    if level == 0 or version > 1.0:
+        chunks.append(np.int8(data["QF"][sample]).tobytes())
+    chunks.append(
+        np.array([data[key][sample] for key in HOUSEKEEPING_KEYS], "<f4").tobytes()
+    )
+    n_dummy = 3 + header["TAltN"] + 2 * header["HAltN"] + n_levels
+    if polarization > 0:
+        n_dummy += n_levels
+    if level == 1 and version == 1.0:
+        chunks.append(np.zeros(4 + header["SequN"], "<f4").tobytes())
+    else:
+        chunks.append(np.zeros(n_dummy, "<f4").tobytes())
+    if level == 0:
+        chunks.append(data["SLv"][sample].astype("<f4").tobytes())
+        if polarization > 0:
+            chunks.append(data["SLh"][sample].astype("<f4").tobytes())
+    is_data = data["_is_data"][sample]
+    chunks.append(is_data.tobytes())
+
+    def values(key: str, *indices) -> bytes:
+        return np.asarray(data[key][(sample, *indices)], "<f4").tobytes()
+
+    for level_ind in np.flatnonzero(is_data):
+        n_bins = header["SpecN"][chirp_of_level[level_ind]]
+        if level == 1:
+            for key in ("Ze", "MeanVel", "SpecWidth", "Skewn", "Kurt"):
+                chunks.append(values(key, level_ind))
+            if version == 1.0:
+                chunks.append(values("_Spec", level_ind, slice(0, n_bins)))
+                continue
+            if polarization > 0:
+                for key in ("RefRat", "CorrCoeff", "DiffPh"):
+                    chunks.append(values(key, level_ind))
+            if polarization == 2:
+                chunks.append(np.zeros(1, "<f4").tobytes())
+                for key in ("SLDR", "SCorrCoeff", "KDP", "DiffAtt"):
+                    chunks.append(values(key, level_ind))
+            continue
+
+        shift = (n_spectra - n_bins) // 2
+        if compression == 0:
+            keys = ["TotSpec", "HSpec", "ReVHSpec", "ImVHSpec"][
+                : 4 if polarization > 0 else 1
+            ]
+            payload = b"".join(
+                values(key, level_ind, slice(shift, shift + n_bins)) for key in keys
+            )
+            chunks.append(np.int32(len(payload)).tobytes())
+            chunks.append(payload)
+            continue
+
+        min_ind, max_ind = data["_blocks"][(sample, level_ind)]
+        payload_chunks = [
+            np.uint8(len(min_ind)).tobytes(),
+            min_ind.astype("<i2").tobytes(),
+            max_ind.astype("<i2").tobytes(),
+        ]
+        keys = ["TotSpec"]
+        if polarization > 0:
+            keys += ["HSpec", "ReVHSpec", "ImVHSpec"]
+        if compression == 2:
+            keys += ["RefRat", "CorrCoeff", "DiffPh"]
+        if compression == 2 and polarization == 2:
+            keys += ["SLDR", "SCorrCoeff"]
+        for key in keys:
+            for start, stop in zip(min_ind, max_ind, strict=True):
+                payload_chunks.append(
+                    values(key, level_ind, slice(shift + start, shift + stop + 1))
+                )
+        if compression == 2 and polarization == 2:
+            payload_chunks += [values("KDP", level_ind), values("DiffAtt", level_ind)]
+        payload_chunks.append(values("TotNoisePow", level_ind))
+        if polarization > 0:
+            payload_chunks.append(values("HNoisePow", level_ind))
+        if header["AntiAlias"] == 1:
+            payload_chunks.append(
+                np.int8(data["AliasMsk"][sample, level_ind]).tobytes()
+            )
+            payload_chunks.append(values("MinVel", level_ind))
+        payload = b"".join(payload_chunks)
+        chunks.append(np.int32(len(payload)).tobytes())
+        chunks.append(payload)
+
+    return b"".join(chunks)
+
+
+def _pack(*fields: tuple[str, str], source: dict) -> bytes:
+    return b"".join(np.asarray(source[name], dtype).tobytes() for name, dtype in fields)
@@ -15,6 +15,21 @@ class RPGFileError(Exception):
         super().__init__(self.message)
 
 
+class RPGValidationError(RPGFileError):
+    """Decoded data failed validation.
+
+    Attributes:
+        problems: All problems found, see `ValidationProblem`.
+    """
+
+    def __init__(self, problems: list[ValidationProblem]):
+        self.problems = problems
+        msg = problems[0].message
+        if len(problems) > 1:
+            msg += f" ({len(problems)} problems in total)"
+        super().__init__(msg)
+
+
 def get_current_time() -> str:
     """Returns current UTC time."""
     return datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
@@ -61,6 +76,51 @@ class RpgStatusFlags(NamedTuple):
     hatpro_humidity: ma.MaskedArray
 
 
+class SalvageReport(NamedTuple):
+    """Summary of a salvaged RPG binary file.
+
+    Attributes:
+        n_samples_expected: Number of samples announced in the file.
+        n_samples_read: Number of valid samples that were decoded.
+        dropped: Byte ranges (start, stop) of the file that were skipped.
+    """
+
+    n_samples_expected: int
+    n_samples_read: int
+    dropped: list[tuple[int, int]]
+
+
+class ValidationProblem(NamedTuple):
+    """Problem found when validating a decoded record.
+
+    Attributes:
+        sample: Index of the record.
+        kind: Type of the problem, 'timestamp' or 'block'.
+        message: Description of the problem.
+    """
+
+    sample: int
+    kind: str
+    message: str
+
+
+class ValidationReport(NamedTuple):
+    """Summary of a validated RPG binary file.
+
+    Attributes:
+        n_samples: Number of decoded samples.
+        problems: Problems found, ordered by sample.
+    """
+
+    n_samples: int
+    problems: list[ValidationProblem]
+
+    @property
+    def is_valid(self) -> bool:
+        """True if no problems were found."""
+        return not self.problems
+
+
 def decode_rpg_status_flags(flags: np.ndarray) -> RpgStatusFlags:
     tmp = flags.astype(np.uint32)
     mask = tmp != flags
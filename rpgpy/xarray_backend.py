@@ -0,0 +1,211 @@
+"""Module for opening RPG binary files with xarray."""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import TYPE_CHECKING
+
+import numpy as np
+import xarray as xr
+from xarray.backends import BackendArray, BackendEntrypoint
+from xarray.core import indexing
+
+import rpgpy.metadata
+from rpgpy import data as rpg_data
+from rpgpy import header as head
+from rpgpy import instrumentation, utils
+from rpgpy.nc import SKIP_ME, _fix_metadata, _get_dtype
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from os import PathLike
+
+SAMPLES_PER_CHUNK = 1024
+
+
+class RpgBackendEntrypoint(BackendEntrypoint):
+    """Opens RPG Level 0 / Level 1 binary files lazily with xarray.
+
+    Variable names, dimensions and attributes follow the netCDF files written by
+    `rpgpy.rpg2nc`. Header variables and timestamps are read when the file is
+    opened; other variables are decoded only for the samples being accessed.
+
+    Examples:
+    --------
+        >>> import xarray as xr
+        >>> ds = xr.open_dataset('rpg-data.LV0', engine='rpgpy', chunks={})
+
+    """
+
+    description = "Open RPG cloud radar binary files in xarray"
+    url = "https://github.com/actris-cloudnet/rpgpy"
+    open_dataset_parameters = (
+        "filename_or_obj",
+        "drop_variables",
+        "mask_and_scale",
+        "samples_per_chunk",
+    )
+
+    def open_dataset(  # type: ignore[override]
+        self,
+        filename_or_obj: PathLike | str,
+        *,
+        drop_variables: str | Iterable[str] | None = None,
+        mask_and_scale: bool = True,
+        samples_per_chunk: int = SAMPLES_PER_CHUNK,
+    ) -> xr.Dataset:
+        """Opens RPG binary file as xarray Dataset.
+
+        Args:
+        ----
+            filename_or_obj: Level 0 or Level 1 filename.
+            drop_variables: Names of variables to skip.
+            mask_and_scale: If True, range gates without data are replaced by NaN
+                as with the netCDF files. Default is True.
+            samples_per_chunk: Number of samples in the preferred dask chunks.
+                Default is 1024.
+
+        Returns:
+        -------
+            Lazily indexed Dataset.
+
+        """
+        store = _RpgStore(filename_or_obj)
+        variables = store.get_variables(samples_per_chunk)
+        attributes = {
+            "Conventions": "CF-1.7",
+            "level": store.level,
+            "rpg_file_version": f"{store.version:.1f}",
+        }
+        decoded, decoded_attributes, coord_names = xr.conventions.decode_cf_variables(
+            variables,
+            attributes,
+            mask_and_scale=mask_and_scale,
+            decode_times=False,
+            drop_variables=drop_variables,
+        )
+        dataset = xr.Dataset(decoded, attrs=decoded_attributes)
+        dataset = dataset.set_coords(coord_names.intersection(decoded))
+        dataset.set_close(store.close)
+        return dataset
+
+    def guess_can_open(self, filename_or_obj) -> bool:
+        try:
+            _, ext = os.path.splitext(str(filename_or_obj))
+        except TypeError:
+            return False
+        return ext.lower() in (".lv0", ".lv1")
+
+
+class _RpgStore:
+    """Decodes samples of one RPG binary file on demand."""
+
+    def __init__(self, file_name: PathLike | str):
+        self.file_name = file_name
+        self.header, _ = head.read_rpg_header(file_name)
+        self.level, self.version = utils.get_rpg_file_type(self.header)
+        self.index = head.read_record_index(file_name, self.header)
+        self.metadata = _fix_metadata(rpgpy.metadata.METADATA, self.header)
+        self.lock = threading.Lock()
+        self.cache: dict[bytes, dict] = {}
+
+    def get_variables(self, samples_per_chunk: int) -> dict[str, xr.Variable]:
+        sizes = {"range": self.header["RAltN"], "chirp": self.header["SequN"]}
+        if self.level == 0:
+            sizes["spectrum"] = max(self.header["SpecN"])
+        variables = {}
+        for key, array in self.header.items():
+            if key in SKIP_ME:
+                continue
+            values = np.asarray(array, dtype=_get_dtype(np.asarray(array)))
+            dims = tuple(_get_dimension(length, sizes) for length in values.shape)
+            variables[self._name(key)] = xr.Variable(
+                dims, values, self._attributes(key, values.ndim)
+            )
+        n_samples = len(self.index.offset)
+        templates = rpg_data._init_arrays(self.header, 0)  # noqa: SLF001
+        for key, template in templates.items():
+            dims = (
+                "time",
+                *(_get_dimension(length, sizes) for length in template.shape[1:]),
+            )
+            dtype = np.dtype(_get_dtype(template))
+            encoding = {"preferred_chunks": {"time": samples_per_chunk}}
+            if key == "Time":
+                array = self.index.time.astype(dtype)
+            elif key == "MSec":
+                array = self.index.msec.astype(dtype)
+            else:
+                shape = (n_samples, *template.shape[1:])
+                array = indexing.LazilyIndexedArray(
+                    RpgBackendArray(self, key, shape, dtype)
+                )
+            attributes = self._attributes(key, template.ndim)
+            variables[self._name(key)] = xr.Variable(dims, array, attributes, encoding)
+        return variables
+
+    def read(self, samples: np.ndarray) -> dict:
+        cache_key = samples.tobytes()
+        with self.lock:
+            if cache_key not in self.cache:
+                self.cache.clear()
+                with instrumentation.track_file(head.get_name(self.file_name)):
+                    self.cache[cache_key] = rpg_data.read_records(
+                        self.file_name, self.header, self.index.offset[samples]
+                    )
+            return self.cache[cache_key]
+
+    def close(self) -> None:
+        self.cache.clear()
+
+    def _name(self, key: str) -> str:
+        return self.metadata[key].name
+
+    def _attributes(self, key: str, ndim: int) -> dict:
+        meta = self.metadata[key]
+        attributes = {
+            attr_name: getattr(meta, attr_name)
+            for attr_name in ("long_name", "units", "comment")
+            if getattr(meta, attr_name)
+        }
+        attributes["rpg_manual_name"] = key
+        if ndim > 1:
+            # as in the netCDF files
+            attributes["_FillValue"] = 0
+        return attributes
+
+
+class RpgBackendArray(BackendArray):
+    """Variable of RPG binary file which is decoded when indexed."""
+
+    def __init__(self, store: _RpgStore, key: str, shape: tuple, dtype: np.dtype):
+        self.store = store
+        self.key = key
+        self.shape = shape
+        self.dtype = dtype
+
+    def __getitem__(self, key: indexing.ExplicitIndexer) -> np.ndarray:
+        return indexing.explicit_indexing_adapter(
+            key,
+            self.shape,
+            indexing.IndexingSupport.OUTER,
+            self._raw_indexing_method,
+        )
+
+    def _raw_indexing_method(self, key: tuple) -> np.ndarray:
+        samples = np.arange(self.shape[0])[key[0]]
+        array = self.store.read(np.atleast_1d(samples))[self.key]
+        for axis in range(len(key) - 1, 0, -1):
+            array = array[(slice(None),) * axis + (key[axis],)]
+        if np.ndim(samples) == 0:
+            array = array[0]
+        return array.astype(self.dtype, copy=False)
+
+
+def _get_dimension(length: int, sizes: dict) -> str:
+    for name, size in sizes.items():
+        if size == length:
+            return name
+    msg = f"No dimension of length {length}"
+    raise utils.RPGFileError(msg)
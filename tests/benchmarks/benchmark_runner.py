@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Throughput and peak memory benchmarks using synthetic RPG files."""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+import warnings
+from collections.abc import Callable
+
+from rpgpy import read_rpg, rpg2nc, spectra2moments, spectra2nc
+from rpgpy.spcutil import calc_spectral_LDR
+from rpgpy.synthetic import write_rpg
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RpgPy benchmarks.")
+    parser.add_argument("--n-samples", type=int, default=200)
+    parser.add_argument("--n-levels", type=int, default=300)
+    parser.add_argument("--spec-n", type=int, nargs="+", default=[512, 256, 128])
+    parser.add_argument("--sparsity", type=float, default=0.5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore", RuntimeWarning)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        lv0_file = os.path.join(tmp_dir, "synthetic.LV0")
+        lv1_file = os.path.join(tmp_dir, "synthetic.LV1")
+        output_file = os.path.join(tmp_dir, "output.nc")
+        write_rpg(
+            lv0_file,
+            level=0,
+            version=3.5,
+            n_samples=args.n_samples,
+            n_levels=args.n_levels,
+            spec_n=tuple(args.spec_n),
+            compression=1,
+            dual_pol=2,
+            sparsity=args.sparsity,
+        )
+        write_rpg(
+            lv1_file,
+            level=1,
+            version=4.0,
+            n_samples=args.n_samples,
+            n_levels=args.n_levels,
+            spec_n=tuple(args.spec_n),
+            dual_pol=2,
+            sparsity=args.sparsity,
+        )
+        header, data = read_rpg(lv0_file)
+        lv0_size, lv1_size = os.path.getsize(lv0_file), os.path.getsize(lv1_file)
+        benchmarks: list[tuple[str, int, Callable]] = [
+            ("read_rpg LV1", lv1_size, lambda: read_rpg(lv1_file)),
+            ("read_rpg LV0", lv0_size, lambda: read_rpg(lv0_file)),
+            ("spectra2moments", lv0_size, lambda: spectra2moments(data, header)),
+            ("calc_spectral_LDR", lv0_size, lambda: calc_spectral_LDR(header, data)),
+            ("rpg2nc LV1", lv1_size, lambda: rpg2nc(lv1_file, output_file)),
+            ("rpg2nc LV0", lv0_size, lambda: rpg2nc(lv0_file, output_file)),
+            ("spectra2nc", lv0_size, lambda: spectra2nc(lv0_file, output_file)),
+        ]
+        msg = f"{'Benchmark':<20}{'Time (s)':>12}{'MB/s':>12}{'Peak (MB)':>12}"
+        logging.info(msg)
+        for name, n_bytes, func in benchmarks:
+            elapsed, peak = _measure(func, args.repeat)
+            throughput = n_bytes / 1e6 / elapsed
+            msg = f"{name:<20}{elapsed:>12.3f}{throughput:>12.1f}{peak / 1e6:>12.1f}"
+            logging.info(msg)
+
+
+def _measure(func: Callable, repeat: int) -> tuple[float, int]:
+    """Returns the fastest run time and the peak memory allocated by func.
+
+    Memory allocated by the HDF5 library is not traced.
+    """
+    func()  # warm up, e.g. numba compilation
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(elapsed), peak
+
+
+if __name__ == "__main__":
+    main()
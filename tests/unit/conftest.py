@@ -0,0 +1,17 @@
+import pytest
+
+from rpgpy.synthetic import write_rpg
+
+
+@pytest.fixture
+def lv0_file(tmp_path):
+    filename = tmp_path / "file.LV0"
+    write_rpg(filename, level=0, version=3.5, n_samples=5)
+    return filename
+
+
+@pytest.fixture
+def lv1_file(tmp_path):
+    filename = tmp_path / "file.LV1"
+    write_rpg(filename, n_samples=5)
+    return filename
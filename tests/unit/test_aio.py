@@ -0,0 +1,99 @@
+import asyncio
+
+import netCDF4
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from rpgpy import read_rpg
+from rpgpy.aio import iter_rpg_async, read_rpg_async, rpg2nc_async
+from rpgpy.instrumentation import Collector, FileRecord
+from rpgpy.synthetic import START_TIME, write_rpg
+
+
+def test_read_rpg_async(tmp_path):
+    filename = tmp_path / "file.LV0"
+    write_rpg(filename, level=0, version=3.5, n_samples=200, n_levels=100)
+
+    async def read_and_count_ticks():
+        n_ticks = 0
+        task = asyncio.create_task(read_rpg_async(filename))
+        while not task.done():
+            await asyncio.sleep(0)
+            n_ticks += 1
+        return await task, n_ticks
+
+    (_, data), n_ticks = asyncio.run(read_and_count_ticks())
+    assert n_ticks > 1
+    _, expected = read_rpg(filename)
+    assert_array_equal(data["TotSpec"], expected["TotSpec"])
+
+
+def test_iter_rpg_async(tmp_path):
+    filename = tmp_path / "file.LV1"
+    write_rpg(filename, n_samples=10)
+
+    async def collect():
+        return [data async for _, data in iter_rpg_async(filename, 4)]
+
+    chunks = asyncio.run(collect())
+    assert [len(data["Time"]) for data in chunks] == [4, 4, 2]
+    _, expected = read_rpg(filename)
+    assert_array_equal(np.concatenate([data["Ze"] for data in chunks]), expected["Ze"])
+
+
+def test_rpg2nc_async(tmp_path):
+    for ind in range(2):
+        write_rpg(
+            tmp_path / f"file{ind}.LV1",
+            seed=ind,
+            start_time=START_TIME + 1 + 3600 * ind,
+        )
+    asyncio.run(rpg2nc_async(tmp_path / "*.LV1", tmp_path / "output.nc"))
+    with netCDF4.Dataset(tmp_path / "output.nc") as nc:
+        assert len(nc.variables["time"]) == 20
+        assert nc.level == 1
+
+
+def test_rpg2nc_async_with_chirp_layout(tmp_path):
+    write_rpg(tmp_path / "file.LV0", level=0, version=3.5, n_samples=6)
+    asyncio.run(
+        rpg2nc_async(
+            tmp_path / "*.LV0",
+            tmp_path / "output.nc",
+            spectra_layout="chirp",
+            memory_budget=2**30,
+        )
+    )
+    _, data = read_rpg(tmp_path / "file.LV0", spectra_layout="chirp")
+    with netCDF4.Dataset(tmp_path / "output.nc") as nc:
+        spectra = nc.variables["doppler_spectrum_c1"][:]
+        assert_array_equal(spectra.filled(0), data["TotSpec"][0])
+
+
+def test_cancel_rpg2nc_async(tmp_path):
+    for ind in range(3):
+        write_rpg(
+            tmp_path / f"file{ind}.LV1",
+            seed=ind,
+            start_time=START_TIME + 1 + 3600 * ind,
+        )
+
+    async def convert_and_cancel():
+        loop = asyncio.get_running_loop()
+
+        def cancel(_: FileRecord) -> None:
+            loop.call_soon_threadsafe(task.cancel)
+
+        with Collector(cancel) as collector:
+            task = asyncio.create_task(
+                rpg2nc_async(tmp_path / "*.LV1", tmp_path / "output.nc")
+            )
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        return collector
+
+    collector = asyncio.run(convert_and_cancel())
+    assert len(collector.records) == 1
+    with netCDF4.Dataset(tmp_path / "output.nc") as nc:
+        assert len(nc.variables["time"]) == 10
@@ -0,0 +1,187 @@
+import gzip
+import importlib.util
+import lzma
+import os
+import tarfile
+import tempfile
+from collections.abc import Callable
+
+import netCDF4
+import numpy as np
+import pytest
+import rpgpy.data
+from numpy.testing import assert_array_equal
+
+from rpgpy import (
+    read_housekeeping,
+    read_rpg,
+    read_rpg_multi,
+    rpg2nc,
+    rpg2nc_multi,
+    subset_rpg,
+)
+from rpgpy.archive import ArchiveMember, get_extension, glob_files
+from rpgpy.header import read_n_samples, read_record_index, read_rpg_header
+from rpgpy.memory import estimate_memory
+from rpgpy.synthetic import write_rpg
+from rpgpy.utils import RPGFileError
+
+COMPRESSORS: dict[str, Callable[[bytes], bytes]] = {
+    ".gz": gzip.compress,
+    ".xz": lzma.compress,
+}
+
+
+@pytest.fixture
+def files(tmp_path):
+    filenames = [tmp_path / "file0.LV0", tmp_path / "file1.LV1"]
+    write_rpg(filenames[0], level=0, version=3.5, n_samples=5)
+    write_rpg(filenames[1], n_samples=5)
+    return filenames
+
+
+@pytest.mark.parametrize("suffix", COMPRESSORS)
+def test_read_compressed_file(files, suffix):
+    for filename in files:
+        compressed = filename.with_name(filename.name + suffix)
+        compressed.write_bytes(COMPRESSORS[suffix](filename.read_bytes()))
+        expected_header, expected = read_rpg(filename)
+        header, data = read_rpg(compressed)
+        assert header.keys() == expected_header.keys()
+        for key, array in expected.items():
+            assert_array_equal(data[key], array, err_msg=key)
+        header, _ = read_rpg_header(compressed)
+        assert read_n_samples(compressed, header) == 5
+        assert estimate_memory(compressed) == estimate_memory(filename)
+
+
+def test_read_archive_members(tmp_path, files):
+    archive = tmp_path / "day.tar.gz"
+    with tarfile.open(archive, "w:gz") as tar:
+        for filename in files:
+            tar.add(filename, filename.name)
+    members = glob_files(archive)
+    assert members == [
+        ArchiveMember(str(archive), "file0.LV0"),
+        ArchiveMember(str(archive), "file1.LV1"),
+    ]
+    assert str(members[1]) == f"{archive}/file1.LV1"
+    _, expected = read_rpg(files[0])
+    _, data = read_rpg(members[0])
+    assert_array_equal(data["TotSpec"], expected["TotSpec"])
+    _, data = read_rpg_multi(members[1:])
+    assert_array_equal(data["Ze"], read_rpg(files[1])[1]["Ze"])
+
+
+def test_decode_while_decompressing(tmp_path, files, monkeypatch):
+    monkeypatch.setattr(rpgpy.data, "_WINDOW_SIZE", 7)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path / "tmp"))
+    for filename in files:
+        compressed = filename.with_name(filename.name + ".gz")
+        compressed.write_bytes(gzip.compress(filename.read_bytes()))
+        for kwargs in ({}, {"time_step": 2}):
+            _, expected = read_rpg(filename, **kwargs)
+            _, data = read_rpg(compressed, **kwargs)
+            for key, array in expected.items():
+                assert_array_equal(data[key], array, err_msg=key)
+        _, expected = read_housekeeping(filename)
+        _, data = read_housekeeping(compressed)
+        assert_array_equal(data["TransPow"], expected["TransPow"])
+    _, expected = read_rpg(files[0], spectra_layout="chirp")
+    _, data = read_rpg(f"{files[0]}.gz", spectra_layout="chirp")
+    for chirp, array in zip(data["TotSpec"], expected["TotSpec"], strict=True):
+        assert_array_equal(chirp, array)
+    assert not os.path.exists(tmp_path / "tmp")
+
+
+def test_read_archive_members_in_threads(tmp_path, files):
+    archive = tmp_path / "day.tar.xz"
+    with tarfile.open(archive, "w:xz") as tar:
+        for ind in range(3):
+            tar.add(files[1], f"file{ind}.LV1")
+    _, data = read_rpg_multi(glob_files(archive) * 2, jobs=3)
+    assert_array_equal(data["Ze"], np.tile(read_rpg(files[1])[1]["Ze"], (6, 1)))
+
+
+def test_truncated_compressed_file(tmp_path, files):
+    compressed = tmp_path / "file1.LV1.gz"
+    compressed.write_bytes(gzip.compress(files[1].read_bytes()[:-10]))
+    with pytest.raises(RPGFileError, match="Invalid record 4"):
+        read_housekeeping(compressed)
+    with pytest.raises(RPGFileError, match="Invalid record 4"):
+        read_record_index(compressed, read_rpg_header(compressed)[0])
+
+
+def test_decompression_error_is_raised(tmp_path, files):
+    compressed = tmp_path / "file1.LV1.gz"
+    compressed.write_bytes(gzip.compress(files[1].read_bytes())[:-20])
+    with pytest.raises(EOFError):
+        read_rpg(compressed)
+
+
+def test_subset_of_compressed_file(tmp_path, files):
+    compressed = tmp_path / "file1.LV1.gz"
+    compressed.write_bytes(gzip.compress(files[1].read_bytes()))
+    assert subset_rpg(compressed, tmp_path / "subset.LV1", samples=slice(1, 3)) == 2
+    _, data = read_rpg(tmp_path / "subset.LV1")
+    assert_array_equal(data["Ze"], read_rpg(files[1])[1]["Ze"][1:3])
+
+
+def test_glob_archive_members(tmp_path, files):
+    archive = tmp_path / "day.tar"
+    with tarfile.open(archive, "w") as tar:
+        for filename in files:
+            tar.add(filename, f"data/{filename.name}")
+    assert glob_files(f"{tmp_path}/*.tar/*/*.LV1") == [
+        ArchiveMember(str(archive), "data/file1.LV1")
+    ]
+    assert glob_files(f"{archive}/*.LV2") == []
+
+
+def test_rpg2nc_from_archive(tmp_path, files):
+    compressed = tmp_path / "file1.LV1.gz"
+    compressed.write_bytes(gzip.compress(files[1].read_bytes()))
+    with tarfile.open(tmp_path / "day.tar", "w") as tar:
+        tar.add(compressed, compressed.name)
+    rpg2nc(files[1], tmp_path / "expected.nc")
+    rpg2nc(f"{tmp_path}/day.tar/*.LV1.gz", tmp_path / "archive.nc")
+    rpg2nc(f"{tmp_path}/*.LV1.gz", tmp_path / "compressed.nc")
+    with netCDF4.Dataset(tmp_path / "expected.nc") as expected:
+        for name in ("archive.nc", "compressed.nc"):
+            with netCDF4.Dataset(tmp_path / name) as nc:
+                assert_array_equal(nc["Ze"][:], expected["Ze"][:])
+
+
+def test_rpg2nc_multi_from_archives(tmp_path, files):
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    with tarfile.open(input_dir / "day.tar", "w") as tar:
+        tar.add(files[0], files[0].name)
+    compressed = input_dir / "file1.LV1.xz"
+    compressed.write_bytes(lzma.compress(files[1].read_bytes()))
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    new_files = rpg2nc_multi(input_dir, output_dir, manifest=tmp_path / "m.json")
+    assert sorted(os.path.basename(file) for file in new_files) == [
+        "file0.LV0.nc",
+        "file1.LV1.nc",
+    ]
+    assert rpg2nc_multi(input_dir, output_dir, manifest=tmp_path / "m.json") == []
+
+
+def test_extension_ignores_compression():
+    assert get_extension("/path/file.LV1.zst") == ".lv1"
+    assert get_extension(ArchiveMember("day.tar", "file.LV0")) == ".lv0"
+    assert get_extension("file.LV0") == ".lv0"
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("zstandard") is not None
+    or importlib.util.find_spec("compression") is not None,
+    reason="Zstandard is available",
+)
+def test_zstd_requires_package(tmp_path):
+    filename = tmp_path / "file.LV1.zst"
+    filename.write_bytes(b"\x28\xb5\x2f\xfd")
+    with pytest.raises(ModuleNotFoundError, match="rpgpy\\[zstd\\]"):
+        read_rpg(filename)
@@ -0,0 +1,72 @@
+import os
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from rpgpy import data as data_module
+from rpgpy import read_rpg
+from rpgpy.cache import Cache, _get_key
+from rpgpy.synthetic import write_rpg
+
+
+def test_repeated_read_uses_cache(tmp_path, monkeypatch, lv0_file):
+    cache = Cache(tmp_path / "cache")
+    _, data = cache.read_rpg(lv0_file)
+    expected_header, expected = read_rpg(lv0_file)
+    assert cache.size > 0
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr(data_module, "read_rpg", fail)
+    cached_header, cached = cache.read_rpg(lv0_file)
+    assert list(cached) == list(expected)
+    for key, array in expected.items():
+        assert isinstance(cached[key], np.memmap)
+        assert_array_equal(cached[key], array)
+        assert_array_equal(data[key], array)
+    assert_array_equal(cached_header["RAlts"], expected_header["RAlts"])
+    assert not cached["TotSpec"].flags.writeable
+
+
+def test_custom_names(tmp_path, lv1_file):
+    cache = Cache(tmp_path / "cache")
+    cache.read_rpg(lv1_file)
+    _, data = cache.read_rpg(lv1_file, rpg_names=False)
+    _, expected = read_rpg(lv1_file, rpg_names=False)
+    assert data.keys() == expected.keys()
+
+
+def test_modified_file_is_decoded_again(tmp_path, lv1_file):
+    cache = Cache(tmp_path / "cache")
+    cache.read_rpg(lv1_file)
+    write_rpg(lv1_file, n_samples=3)
+    os.utime(lv1_file, ns=(0, 10**9))
+    _, data = cache.read_rpg(lv1_file)
+    assert len(data["Time"]) == 3
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    filenames = [tmp_path / f"file{ind}.LV1" for ind in range(3)]
+    for filename in filenames:
+        write_rpg(filename, n_samples=5)
+    entries = [tmp_path / "cache" / _get_key(filename) for filename in filenames]
+    cache = Cache(tmp_path / "cache")
+    cache.read_rpg(filenames[0])
+    entry_size = cache.size
+    cache.max_size = 2 * entry_size
+    cache.read_rpg(filenames[1])
+    os.utime(entries[0], (0, 0))
+    os.utime(entries[1], (1, 1))
+    cache.read_rpg(filenames[0])
+    cache.read_rpg(filenames[2])
+    assert cache.size == 2 * entry_size
+    assert [entry.exists() for entry in entries] == [True, False, True]
+    cache.clear()
+    assert cache.size == 0
+
+
+def test_invalid_max_size(tmp_path):
+    with pytest.raises(ValueError, match="max_size"):
+        Cache(tmp_path, max_size=-1)
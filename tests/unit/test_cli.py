@@ -0,0 +1,164 @@
+import json
+import os
+
+import netCDF4
+import pytest
+
+from rpgpy.cli import MANIFEST_NAME, main
+from rpgpy.manifest import run_conversions
+from rpgpy.synthetic import START_TIME, write_rpg
+
+
+def test_convert_skips_up_to_date_files(tmp_path, capsys):
+    input_dir, output_dir = tmp_path / "input", tmp_path / "output"
+    input_dir.mkdir()
+    for ind in range(2):
+        write_rpg(input_dir / f"file{ind}.LV1", n_samples=5)
+    assert main(["convert", str(input_dir), "-o", str(output_dir)]) == 0
+    assert len(capsys.readouterr().out.splitlines()) == 2
+    with open(output_dir / MANIFEST_NAME) as file:
+        assert len([json.loads(line) for line in file]) == 2
+
+    main(["convert", str(input_dir), "-o", str(output_dir)])
+    assert capsys.readouterr().out == ""
+
+    os.utime(input_dir / "file1.LV1", ns=(0, 10**9))
+    main(["convert", str(input_dir), "-o", str(output_dir), "--jobs", "2"])
+    assert capsys.readouterr().out.splitlines() == [f"{output_dir}/file1.LV1.nc"]
+
+    (output_dir / "file0.LV1.nc").unlink()
+    main(["convert", str(input_dir), "-o", str(output_dir), "--no-manifest"])
+    assert len(capsys.readouterr().out.splitlines()) == 2
+
+
+def test_convert_skips_invalid_files(tmp_path, capsys):
+    input_dir, output_dir = tmp_path / "input", tmp_path / "output"
+    input_dir.mkdir()
+    write_rpg(input_dir / "file0.LV1", n_samples=5)
+    (input_dir / "file1.LV1").write_bytes(b"invalid")
+    write_rpg(input_dir / "file2.LV1", n_samples=5)
+    assert main(["convert", str(input_dir), "-o", str(output_dir)]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        f"{output_dir}/file0.LV1.nc",
+        f"{output_dir}/file2.LV1.nc",
+    ]
+
+
+def test_convert_removes_partial_output(tmp_path, capsys, lv1_file):
+    lv1_file.write_bytes(lv1_file.read_bytes() + b"\x00")
+    output_dir = tmp_path / "output"
+    assert main(["convert", str(tmp_path), "-o", str(output_dir)]) == 0
+    assert capsys.readouterr().out == ""
+    assert not (output_dir / "file.LV1.nc").exists()
+
+
+def test_environment_errors_are_raised(tmp_path):
+    def fail():
+        raise PermissionError
+
+    with pytest.raises(PermissionError):
+        run_conversions([(fail, (), [], tmp_path / "file.nc")])
+
+
+def test_invalid_file_code(tmp_path, capsys, lv1_file):
+    with open(lv1_file, "r+b") as file:
+        file.write((123).to_bytes(4, "little"))
+    with pytest.raises(SystemExit) as err:
+        main(["daily", str(lv1_file), "-o", str(tmp_path / "output")])
+    assert err.value.code == 1
+    assert "File code: 123" in capsys.readouterr().err
+
+
+def test_resume_after_crash(tmp_path, capsys):
+    input_dir, output_dir = tmp_path / "input", tmp_path / "output"
+    input_dir.mkdir()
+    for ind in range(2):
+        write_rpg(input_dir / f"file{ind}.LV1", n_samples=5)
+    main(["convert", str(input_dir), "-o", str(output_dir)])
+    capsys.readouterr()
+    manifest = output_dir / MANIFEST_NAME
+    lines = manifest.read_text().splitlines()
+    manifest.write_text(f"{lines[0]}\n{lines[1][:10]}")
+    main(["convert", str(input_dir), "-o", str(output_dir)])
+    assert len(capsys.readouterr().out.splitlines()) == 1
+    assert len(manifest.read_text().splitlines()) == 2
+
+
+def test_moments(tmp_path, capsys):
+    filenames = [str(tmp_path / f"file{ind}.LV0") for ind in range(2)]
+    for filename in filenames:
+        write_rpg(filename, level=0, version=3.5, n_samples=3)
+    output_dir = tmp_path / "output"
+    args = ["moments", *filenames, "-o", str(output_dir), "-j", "2", "--attr", "a=b"]
+    assert main(args) == 0
+    output_files = capsys.readouterr().out.splitlines()
+    assert [os.path.basename(file) for file in output_files] == [
+        "file0_moments.nc",
+        "file1_moments.nc",
+    ]
+    with netCDF4.Dataset(output_files[0]) as nc:
+        assert "Ze" in nc.variables
+        assert nc.a == "b"
+
+
+def test_concat(tmp_path, capsys):
+    for ind in range(2):
+        write_rpg(
+            tmp_path / f"file{ind}.LV1",
+            n_samples=5,
+            start_time=START_TIME + 1 + 3600 * ind,
+        )
+    output_file = tmp_path / "output" / "concat.nc"
+    output_file.parent.mkdir()
+    args = ["concat", f"{tmp_path}/*.LV1", str(output_file), "--overview-levels", "1"]
+    assert main(args) == 0
+    assert capsys.readouterr().out.splitlines() == [str(output_file)]
+    with netCDF4.Dataset(output_file) as nc:
+        assert len(nc.dimensions["time"]) == 10
+    main(args)
+    assert capsys.readouterr().out == ""
+
+
+def test_concat_with_merge(tmp_path):
+    for ind in range(2):
+        write_rpg(tmp_path / f"file{ind}.LV1", n_samples=5)
+    output_file = tmp_path / "concat.nc"
+    assert main(["concat", f"{tmp_path}/*.LV1", str(output_file), "--merge"]) == 0
+    with netCDF4.Dataset(output_file) as nc:
+        assert len(nc.dimensions["time"]) == 5
+
+
+def test_daily(tmp_path, capsys):
+    write_rpg(tmp_path / "file0.LV1", n_samples=5, start_time=START_TIME - 5)
+    write_rpg(tmp_path / "file1.LV1", n_samples=5, start_time=START_TIME + 60)
+    output_dir = tmp_path / "output"
+    args = ["daily", f"{tmp_path}/*.LV1", "-o", str(output_dir), "--base-name", "x"]
+    assert main(args) == 0
+    output_files = capsys.readouterr().out.splitlines()
+    assert [os.path.basename(file) for file in output_files] == [
+        "x_20230331.nc",
+        "x_20230401.nc",
+    ]
+    with netCDF4.Dataset(output_files[1]) as nc:
+        assert len(nc.dimensions["time"]) == 8
+
+
+def test_invalid_attribute(tmp_path, capsys):
+    write_rpg(tmp_path / "file.LV1")
+    with pytest.raises(SystemExit) as err:
+        main(["convert", str(tmp_path), "--attr", "invalid"])
+    assert err.value.code == 1
+    assert "KEY=VALUE" in capsys.readouterr().err
+
+
+def test_memory_budget(tmp_path, capsys):
+    write_rpg(tmp_path / "file.LV1", n_samples=5)
+    output_dir = tmp_path / "output"
+    args = ["convert", str(tmp_path), "-o", str(output_dir), "--no-manifest"]
+    assert main([*args, "--memory-budget", "1.5K"]) == 0
+    with netCDF4.Dataset(output_dir / "file.LV1.nc") as nc:
+        assert len(nc.dimensions["time"]) == 5
+    with pytest.raises(SystemExit) as err:
+        main([*args, "--memory-budget", "lots"])
+    assert err.value.code == 2
+    assert "positive size" in capsys.readouterr().err
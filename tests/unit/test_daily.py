@@ -0,0 +1,84 @@
+import os
+
+import netCDF4
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from rpgpy import read_rpg, rpg2nc_daily
+from rpgpy.nc import _FilePart, _split_days
+from rpgpy.synthetic import START_TIME, write_rpg
+
+DAY = 86400
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Files of three days, the second one crossing midnight, in random order."""
+    filenames = [tmp_path / f"file{ind}.LV1" for ind in range(3)]
+    write_rpg(filenames[0], n_samples=10, start_time=START_TIME + 3600, seed=0)
+    write_rpg(filenames[1], n_samples=10, start_time=START_TIME - 20, seed=1)
+    write_rpg(filenames[2], n_samples=10, start_time=START_TIME + 1 - 2 * DAY, seed=2)
+    return filenames
+
+
+def test_split_days(files):
+    days = _split_days([str(file) for file in files])
+    assert days == {
+        "2023-03-30": [_FilePart(str(files[2]))],
+        "2023-03-31": [_FilePart(str(files[1]), slice(0, 7))],
+        "2023-04-01": [
+            _FilePart(str(files[1]), slice(7, 10)),
+            _FilePart(str(files[0])),
+        ],
+    }
+
+
+def test_rpg2nc_daily(tmp_path, files):
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    new_files = rpg2nc_daily(f"{tmp_path}/*.LV1", output_dir, jobs=2)
+    assert [os.path.basename(file) for file in new_files] == [
+        "20230330.nc",
+        "20230331.nc",
+        "20230401.nc",
+    ]
+    data = [read_rpg(file)[1] for file in files]
+    expected = {
+        "20230331.nc": data[1]["Ze"][:7],
+        "20230401.nc": np.concatenate((data[1]["Ze"][7:], data[0]["Ze"])),
+    }
+    for name, ze in expected.items():
+        with netCDF4.Dataset(output_dir / name) as nc:
+            assert nc.day == name[-5:-3]
+            assert_array_equal(nc["Ze"][:], ze)
+
+
+def test_short_first_part_is_merged(tmp_path):
+    filenames = [tmp_path / f"file{ind}.LV0" for ind in range(2)]
+    write_rpg(
+        filenames[0], level=0, version=3.5, n_samples=8, start_time=START_TIME - 20
+    )
+    write_rpg(
+        filenames[1], level=0, version=3.5, n_samples=8, start_time=START_TIME + 30
+    )
+    new_files = rpg2nc_daily(filenames, tmp_path, base_name="rpg")
+    assert os.path.basename(new_files[1]) == "rpg_20230401.nc"
+    data = [read_rpg(filename)[1] for filename in filenames]
+    with netCDF4.Dataset(new_files[1]) as nc:
+        assert_array_equal(
+            nc["doppler_spectrum"][:],
+            np.concatenate((data[0]["TotSpec"][7:], data[1]["TotSpec"])),
+        )
+
+
+def test_rpg2nc_daily_skips_up_to_date_days(tmp_path, files):
+    manifest = tmp_path / "manifest.json"
+    assert len(rpg2nc_daily(files, tmp_path, manifest=manifest)) == 3
+    assert rpg2nc_daily(files, tmp_path, manifest=manifest) == []
+    os.utime(files[1], ns=(0, 10**9))
+    new_files = rpg2nc_daily(files, tmp_path, manifest=manifest)
+    assert [os.path.basename(file) for file in new_files] == [
+        "20230331.nc",
+        "20230401.nc",
+    ]
@@ -0,0 +1,63 @@
+import pytest
+from numpy.testing import assert_array_equal
+
+from rpgpy import RPGFileError, read_housekeeping, read_housekeeping_multi, read_rpg
+from rpgpy.synthetic import START_TIME, write_rpg
+
+HOUSEKEEPING_KEYS = ("Time", "MSec", "QF", "RR", "LWP", "TransPow", "PCT")
+
+
+@pytest.mark.parametrize(
+    ("level", "version", "dual_pol"),
+    [(0, 2.0, 0), (0, 3.5, 2), (1, 1.0, 0), (1, 3.5, 1), (1, 4.0, 0)],
+)
+def test_read_housekeeping(tmp_path, level, version, dual_pol):
+    filename = tmp_path / f"file.LV{level}"
+    write_rpg(filename, level=level, version=version, dual_pol=dual_pol)
+    expected_header, expected = read_rpg(filename)
+    header, data = read_housekeeping(filename, sensitivity=True)
+    assert header.keys() == expected_header.keys()
+    for key in HOUSEKEEPING_KEYS:
+        assert_array_equal(data[key], expected[key], err_msg=key)
+    if level == 0:
+        assert_array_equal(data["SLv"], expected["SLv"])
+        assert ("SLh" in data) == (dual_pol > 0)
+    assert "TotSpec" not in data
+    assert "Ze" not in data
+
+
+def test_sensitivity_is_optional(tmp_path):
+    filename = tmp_path / "file.LV0"
+    write_rpg(filename, level=0, version=3.5, dual_pol=2)
+    _, data = read_housekeeping(filename)
+    assert "SLv" not in data
+    _, data = read_housekeeping(filename.read_bytes(), rpg_names=False)
+    assert_array_equal(data["Time of Sample"], read_rpg(filename)[1]["Time"])
+
+
+def test_read_housekeeping_multi(tmp_path):
+    filenames = [tmp_path / f"file{ind}.LV0" for ind in range(4)]
+    for ind, filename in enumerate(filenames):
+        write_rpg(
+            filename,
+            level=0,
+            version=3.5,
+            n_samples=5,
+            start_time=START_TIME + 1 + 3600 * ind,
+            seed=ind,
+        )
+    data = [read_rpg(filename)[1] for filename in filenames]
+    for jobs in (1, 2):
+        output = read_housekeeping_multi(filenames, sensitivity=True, jobs=jobs)
+        assert output["Time"].shape == (20,)
+        for key in ("Time", "TransPow", "SLv"):
+            assert_array_equal(output[key][5:10], data[1][key], err_msg=key)
+
+
+def test_truncated_file(lv1_file):
+    contents = lv1_file.read_bytes()
+    lv1_file.write_bytes(contents[:-10])
+    with pytest.raises(RPGFileError, match="Invalid record 4"):
+        read_housekeeping(lv1_file)
+    with pytest.raises(RPGFileError, match="No files"):
+        read_housekeeping_multi([])
@@ -0,0 +1,102 @@
+import numpy as np
+
+from rpgpy import (
+    read_housekeeping,
+    read_rpg,
+    read_rpg_multi,
+    rpg2nc,
+    rpg2nc_multi,
+    spectra2nc,
+)
+from rpgpy.instrumentation import Collector, FileRecord, track_phase
+from rpgpy.synthetic import START_TIME, write_rpg
+
+
+def test_read_rpg(lv0_file):
+    with Collector() as collector:
+        _, data = read_rpg(lv0_file)
+    assert len(collector.records) == 1
+    record = collector.records[0]
+    assert record.file_name == str(lv0_file)
+    assert set(record.timings) == {"header", "decode"}
+    assert record.bytes_read == lv0_file.stat().st_size
+    assert record.n_samples == 5
+    assert record.n_gates_with_data == np.count_nonzero(data["TotSpec"].any(axis=2))
+
+
+def test_read_housekeeping(lv1_file):
+    with Collector() as collector:
+        read_housekeeping(lv1_file)
+    record = collector.records[0]
+    assert set(record.timings) == {"header", "decode"}
+    assert record.bytes_read == lv1_file.stat().st_size
+    assert record.n_samples == 5
+
+
+def test_no_collector(tmp_path):
+    filename = tmp_path / "file.LV1"
+    write_rpg(filename)
+    with Collector() as collector:
+        pass
+    read_rpg(filename)
+    with track_phase("decode"):
+        pass
+    assert collector.records == []
+
+
+def test_rpg2nc(tmp_path):
+    for ind in range(3):
+        write_rpg(
+            tmp_path / f"file{ind}.LV1",
+            seed=ind,
+            start_time=START_TIME + 1 + 3600 * ind,
+        )
+    finished: list[FileRecord] = []
+    with Collector(callback=finished.append) as collector:
+        rpg2nc(tmp_path / "*.LV1", tmp_path / "output.nc", progress=False)
+    assert finished == collector.records
+    records = collector.to_dicts()
+    assert [record["file_name"] for record in records] == [
+        str(tmp_path / f"file{ind}.LV1") for ind in range(3)
+    ]
+    for record in records:
+        assert set(record["timings"]) == {"header", "decode", "write"}
+        assert record["n_samples"] == 10
+
+
+def test_rpg2nc_multi(tmp_path):
+    write_rpg(tmp_path / "file.LV1")
+    with Collector() as collector:
+        rpg2nc_multi(tmp_path, tmp_path)
+    assert len(collector.records) == 1
+
+
+def test_records_of_worker_processes(tmp_path):
+    for ind in range(2):
+        write_rpg(tmp_path / f"file{ind}.LV1", n_samples=4)
+    finished: list[FileRecord] = []
+    with Collector(callback=finished.append) as collector:
+        rpg2nc_multi(tmp_path, tmp_path, jobs=2)
+    assert finished == collector.records
+    assert sorted(record.file_name for record in collector.records) == [
+        str(tmp_path / f"file{ind}.LV1") for ind in range(2)
+    ]
+    assert [record.n_samples for record in collector.records] == [4, 4]
+
+
+def test_spectra2nc(tmp_path):
+    filename = tmp_path / "file.LV0"
+    write_rpg(filename, level=0, version=3.5)
+    with Collector() as collector:
+        spectra2nc(filename, tmp_path / "output.nc")
+    (record,) = collector.records
+    assert set(record.timings) == {"header", "decode", "moments", "write"}
+
+
+def test_read_rpg_multi(tmp_path):
+    files = [tmp_path / f"file{ind}.LV1" for ind in range(2)]
+    for file in files:
+        write_rpg(file, n_samples=4)
+    with Collector() as collector:
+        read_rpg_multi(files)
+    assert [record.n_samples for record in collector.records] == [4, 4]
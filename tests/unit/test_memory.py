@@ -0,0 +1,107 @@
+import logging
+
+import netCDF4
+import pytest
+from numpy.testing import assert_array_equal
+
+from rpgpy import read_rpg, rpg2nc, spectra2nc
+from rpgpy.memory import _estimate, estimate_memory
+from rpgpy.synthetic import START_TIME, write_rpg
+
+
+def test_estimate_of_decoded_arrays(tmp_path):
+    filename = tmp_path / "file.LV1"
+    write_rpg(filename, n_samples=7, dual_pol=2)
+    _, data = read_rpg(filename)
+    estimate = estimate_memory(filename)
+    assert estimate.read_rpg == sum(array.nbytes for array in data.values())
+    assert estimate.spectra2moments == estimate.read_rpg
+    assert estimate.rpg2nc > estimate.read_rpg
+
+
+def test_estimate_of_several_files(tmp_path):
+    filenames = [tmp_path / "file.LV0", tmp_path / "file.LV1"]
+    write_rpg(filenames[0], level=0, version=3.5, n_samples=7, dual_pol=1)
+    write_rpg(filenames[1], n_samples=7)
+    estimates = [estimate_memory(filename) for filename in filenames]
+    assert estimate_memory(filenames) == estimates[0]
+    _, data = read_rpg(filenames[0])
+    assert estimates[0].read_rpg == sum(array.nbytes for array in data.values())
+    assert estimates[0].spectra2moments > estimates[0].read_rpg
+
+
+def test_estimate_with_dealiasing(lv0_file):
+    header, data = read_rpg(lv0_file)
+    estimate = estimate_memory(lv0_file)
+    dealiased = estimate_memory(lv0_file, dealias=True)
+    assert dealiased.read_rpg == estimate.read_rpg
+    extra = dealiased.spectra2moments - estimate.spectra2moments
+    assert extra == data["TotSpec"].shape[0] * header["RAltN"] * 4
+
+
+@pytest.mark.parametrize("spectra_layout", ["padded", "chirp"])
+def test_rpg2nc_in_chunks(tmp_path, caplog, spectra_layout):
+    filenames = [tmp_path / f"file{ind}.LV0" for ind in range(2)]
+    for ind, filename in enumerate(filenames):
+        write_rpg(
+            filename,
+            level=0,
+            version=3.5,
+            n_samples=7,
+            seed=ind,
+            start_time=START_TIME + 1 + 3600 * ind,
+        )
+    header, _ = read_rpg(filenames[0])
+    budget = 4 * _estimate(header, 1).rpg2nc
+    args = (f"{tmp_path}/*.LV0",)
+    kwargs = {"progress": False, "spectra_layout": spectra_layout}
+    rpg2nc(*args, tmp_path / "full.nc", **kwargs)
+    with caplog.at_level(logging.INFO):
+        rpg2nc(*args, tmp_path / "chunked.nc", **kwargs, memory_budget=budget)
+    assert "in chunks of 4 samples" in caplog.text
+    _assert_same_variables(tmp_path / "full.nc", tmp_path / "chunked.nc")
+
+
+def test_spectra2nc_in_chunks(tmp_path):
+    filename = tmp_path / "file.LV0"
+    write_rpg(filename, level=0, version=3.5, n_samples=7, anti_alias=1)
+    header, _ = read_rpg(filename)
+    budget = 4 * _estimate(header, 1).spectra2moments
+    spectra2nc(filename, tmp_path / "full.nc")
+    spectra2nc(filename, tmp_path / "chunked.nc", memory_budget=budget)
+    _assert_same_variables(tmp_path / "full.nc", tmp_path / "chunked.nc")
+
+
+def test_file_fitting_budget_is_read_at_once(tmp_path, caplog):
+    filename = tmp_path / "file.LV1"
+    write_rpg(filename, n_samples=7)
+    budget = estimate_memory(filename).rpg2nc
+    with caplog.at_level(logging.INFO):
+        rpg2nc(filename, tmp_path / "file.nc", memory_budget=budget)
+    assert "chunks" not in caplog.text
+
+
+@pytest.mark.parametrize("n_samples", [1, 3])
+def test_chunk_length_equal_to_other_dimensions(tmp_path, n_samples):
+    filename = tmp_path / "file.LV0"
+    write_rpg(filename, level=0, version=3.5, n_levels=30, spec_n=(4, 5, 8))
+    header, _ = read_rpg(filename)
+    budget = n_samples * _estimate(header, 1).rpg2nc
+    rpg2nc(filename, tmp_path / "full.nc")
+    rpg2nc(filename, tmp_path / "chunked.nc", memory_budget=budget)
+    _assert_same_variables(tmp_path / "full.nc", tmp_path / "chunked.nc")
+
+
+def test_invalid_memory_budget(tmp_path):
+    filename = tmp_path / "file.LV1"
+    write_rpg(filename)
+    with pytest.raises(ValueError, match="memory_budget"):
+        rpg2nc(filename, tmp_path / "file.nc", memory_budget=0)
+
+
+def _assert_same_variables(expected_file, file):
+    with netCDF4.Dataset(expected_file) as expected, netCDF4.Dataset(file) as nc:
+        assert expected.variables.keys() == nc.variables.keys()
+        for key, variable in expected.variables.items():
+            assert variable.dimensions == nc.variables[key].dimensions, key
+            assert_array_equal(variable[:], nc.variables[key][:], err_msg=key)
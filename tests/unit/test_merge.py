@@ -0,0 +1,91 @@
+import netCDF4
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from rpgpy import header as head
+from rpgpy import read_rpg, rpg2nc, subset_rpg
+from rpgpy.nc import _FilePart, _merge_parts
+from rpgpy.synthetic import START_TIME, write_rpg
+
+
+@pytest.fixture
+def full_file(tmp_path):
+    filename = tmp_path / "full.LV0"
+    write_rpg(filename, level=0, version=3.5, n_samples=20)
+    return filename
+
+
+def test_overlapping_files_are_merged(tmp_path, full_file):
+    subset_rpg(full_file, tmp_path / "a.LV0", samples=slice(8, 20))
+    subset_rpg(full_file, tmp_path / "b.LV0", samples=slice(0, 12))
+    rpg2nc(f"{tmp_path}/[ab].LV0", tmp_path / "merged.nc", progress=False, merge=True)
+    rpg2nc(full_file, tmp_path / "full.nc")
+    with (
+        netCDF4.Dataset(tmp_path / "full.nc") as expected,
+        netCDF4.Dataset(tmp_path / "merged.nc") as nc,
+    ):
+        assert len(nc.dimensions["time"]) == 20
+        for key in ("time", "time_ms", "doppler_spectrum"):
+            assert_array_equal(nc[key][:], expected[key][:], err_msg=key)
+
+
+def test_duplicate_file_is_skipped(tmp_path, full_file):
+    parts = [tmp_path / "a.LV0", tmp_path / "b.LV0", tmp_path / "c.LV0"]
+    subset_rpg(full_file, parts[0], samples=slice(0, 12))
+    subset_rpg(full_file, parts[1], samples=slice(2, 6))
+    subset_rpg(full_file, parts[2], samples=slice(10, 20))
+    merged = _merge_parts([_FilePart(str(part)) for part in parts])
+    assert merged == [
+        _FilePart(str(parts[0])),
+        _FilePart(str(parts[2]), slice(2, 10)),
+    ]
+
+
+def test_files_are_sorted_by_time(tmp_path):
+    filenames = [tmp_path / f"file{ind}.LV1" for ind in range(2)]
+    write_rpg(filenames[0], n_samples=5, start_time=START_TIME + 3600)
+    write_rpg(filenames[1], n_samples=5, seed=1)
+    merged = _merge_parts([_FilePart(str(file)) for file in filenames])
+    assert merged == [_FilePart(str(filenames[1])), _FilePart(str(filenames[0]))]
+    rpg2nc(f"{tmp_path}/*.LV1", tmp_path / "file.nc", progress=False, merge=True)
+    with netCDF4.Dataset(tmp_path / "file.nc") as nc:
+        assert np.all(np.diff(nc["time"][:]) > 0)
+
+
+def test_files_are_not_merged_by_default(tmp_path, full_file):
+    subset_rpg(full_file, tmp_path / "a.LV0", samples=slice(8, 20))
+    subset_rpg(full_file, tmp_path / "b.LV0", samples=slice(0, 12))
+    rpg2nc(f"{tmp_path}/[ab].LV0", tmp_path / "file.nc", progress=False)
+    _, data = read_rpg(full_file)
+    with netCDF4.Dataset(tmp_path / "file.nc") as nc:
+        expected = np.concatenate((data["Time"][8:20], data["Time"][0:12]))
+        assert_array_equal(nc["time"][:], expected)
+
+
+def test_interleaved_samples(tmp_path, full_file):
+    parts = [tmp_path / "a.LV0", tmp_path / "b.LV0"]
+    subset_rpg(full_file, parts[0], samples=slice(0, 20, 2))
+    subset_rpg(full_file, parts[1], samples=slice(1, 20, 2))
+    rpg2nc(f"{tmp_path}/[ab].LV0", tmp_path / "merged.nc", progress=False, merge=True)
+    _, data = read_rpg(full_file)
+    with netCDF4.Dataset(tmp_path / "merged.nc") as nc:
+        assert_array_equal(nc["time"][:], data["Time"])
+
+
+def test_files_are_indexed_once(tmp_path, full_file, monkeypatch):
+    parts = [tmp_path / "a.LV0", tmp_path / "b.LV0"]
+    subset_rpg(full_file, parts[0], samples=slice(8, 20))
+    subset_rpg(full_file, parts[1], samples=slice(0, 12))
+    calls: list[str] = []
+    for name in ("read_rpg_header", "read_record_index"):
+        func = getattr(head, name)
+
+        def spy(*args, _func=func, **kwargs):
+            calls.append(_func.__name__)
+            return _func(*args, **kwargs)
+
+        monkeypatch.setattr(head, name, spy)
+    merged = _merge_parts([_FilePart(str(part)) for part in parts])
+    assert merged == [_FilePart(str(parts[1])), _FilePart(str(parts[0]), slice(4, 12))]
+    assert sorted(calls) == 2 * ["read_record_index"] + 2 * ["read_rpg_header"]
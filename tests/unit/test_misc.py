@@ -1,8 +1,14 @@
 import os
+from pathlib import Path
 
+import numpy as np
 import pytest
+from numpy.testing import assert_array_equal
 
-from rpgpy import RPGFileError, read_rpg
+import rpgpy.header
+from rpgpy import RPGFileError, read_rpg, read_rpg_multi, salvage_rpg, validate_rpg
+from rpgpy.synthetic import write_rpg
+from rpgpy.utils import RPGValidationError
 
 FILE_PATH = os.path.dirname(os.path.realpath(__file__))
 
@@ -11,3 +17,143 @@ def test_invalid_file():
     input_file = f"{FILE_PATH}/../data/corrupted_files/230401_000001_P00_ZEN.LV1"
     with pytest.raises(RPGFileError):
         read_rpg(input_file)
+
+
+def test_salvage_truncated_file():
+    input_file = f"{FILE_PATH}/../data/corrupted_files/230401_000001_P00_ZEN.LV1"
+    _, data, report = salvage_rpg(input_file)
+    assert report.n_samples_expected == 1093
+    assert report.n_samples_read == 224
+    assert report.dropped == [(1128580, os.path.getsize(input_file))]
+    assert data["Ze"].shape == (224, 327)
+    assert np.all(np.diff(data["Time"]) > 0)
+
+
+def test_salvage_skips_corrupted_record(tmp_path):
+    input_file = f"{FILE_PATH}/../data/misc/BaseN_210913_001152_P01_PPI.LV1"
+    header, data = read_rpg(input_file)
+    raw = bytearray(Path(input_file).read_bytes())
+    offsets = [12 + header["HeaderLen"]]
+    for _ in range(6):
+        samp_bytes = np.frombuffer(raw, np.int32, 1, offsets[-1])[0]
+        offsets.append(offsets[-1] + 4 + int(samp_bytes))
+    start, stop = offsets[5], offsets[6]
+    raw[start : start + 8] = b"\xff" * 8
+    corrupted_file = tmp_path / "corrupted.LV1"
+    corrupted_file.write_bytes(raw)
+    with pytest.raises(RPGFileError):
+        read_rpg(corrupted_file)
+    _, salvaged, report = salvage_rpg(corrupted_file)
+    assert report.n_samples_read == len(data["Time"]) - 1
+    assert report.dropped == [(start, stop)]
+    assert_array_equal(salvaged["Time"], np.delete(data["Time"], 5))
+    assert_array_equal(salvaged["Ze"], np.delete(data["Ze"], 5, axis=0))
+
+
+def test_read_rpg_multi():
+    input_file = f"{FILE_PATH}/../data/misc/BaseN_210913_001152_P01_PPI.LV1"
+    header, data = read_rpg(input_file)
+    header_multi, data_multi = read_rpg_multi([input_file, input_file])
+    assert header_multi["RAltN"] == header["RAltN"]
+    assert data_multi.keys() == data.keys()
+    for key, array in data.items():
+        assert_array_equal(data_multi[key], np.concatenate((array, array)))
+
+
+def test_read_rpg_multi_level0():
+    input_file = f"{FILE_PATH}/../data/level0/v3-889346/200704_000002_P10_ZEN.LV0"
+    _, data = read_rpg(input_file)
+    _, data_multi = read_rpg_multi([input_file, input_file])
+    assert data_multi.keys() == data.keys()
+    for key, array in data.items():
+        assert_array_equal(data_multi[key], np.concatenate((array, array)))
+
+
+def test_read_rpg_multi_without_files():
+    with pytest.raises(RPGFileError):
+        read_rpg_multi([])
+
+
+def test_salvage_skips_invalid_block_indices(tmp_path):
+    filename, expected, offset = _write_invalid_block(tmp_path)
+    with pytest.raises(RPGFileError):
+        read_rpg(filename)
+    _, data, report = salvage_rpg(filename)
+    assert report.n_samples_read == 4
+    assert len(report.dropped) == 1
+    assert report.dropped[0][0] == offset
+    assert_array_equal(data["TotSpec"], np.delete(expected["TotSpec"], 1, axis=0))
+
+
+def _write_invalid_block(tmp_path):
+    filename = tmp_path / "file.LV0"
+    expected = write_rpg(filename, level=0, version=3.5, n_samples=5, sparsity=0)
+    header, _ = read_rpg(filename)
+    raw = bytearray(filename.read_bytes())
+    offset = 12 + header["HeaderLen"]
+    offset += 4 + int(np.frombuffer(raw, np.int32, 1, offset)[0])
+    n_levels = header["RAltN"]
+    n_dummy = 3 + header["TAltN"] + 2 * header["HAltN"] + n_levels
+    min_ind_position = offset + 4 + 77 + 4 * (n_dummy + n_levels) + n_levels + 5
+    raw[min_ind_position : min_ind_position + 2] = np.int16(-1).tobytes()
+    filename.write_bytes(raw)
+    return filename, expected, offset
+
+
+def test_validation_of_block_indices(tmp_path):
+    filename, expected, _ = _write_invalid_block(tmp_path)
+    with pytest.raises(RPGValidationError, match="negative min_ind"):
+        read_rpg(filename)
+    _, data = read_rpg(filename, validation="warn")
+    assert_array_equal(data["TotSpec"][0], expected["TotSpec"][0])
+    assert np.all(data["TotSpec"][1] == 0)
+    assert_array_equal(data["TotSpec"][2:], expected["TotSpec"][2:])
+    assert_array_equal(data["Time"], expected["Time"])
+    _, _, report = validate_rpg(filename)
+    assert report.n_samples == 5
+    assert not report.is_valid
+    assert [(problem.sample, problem.kind) for problem in report.problems] == [
+        (1, "block")
+    ]
+    assert "range gate 0" in report.problems[0].message
+
+
+def test_validation_of_timestamps(lv1_file):
+    header, expected = read_rpg(lv1_file)
+    raw = bytearray(lv1_file.read_bytes())
+    offset = 12 + header["HeaderLen"]
+    for sample in range(5):
+        if sample in (1, 3):
+            raw[offset + 4 : offset + 8] = np.uint32(1).tobytes()
+        offset += 4 + int(np.frombuffer(raw, np.int32, 1, offset)[0])
+    lv1_file.write_bytes(raw)
+    with pytest.raises(RPGValidationError, match="2 problems") as err:
+        read_rpg(lv1_file)
+    assert [problem.sample for problem in err.value.problems] == [1, 3]
+    for validation in ("warn", "off"):
+        _, data = read_rpg(lv1_file, validation=validation)
+        assert_array_equal(data["Ze"], expected["Ze"])
+    _, _, report = validate_rpg(lv1_file, rpg_names=False)
+    assert [problem.kind for problem in report.problems] == ["timestamp"] * 2
+
+
+def test_invalid_validation_mode(tmp_path):
+    filename = tmp_path / "file.LV1"
+    write_rpg(filename)
+    with pytest.raises(ValueError, match="validation"):
+        read_rpg(filename, validation="lenient")
+
+
+def test_file_removed_before_decoding(tmp_path, monkeypatch):
+    filename = tmp_path / "file.LV1"
+    write_rpg(filename)
+    read_rpg_header = rpgpy.header.read_rpg_header
+
+    def read_header_and_remove(source):
+        header = read_rpg_header(source)
+        filename.unlink()
+        return header
+
+    monkeypatch.setattr(rpgpy.header, "read_rpg_header", read_header_and_remove)
+    with pytest.raises(FileNotFoundError):
+        read_rpg(filename)
@@ -1,6 +1,7 @@
 import logging
 import os
 from time import time
+from typing import ClassVar
 
 import numpy as np
 from numpy.testing import assert_array_almost_equal
@@ -47,6 +48,16 @@ class TestFindPeaks:
         assert ind_right == 8
 
 
+def test_radar_moment_calculation_dtype():
+    signal = np.array([0.1, 0.4, 0.2], dtype=np.float32)
+    velocity = np.array([-0.5, 0.0, 0.5], dtype=np.float32)
+    moments = spcutil.radar_moment_calculation(signal, velocity)
+    assert moments.dtype == np.float32
+    reference = spcutil.radar_moment_calculation(signal, velocity, np.float64)
+    assert reference.dtype == np.float64
+    assert_array_almost_equal(moments, reference, decimal=5)
+
+
 class TestMoments:
     input_file = f"{FILE_PATH}/../data/level0/v3-889346/200704_000002_P10_ZEN.LV0"
     header, data = read_rpg(input_file)
@@ -80,3 +91,146 @@ def test_spectral_ldr():
     input_file = f"{FILE_PATH}/../data/level0/v3-889346/190912_060003_P05_ZEN.LV0"
     header, data = read_rpg(input_file)
     spcutil.calc_spectral_LDR(header, data)
+
+
+class TestPeakMoments:
+    velocity = np.linspace(-5, 5, 16)
+    header: ClassVar[dict] = {
+        "RngOffs": np.array([0]),
+        "RAltN": 2,
+        "SequN": 1,
+        "SpecN": np.array([16]),
+        "MaxVel": np.array([5.0]),
+        "velocity_vectors": velocity[np.newaxis, :],
+    }
+    spectra = np.zeros((1, 2, 16), dtype=np.float32)
+    spectra[0, 0, 1:6] = (0.1, 0.3, 0.5, 0.3, 0.1)
+    spectra[0, 0, 8:14] = (0.2, 0.4, 0.9, 0.6, 0.3, 0.1)
+    spectra[0, 1, 10:12] = (0.5, 0.4)
+    data: ClassVar[dict] = {"TotSpec": spectra}
+
+    def test_peaks_are_ordered_by_maximum(self):
+        moments = spcutil.spectra2peak_moments(self.data, self.header, n_peaks=3)
+        for key in ("Ze", "MeanVel", "SpecWidth", "Skewn", "Kurt"):
+            assert moments[key].shape == (1, 2, 3)
+        ze = moments["Ze"][0, 0]
+        assert_array_almost_equal(ze[:2], [2.5 / 2, 1.3 / 2])
+        assert ze[2] == -999.0
+        assert moments["MeanVel"][0, 0, 0] > moments["MeanVel"][0, 0, 1]
+
+    def test_narrow_peaks_are_skipped(self):
+        moments = spcutil.spectra2peak_moments(self.data, self.header, n_points_min=3)
+        assert np.all(moments["Ze"][0, 1] == -999.0)
+
+    def test_narrow_main_peak(self):
+        spectra = np.zeros((1, 1, 16), dtype=np.float32)
+        spectra[0, 0, 2:4] = [1.0, 0.8]
+        spectra[0, 0, 8:13] = [0.1, 0.3, 0.5, 0.3, 0.1]
+        header = {**self.header, "RAltN": 1}
+        data = {"TotSpec": spectra}
+        moments = spectra2moments(data, header, n_points_min=3)
+        assert moments["Ze"][0, 0] == -999.0
+        peaks = spcutil.spectra2peak_moments(data, header, n_points_min=3)
+        assert_array_almost_equal(peaks["Ze"][0, 0], [1.3 / 2, -999.0, -999.0])
+
+    def test_main_peak_matches_spectra2moments(self):
+        moments = spectra2moments(self.data, self.header, n_points_min=3)
+        peaks = spcutil.spectra2peak_moments(
+            self.data, self.header, n_peaks=1, n_points_min=3
+        )
+        for key, array in moments.items():
+            assert_array_almost_equal(array, peaks[key][:, :, 0], decimal=5)
+
+
+class TestNoise:
+    header: ClassVar[dict] = {
+        "RngOffs": np.array([0, 1]),
+        "RAltN": 2,
+        "SequN": 2,
+        "SpecN": np.array([16, 8]),
+        "MaxVel": np.array([5.0, 2.5]),
+        "ChirpReps": np.array([256, 128]),
+    }
+    header["velocity_vectors"] = np.array(
+        [
+            np.linspace(-5, 5, 16),
+            np.concatenate((np.zeros(4), np.linspace(-2.5, 2.5, 8), np.zeros(4))),
+        ]
+    )
+    spectra = np.zeros((1, 2, 16), dtype=np.float32)
+    spectra[0, 0, :] = np.tile([0.09, 0.11], 8)
+    spectra[0, 0, 6:11] += (0.2, 0.6, 1.0, 0.6, 0.2)
+    spectra[0, 1, 4:12] = np.tile([0.09, 0.11], 4)
+    spectra[0, 1, 6:10] += (0.5, 1.0, 0.8, 0.3)
+    data: ClassVar[dict] = {"TotSpec": spectra}
+
+    def test_noise_level(self):
+        noise = spcutil.estimate_noise(self.data, self.header)
+        for key in ("level", "threshold", "snr"):
+            assert noise[key].shape == (1, 2)
+        assert_array_almost_equal(noise["level"][0], [0.1, 0.1], decimal=2)
+        assert np.all(noise["threshold"][0] == np.float32(0.11))
+        assert np.all(noise["snr"][0] > 1)
+
+    def test_find_peak_edges_with_threshold(self):
+        data = np.array([0.1, 0.11, 0.5, 0.8, 0.4, 0.09, 0.2, 0.1])
+        assert spcutil.find_peak_edges(data, 0.11) == (2, 5)
+
+    def test_moments_with_noise(self):
+        noise = spcutil.estimate_noise(self.data, self.header)
+        moments = spectra2moments(self.data, self.header, n_points_min=3, noise=noise)
+        level = noise["level"][0]
+        peak = self.spectra[0, 0, 6:11] - level[0]
+        assert_array_almost_equal(moments["Ze"][0, 0], np.sum(peak) / 2, decimal=5)
+        assert_array_almost_equal(moments["MeanVel"][0, 0], 0.0, decimal=1)
+        assert np.all(np.isfinite(moments["Ze"][0]))
+        peaks = spcutil.spectra2peak_moments(
+            self.data, self.header, n_peaks=1, n_points_min=3, noise=noise
+        )
+        for key, array in moments.items():
+            assert_array_almost_equal(array, peaks[key][:, :, 0], decimal=5)
+
+    def test_dtype(self):
+        noise = spcutil.estimate_noise(self.data, self.header)
+        for dtype in (np.float32, np.float64):
+            moments = spectra2moments(
+                self.data, self.header, n_points_min=3, dtype=dtype
+            )
+            peaks = spcutil.spectra2peak_moments(self.data, self.header, dtype=dtype)
+            for array in (*moments.values(), *peaks.values()):
+                assert array.dtype == dtype
+                assert array.flags.c_contiguous
+        assert noise["level"].dtype == np.float32
+
+
+class TestDealias:
+    header = TestPeakMoments.header
+    spectra = TestPeakMoments.spectra
+    data: ClassVar[dict] = {
+        "TotSpec": spectra,
+        "AliasMsk": np.array([[1, 0]], dtype=np.int8),
+        "MinVel": np.array([[-2.0, 0.0]], dtype=np.float32),
+    }
+
+    def test_dealias_velocity(self):
+        offset = spcutil.dealias_velocity(self.data, self.header)
+        assert_array_almost_equal(offset, [[3.0, 0.0]])
+
+    def test_without_anti_aliasing(self):
+        offset = spcutil.dealias_velocity(TestPeakMoments.data, self.header)
+        assert np.all(offset == 0)
+
+    def test_moments_use_unfolded_velocity(self):
+        folded = spectra2moments(self.data, self.header, n_points_min=3, dealias=False)
+        moments = spectra2moments(self.data, self.header, n_points_min=3, dealias=True)
+        assert_array_almost_equal(moments["MeanVel"][0, 0], folded["MeanVel"][0, 0] + 3)
+        assert_array_almost_equal(moments["SpecWidth"], folded["SpecWidth"])
+        peaks = spcutil.spectra2peak_moments(
+            self.data, self.header, n_points_min=3, dealias=True
+        )
+        assert_array_almost_equal(peaks["MeanVel"][:, :, 0], moments["MeanVel"])
+
+    def test_dealiasing_is_optional(self):
+        folded = spectra2moments(self.data, self.header, n_points_min=3, dealias=False)
+        moments = spectra2moments(self.data, self.header, n_points_min=3)
+        assert_array_almost_equal(moments["MeanVel"], folded["MeanVel"])
@@ -3,9 +3,11 @@ import os
 from pathlib import Path
 
 import netCDF4
+import pytest
 
 from rpgpy import nc as rpgpync
 from rpgpy import read_rpg, rpg2nc, rpg2nc_multi, spectra2nc
+from rpgpy.synthetic import write_rpg
 
 FILE_PATH = os.path.dirname(os.path.realpath(__file__))
 
@@ -218,3 +220,16 @@ class TestGeneratorFiles:
             assert file.endswith(self.lv1 + self.lv0)
             assert os.path.exists(file)
         assert len(files) >= 7
+
+
+@pytest.mark.parametrize("n_samples", [1, 3, 30])
+def test_dimensions_of_level1_file(tmp_path, n_samples):
+    filename = tmp_path / "file.LV1"
+    write_rpg(filename, n_samples=n_samples)
+    rpg2nc(filename, tmp_path / "file.nc")
+    with netCDF4.Dataset(tmp_path / "file.nc") as nc:
+        assert len(nc.dimensions["time"]) == n_samples
+        assert nc["time"].dimensions == ("time",)
+        assert nc["Ze"].dimensions == ("time", "range")
+        assert nc["range_layers"].dimensions == ("range",)
+        assert nc["chirp_start_indices"].dimensions == ("chirp",)
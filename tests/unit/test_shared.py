@@ -0,0 +1,65 @@
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import pytest
+from numpy.testing import assert_array_equal
+
+from rpgpy import read_rpg
+from rpgpy.shared import estimate_shared_size, read_rpg_shared
+from rpgpy.synthetic import write_rpg
+
+
+@pytest.mark.parametrize("level", [0, 1])
+def test_read_rpg_shared(tmp_path, level):
+    filename = tmp_path / f"file.LV{level}"
+    write_rpg(filename, level=level, version=3.5, n_samples=5)
+    _, handle = read_rpg_shared(filename)
+    assert len(pickle.dumps(handle)) < 10_000
+    _, expected = read_rpg(filename)
+    with handle.open() as data:
+        assert data.keys() == expected.keys()
+        for key, array in expected.items():
+            assert_array_equal(data[key], array)
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(handle.name)
+
+
+def test_read_in_worker_process(lv0_file):
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(1, mp_context=context) as executor:
+        header, handle = executor.submit(
+            read_rpg_shared, lv0_file, rpg_names=False
+        ).result()
+    _, expected = read_rpg(lv0_file, rpg_names=False)
+    with handle.open() as data:
+        assert_array_equal(data["Doppler Spectrum"], expected["Doppler Spectrum"])
+    assert "Header Length" in header
+
+
+def test_read_into_given_block(lv0_file):
+    size = estimate_shared_size(lv0_file)
+    block = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        assert block.buf is not None
+        block.buf[:] = b"\xff" * size
+        _, handle = read_rpg_shared(lv0_file, block_name=block.name)
+        assert handle.name == block.name
+        assert handle.nbytes == size
+        _, expected = read_rpg(lv0_file)
+        with handle.open(unlink=False) as data:
+            assert_array_equal(data["TotSpec"], expected["TotSpec"])
+    finally:
+        block.close()
+        block.unlink()
+
+
+def test_block_too_small(lv1_file):
+    block = shared_memory.SharedMemory(create=True, size=16)
+    try:
+        with pytest.raises(ValueError, match="bytes"):
+            read_rpg_shared(lv1_file, block_name=block.name)
+    finally:
+        block.close()
+        block.unlink()
@@ -0,0 +1,75 @@
+import io
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from rpgpy import read_rpg, read_rpg_multi, salvage_rpg, validate_rpg
+from rpgpy.header import read_record_index, read_rpg_header
+from rpgpy.synthetic import write_rpg
+from rpgpy.utils import RPGFileError
+
+SOURCES: dict[str, Callable[[bytes], object]] = {
+    "bytes": bytes,
+    "bytearray": bytearray,
+    "memoryview": memoryview,
+    "ndarray": lambda raw: np.frombuffer(raw, np.uint8),
+    "file-like": io.BytesIO,
+}
+
+
+@pytest.mark.parametrize("source", SOURCES)
+@pytest.mark.parametrize(("level", "version"), [(0, 3.5), (1, 4.0), (1, 1.0)])
+def test_read_from_memory(tmp_path, source, level, version):
+    filename = tmp_path / "file.LV0"
+    write_rpg(filename, level, version, n_samples=5, dual_pol=1)
+    raw = filename.read_bytes()
+    expected_header, expected = read_rpg(filename)
+    header, data = read_rpg(SOURCES[source](raw))
+    assert header.keys() == expected_header.keys()
+    assert data.keys() == expected.keys()
+    for key, array in expected.items():
+        assert_array_equal(data[key], array, err_msg=key)
+
+
+def test_read_from_open_file(lv1_file):
+    _, expected = read_rpg(lv1_file)
+    with lv1_file.open("rb") as file:
+        _, data = read_rpg(file)
+    assert_array_equal(data["Ze"], expected["Ze"])
+
+
+def test_read_options_from_memory(lv0_file):
+    raw = lv0_file.read_bytes()
+    for kwargs in ({"time_step": 10}, {"spectra_layout": "chirp"}):
+        _, expected = read_rpg(lv0_file, **kwargs)
+        _, data = read_rpg(raw, **kwargs)
+        assert_array_equal(data["Time"], expected["Time"])
+    _, data, report = validate_rpg(raw)
+    assert report.is_valid
+    _, salvaged, report = salvage_rpg(raw)
+    assert report.n_samples_read == 5
+    assert_array_equal(salvaged["TotSpec"], data["TotSpec"])
+    header, _ = read_rpg_header(raw)
+    assert len(read_record_index(raw, header).offset) == 5
+
+
+def test_read_multi_from_memory(tmp_path):
+    filenames = [tmp_path / f"file{ind}.LV1" for ind in range(2)]
+    for ind, filename in enumerate(filenames):
+        write_rpg(filename, n_samples=5, seed=ind)
+    _, expected = read_rpg_multi(filenames)
+    sources = [filenames[0].read_bytes(), io.BytesIO(filenames[1].read_bytes())]
+    _, data = read_rpg_multi(sources)
+    assert_array_equal(data["Ze"], expected["Ze"])
+
+
+def test_truncated_buffer(lv1_file):
+    with pytest.raises(RPGFileError):
+        read_rpg(lv1_file.read_bytes()[:-10])
+
+
+def test_invalid_source():
+    with pytest.raises(TypeError):
+        read_rpg(1)
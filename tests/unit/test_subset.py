@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from rpgpy import RPGFileError, read_rpg, subset_rpg, utils
+from rpgpy.synthetic import write_rpg
+
+
+@pytest.fixture(params=[(0, 3.5), (0, 2.0), (1, 4.0), (1, 1.0)])
+def rpg_file(request, tmp_path):
+    level, version = request.param
+    filename = tmp_path / "input.bin"
+    write_rpg(filename, level, version, n_samples=10, dual_pol=1)
+    return filename
+
+
+def test_sample_subset(rpg_file, tmp_path):
+    output_file = tmp_path / "output.bin"
+    n_samples = subset_rpg(rpg_file, output_file, samples=[1, 2, 3, 7])
+    assert n_samples == 4
+    header, data = read_rpg(rpg_file)
+    new_header, new_data = read_rpg(output_file)
+    for key, array in data.items():
+        assert_array_equal(new_data[key], array[[1, 2, 3, 7]])
+    assert new_header["HeaderLen"] == header["HeaderLen"]
+    if "StartTime" in header:
+        assert new_header["StartTime"] == data["Time"][1]
+        assert new_header["StopTime"] == data["Time"][7]
+
+
+def test_unsorted_samples(rpg_file, tmp_path):
+    output_file = tmp_path / "output.bin"
+    assert subset_rpg(rpg_file, output_file, samples=[7, 1, 7, 3]) == 3
+    _, data = read_rpg(rpg_file)
+    _, new_data = read_rpg(output_file)
+    assert_array_equal(new_data["Time"], data["Time"][[1, 3, 7]])
+
+
+def test_time_window(rpg_file, tmp_path):
+    output_file = tmp_path / "output.bin"
+    _, data = read_rpg(rpg_file)
+    timestamps = utils.rpg_seconds2datetime64(data["Time"], data["MSec"])
+    subset_rpg(rpg_file, output_file, timestamps[2], timestamps[5])
+    _, new_data = read_rpg(output_file)
+    assert_array_equal(new_data["Time"], data["Time"][2:5])
+
+
+def test_time_window_and_slice(rpg_file, tmp_path):
+    output_file = tmp_path / "output.bin"
+    _, data = read_rpg(rpg_file)
+    timestamps = utils.rpg_seconds2datetime64(data["Time"], data["MSec"])
+    subset_rpg(rpg_file, output_file, start_time=timestamps[3], samples=slice(0, 6))
+    _, new_data = read_rpg(output_file)
+    assert_array_equal(new_data["Time"], data["Time"][3:6])
+
+
+def test_empty_subset(rpg_file, tmp_path):
+    with pytest.raises(RPGFileError):
+        subset_rpg(rpg_file, tmp_path / "output.bin", stop_time=np.datetime64("2001"))
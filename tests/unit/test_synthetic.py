@@ -0,0 +1,260 @@
+import itertools
+import tracemalloc
+
+import netCDF4
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from rpgpy import data as data_module
+from rpgpy import read_rpg, read_rpg_multi, rpg2nc, spectra2moments, spectra2nc
+from rpgpy.instrumentation import Collector
+from rpgpy.metadata import METADATA
+from rpgpy.spcutil import calc_spectral_LDR, estimate_noise, spectra2peak_moments
+from rpgpy.synthetic import FILE_CODES, START_TIME, write_rpg
+
+LEVEL0_OPTIONS = list(itertools.product((0, 1, 2), (0, 1, 2), (0, 1)))
+
+
+@pytest.mark.parametrize(
+    ("level", "version", "compression", "dual_pol", "anti_alias"),
+    [
+        (level, version, *options)
+        for level, version in FILE_CODES
+        for options in (
+            LEVEL0_OPTIONS if level == 0 else [(0, pol, 0) for pol in (0, 1, 2)]
+        )
+    ],
+)
+def test_round_trip(tmp_path, level, version, compression, dual_pol, anti_alias):
+    filename = tmp_path / "file.LV0"
+    expected = write_rpg(
+        filename,
+        level,
+        version,
+        n_samples=4,
+        compression=compression,
+        dual_pol=dual_pol,
+        anti_alias=anti_alias,
+    )
+    header, data = read_rpg(filename)
+    assert header["FileCode"] == FILE_CODES[(level, version)]
+    assert data.keys() == expected.keys()
+    for key, array in expected.items():
+        assert_array_equal(data[key], array, err_msg=key)
+
+
+def test_invalid_version(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported"):
+        write_rpg(tmp_path / "file.LV0", level=0, version=4.0)
+
+
+def test_sparsity(tmp_path):
+    write_rpg(tmp_path / "file.LV1", n_samples=5, sparsity=1)
+    _, data = read_rpg(tmp_path / "file.LV1")
+    assert not np.any(data["Ze"])
+
+
+def test_level0_products(tmp_path):
+    filename = tmp_path / "file.LV0"
+    write_rpg(filename, level=0, version=3.5, compression=1, dual_pol=2)
+    header, data = read_rpg(filename)
+    moments = spectra2moments(data, header)
+    assert moments["Ze"].shape == data["TotSpec"].shape[:2]
+    sldr = calc_spectral_LDR(header, data)
+    assert isinstance(sldr, np.ndarray)
+    assert sldr.shape == data["TotSpec"].shape
+    spectra2nc(filename, tmp_path / "moments.nc")
+    with netCDF4.Dataset(tmp_path / "moments.nc") as nc:
+        assert nc.variables["Ze"].shape == moments["Ze"].shape
+
+
+def test_spectral_ldr(tmp_path):
+    filename = tmp_path / "file.LV0"
+    write_rpg(filename, level=0, version=3.5, compression=1, dual_pol=2)
+    header, data = read_rpg(filename)
+    sldr = calc_spectral_LDR(header, data)
+    assert isinstance(sldr, np.ndarray)
+    assert sldr.dtype == np.float32
+    assert_array_equal(sldr, calc_spectral_LDR(header, data, chunk_size=3))
+    expected = _calc_spectral_ldr_reference(header, data)
+    assert np.any(expected != -999)
+    sldr64 = calc_spectral_LDR(header, data, dtype=np.float64)
+    assert_allclose(sldr64, expected, rtol=1e-5)
+    is_valid = (sldr != -999) & (expected != -999)
+    assert np.mean(is_valid == (expected != -999)) > 0.99
+    assert_allclose(sldr[is_valid], expected[is_valid], atol=1e-3)
+    tracemalloc.start()
+    calc_spectral_LDR(header, data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < 1.5 * sldr.nbytes
+
+
+def _calc_spectral_ldr_reference(header: dict, data: dict) -> np.ndarray:
+    """Float64 implementation of calc_spectral_LDR before the compiled kernel."""
+    spec_tot = (2 if header["SWVersion"] < 540 else 4) * data["TotSpec"]
+    spec_v = spec_tot - data["HSpec"] - 2 * data["ReVHSpec"]
+    bins_per_chirp = np.diff(np.hstack((header["RngOffs"], header["RAltN"])))
+    n_bins = np.repeat(header["SpecN"], bins_per_chirp)
+    noise_h = (data["HNoisePow"] / n_bins)[:, :, np.newaxis]
+    noise_v = (data["TotNoisePow"] / 2.0 / n_bins)[:, :, np.newaxis]
+    noise_v[noise_v == 0] = 1e-10
+    noise_h[noise_h == 0] = 1e-10
+    snr_mask = (spec_v / noise_v < 1000) | (data["HSpec"] / noise_h < 1000)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rhv = np.abs(data["ReVHSpec"] + 1j * data["ImVHSpec"]) / np.sqrt(
+            (spec_v + noise_v) * (data["HSpec"] + noise_h)
+        )
+        sldr = 10 * np.log10((1 - rhv) / (1 + rhv))
+    sldr[snr_mask | (data["TotSpec"] == 0.0)] = -999
+    return sldr
+
+
+@pytest.mark.parametrize("chunk_size", [3, 256])
+def test_chirp_layout(tmp_path, monkeypatch, chunk_size):
+    monkeypatch.setattr(data_module, "_CHIRP_CHUNK", chunk_size)
+    filename = tmp_path / "file.LV0"
+    write_rpg(filename, level=0, version=3.5, n_samples=7, dual_pol=2)
+    header, padded = read_rpg(filename)
+    _, data = read_rpg(filename, spectra_layout="chirp")
+    assert data.keys() == padded.keys()
+    ranges = np.append(header["RngOffs"], header["RAltN"])
+    for key, array in padded.items():
+        if array.ndim < 3:
+            assert_array_equal(data[key], array)
+            continue
+        assert len(data[key]) == header["SequN"]
+        for ind, (chirp, n_bins) in enumerate(
+            zip(data[key], header["SpecN"], strict=True)
+        ):
+            first_bin = (array.shape[2] - n_bins) // 2
+            chirp_range = slice(ranges[ind], ranges[ind + 1])
+            assert_array_equal(
+                chirp, array[:, chirp_range, first_bin : first_bin + n_bins]
+            )
+    for func in (spectra2moments, spectra2peak_moments, estimate_noise):
+        expected = func(padded, header)
+        for key, array in func(data, header).items():
+            assert_array_equal(array, expected[key])
+    sldr = calc_spectral_LDR(header, padded)
+    sldr_chirps = calc_spectral_LDR(header, data)
+    for ind, chirp in enumerate(data["TotSpec"]):
+        assert sldr_chirps[ind].shape == chirp.shape
+        assert np.all(sldr_chirps[ind][chirp == 0] == -999)
+    assert np.sum(sldr != -999) == sum(np.sum(array != -999) for array in sldr_chirps)
+
+
+def test_rpg2nc_with_chirp_layout(tmp_path):
+    for ind in range(2):
+        write_rpg(
+            tmp_path / f"file{ind}.LV0",
+            level=0,
+            version=3.5,
+            n_samples=5,
+            start_time=START_TIME + 1 + 3600 * ind,
+        )
+    output_file = tmp_path / "output.nc"
+    rpg2nc(f"{tmp_path}/*.LV0", output_file, spectra_layout="chirp")
+    _, data = read_rpg(tmp_path / "file1.LV0", spectra_layout="chirp")
+    with netCDF4.Dataset(output_file) as nc:
+        assert "doppler_spectrum" not in nc.variables
+        for ind, array in enumerate(data["TotSpec"], start=1):
+            var = nc.variables[f"doppler_spectrum_c{ind}"]
+            assert var.dimensions == ("time", f"range_c{ind}", f"spectrum_c{ind}")
+            assert var.shape == (10, *array.shape[1:])
+            assert_array_equal(var[5:], array)
+
+
+def test_read_with_invalid_spectra_layout(tmp_path):
+    filename = tmp_path / "file.LV1"
+    write_rpg(filename)
+    with pytest.raises(ValueError, match="spectra_layout"):
+        read_rpg(filename, spectra_layout="ragged")
+
+
+@pytest.mark.parametrize(("level", "key"), [(0, "TotSpec"), (1, "Ze")])
+@pytest.mark.parametrize("budget", [1, 2**26])
+def test_read_with_time_step(tmp_path, monkeypatch, level, key, budget):
+    monkeypatch.setattr(data_module, "_AVERAGING_BUDGET", budget)
+    filename = tmp_path / "file.LV0"
+    write_rpg(filename, level=level, version=3.5, n_samples=25, dual_pol=1)
+    _, full = read_rpg(filename)
+    _, data = read_rpg(filename, time_step=30)
+    assert data.keys() == full.keys()
+    assert_array_equal(data["Time"] - START_TIME, [0, 30, 60])
+    assert_array_equal(data["MSec"], 0)
+    assert data[key].dtype == np.float32
+    for ind, samples in enumerate((slice(0, 10), slice(10, 20), slice(20, 25))):
+        values = full[key][samples]
+        has_data = values != 0 if level == 1 else np.any(values != 0, axis=2)
+        n_with_data = np.sum(has_data, axis=0)
+        if level == 0:
+            n_with_data = n_with_data[:, np.newaxis]
+        expected = np.sum(values, axis=0, dtype=np.float64) / np.maximum(n_with_data, 1)
+        assert np.allclose(data[key][ind], expected, rtol=1e-6)
+        assert np.isclose(data["LWP"][ind], np.mean(full["LWP"][samples]))
+        assert data["Status"][ind] == full["Status"][samples][0]
+
+
+def test_read_with_invalid_time_step(tmp_path):
+    write_rpg(tmp_path / "file.LV1")
+    with pytest.raises(ValueError, match="time_step"):
+        read_rpg(tmp_path / "file.LV1", time_step=0)
+
+
+@pytest.mark.parametrize("level", [0, 1])
+def test_read_rpg_multi_in_parallel(tmp_path, level):
+    files = [tmp_path / f"file{ind}.LV{level}" for ind in range(3)]
+    for ind, filename in enumerate(files):
+        write_rpg(
+            filename, level=level, version=3.5, seed=ind, start_time=START_TIME + ind
+        )
+    _, expected = read_rpg_multi(files)
+    with Collector() as collector:
+        _, data = read_rpg_multi(files, jobs=3)
+    assert len(collector.records) == 3
+    for key, array in expected.items():
+        assert_array_equal(data[key], array)
+
+
+def test_rpg2nc_with_several_files(tmp_path):
+    for ind in range(2):
+        write_rpg(
+            tmp_path / f"file{ind}.LV0",
+            level=0,
+            version=3.5,
+            seed=ind,
+            start_time=START_TIME + 1 + 3600 * ind,
+        )
+    rpg2nc(tmp_path / "*.LV0", tmp_path / "output.nc")
+    _, data = read_rpg_multi(sorted(tmp_path.glob("*.LV0")))
+    with netCDF4.Dataset(tmp_path / "output.nc") as nc:
+        assert_array_equal(nc.variables["doppler_spectrum"][:], data["TotSpec"])
+
+
+def test_rpg2nc_with_overviews(tmp_path):
+    for ind, n_samples in enumerate((5, 6, 7)):
+        write_rpg(
+            tmp_path / f"file{ind}.LV1",
+            n_samples=n_samples,
+            seed=ind,
+            start_time=START_TIME + 1 + 3600 * ind,
+        )
+    rpg2nc(tmp_path / "*.LV1", tmp_path / "output.nc", overview_levels=3)
+    _, data = read_rpg_multi(sorted(tmp_path.glob("*.LV1")))
+    for factor in (2, 4, 8):
+        expected: dict[str, list] = {"Ze": [], "MeanVel": []}
+        for ind in range(0, len(data["Ze"]), factor):
+            samples = slice(ind, ind + factor)
+            n_with_data = np.maximum(np.sum(data["Ze"][samples] != 0, axis=0), 1)
+            for key, values in expected.items():
+                values.append(np.sum(data[key][samples], axis=0) / n_with_data)
+        with netCDF4.Dataset(tmp_path / f"output_x{factor}.nc") as nc:
+            assert nc.time_decimation == factor
+            assert_array_equal(nc.variables["time"][:], data["Time"][::factor])
+            for key, values in expected.items():
+                variable = nc.variables[METADATA[key].name]
+                assert np.allclose(variable[:].filled(0), values, atol=1e-5)
+            assert "doppler_spectrum" not in nc.variables
+    assert not (tmp_path / "output_x16.nc").exists()
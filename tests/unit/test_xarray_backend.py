@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from rpgpy import read_rpg, rpg2nc
+from rpgpy.instrumentation import Collector
+from rpgpy.synthetic import write_rpg
+
+xr = pytest.importorskip("xarray")
+
+from rpgpy.xarray_backend import RpgBackendEntrypoint  # noqa: E402
+
+
+@pytest.fixture
+def lv0_file(tmp_path):
+    filename = tmp_path / "file.LV0"
+    write_rpg(filename, level=0, version=3.5, n_samples=12, compression=2, dual_pol=2)
+    return filename
+
+
+def test_guess_can_open():
+    backend = RpgBackendEntrypoint()
+    assert backend.guess_can_open("file.LV0")
+    assert backend.guess_can_open("file.lv1")
+    assert not backend.guess_can_open("file.nc")
+
+
+def test_matches_netcdf_output(tmp_path, lv0_file):
+    rpg2nc(lv0_file, tmp_path / "file.nc")
+    ds = xr.open_dataset(lv0_file, engine=RpgBackendEntrypoint)
+    with xr.open_dataset(tmp_path / "file.nc") as ref:
+        for name, variable in ref.variables.items():
+            assert ds[name].dims == variable.dims
+            assert ds[name].dtype == variable.dtype
+            assert ds[name].attrs["long_name"] == variable.attrs["long_name"]
+            assert_array_equal(ds[name].values, variable.values)
+
+
+def test_decodes_only_indexed_samples(lv0_file):
+    _, data = read_rpg(lv0_file)
+    with Collector() as collector:
+        ds = xr.open_dataset(
+            lv0_file, engine=RpgBackendEntrypoint, mask_and_scale=False
+        )
+        assert collector.records == []
+        spectra = ds["doppler_spectrum"].isel(time=[2, 5], range=slice(3, 8)).values
+        assert [record.n_samples for record in collector.records] == [2]
+    assert_array_equal(spectra, data["TotSpec"][[2, 5], 3:8])
+    noise = ds["integrated_noise"][4].values
+    assert_array_equal(noise, data["TotNoisePow"][4])
+
+
+def test_chunks_are_groups_of_samples(lv0_file):
+    pytest.importorskip("dask")
+    ds = xr.open_dataset(
+        lv0_file, engine=RpgBackendEntrypoint, chunks={}, samples_per_chunk=5
+    )
+    assert ds["doppler_spectrum"].chunks[0] == (5, 5, 2)
+    _, data = read_rpg(lv0_file)
+    assert np.allclose(ds["lwp"].values, data["LWP"])